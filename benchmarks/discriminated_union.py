@@ -0,0 +1,77 @@
+"""Resolving a branch of a large discriminated union loaded from the environment.
+
+Compares reading the raw data again to resolve the branch (as
+``discriminate_type()`` without data does) against resolving it from data
+already read, through the loader's precomputed choice table, and shows
+the cost of a full load for a small and a large union.
+
+Run with ``python -m benchmarks.discriminated_union [--branches N]``.
+"""
+
+import argparse
+import operator
+import os
+from functools import reduce
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Discriminator, create_model
+
+from ab_core.dependency.loaders import ObjectLoaderEnvironment
+
+from .timing import measure, report
+
+
+def storage_union(branches: int) -> object:
+    """Build a union of `branches` storage backend models, discriminated by `kind`."""
+    models = [
+        create_model(
+            f"BenchStorage{index}",
+            __base__=BaseModel,
+            kind=(Literal[f"backend_{index}"], f"backend_{index}"),
+            bucket=(str, ...),
+            region=(str, "eu-west-1"),
+        )
+        for index in range(branches)
+    ]
+    return Annotated[reduce(operator.or_, models), Discriminator("kind")]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--branches", type=int, default=60)
+    args = parser.parse_args()
+
+    small = ObjectLoaderEnvironment[storage_union(2)](env_prefix="BENCH_STORAGE")
+    large = ObjectLoaderEnvironment[storage_union(args.branches)](env_prefix="BENCH_STORAGE")
+    last = f"backend_{args.branches - 1}"
+    os.environ.update(
+        {
+            "BENCH_STORAGE_KIND": last,
+            f"BENCH_STORAGE_{last.upper()}_BUCKET": "bench",
+            "BENCH_STORAGE_BUCKET": "bench",
+        }
+    )
+
+    raw = large.load_raw()
+    assert large.discriminate(raw) is large.discriminate_type() is type(large.load())
+
+    report(
+        f"Resolve the branch of a {args.branches}-branch union, per call:",
+        {
+            "read raw data again": measure(large.discriminate_type),
+            "choice table, data read once": measure(lambda: large.discriminate(raw)),
+        },
+    )
+    os.environ["BENCH_STORAGE_KIND"] = "backend_1"
+    report(
+        "Full load, per call:",
+        {
+            "2 branches": measure(small.load),
+            f"{args.branches} branches": measure(large.load),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Import-time budget for ``ab_core.dependency``.
+
+Each statement runs in a fresh interpreter with ``-X importtime``. The
+report shows the cumulative import time and which heavy optional
+dependencies were pulled in; a statement that imports a module it is
+expected to defer fails the run.
+
+Run with ``python -m benchmarks.import_time [--budget-ms N]``.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+# statement -> modules it must not import
+STATEMENTS: dict[str, tuple[str, ...]] = {
+    "import ab_core.dependency": ("fastapi", "attrs", "ab_core.dependency.default"),
+    "from ab_core.dependency import Load": ("fastapi", "attrs", "ab_core.dependency.default"),
+    "from ab_core.dependency import Depends, inject": ("attrs",),
+}
+TRACKED = ("fastapi", "attrs", "pydantic", "ab_core.dependency.default")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def import_profile(statement: str, *, exclude: frozenset[str] = frozenset()) -> tuple[float, set[str]]:
+    """Return the import time (ms) and the modules imported by `statement`.
+
+    Only top-level imports not listed in `exclude` count towards the time,
+    which keeps interpreter startup out of the number.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, module = match.groups()
+        modules.add(module)
+        if not indent and module not in exclude:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def best_import_profile(statement: str, *, exclude: frozenset[str], repeat: int = 5) -> tuple[float, set[str]]:
+    """Return the fastest of several :func:`import_profile` runs."""
+    return min((import_profile(statement, exclude=exclude) for _ in range(repeat)), key=lambda profile: profile[0])
+
+
+def main() -> int:
+    """Profile each statement, print a report and return an exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if an import takes longer than this")
+    args = parser.parse_args()
+
+    # modules imported by interpreter startup alone are excluded from the numbers
+    _, startup_modules = import_profile("pass")
+    exclude = frozenset(startup_modules)
+
+    failures: list[str] = []
+    print("Import time (best of 5, excluding interpreter startup):")
+    for statement, deferred in STATEMENTS.items():
+        total_ms, modules = best_import_profile(statement, exclude=exclude)
+        loaded = [name for name in TRACKED if name in modules]
+        print(f"  {statement:<48} {total_ms:8.1f} ms  loads: {', '.join(loaded) or '-'}")
+
+        eager = [name for name in deferred if name in modules]
+        if eager:
+            failures.append(f"{statement!r} eagerly imports {', '.join(eager)}")
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            failures.append(f"{statement!r} took {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
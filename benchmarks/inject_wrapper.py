@@ -0,0 +1,82 @@
+"""Per-call overhead of ``@inject`` wrappers.
+
+Compares the generic wrapper, which binds arguments with
+``Signature.bind_partial`` and calls ``fn(**bound.arguments)``, against
+the wrapper generated for the function's exact signature, for sync and
+async functions, with the dependency injected and with it passed in.
+
+Run with ``python -m benchmarks.inject_wrapper``.
+"""
+
+import asyncio
+from typing import Annotated
+from unittest.mock import patch
+
+from ab_core.dependency import Depends, inject, injection, sentinel
+
+from .timing import measure, report
+
+
+def provide_port() -> int:
+    """Return a plain value, so only the wrapper is measured."""
+    return 8080
+
+
+def sync_target(
+    host: str,
+    port: Annotated[int, Depends(provide_port)] = sentinel(),  # noqa: B008
+    *,
+    timeout: float = 5.0,
+) -> tuple[str, int, float]:
+    """Sync function with one injected parameter among plain ones."""
+    return host, port, timeout
+
+
+async def async_target(
+    host: str,
+    port: Annotated[int, Depends(provide_port)] = sentinel(),  # noqa: B008
+    *,
+    timeout: float = 5.0,
+) -> tuple[str, int, float]:
+    """Async function with one injected parameter among plain ones."""
+    return host, port, timeout
+
+
+def generic(fn):
+    """Decorate `fn` with the generic wrapper, as before wrappers were generated."""
+    with patch.object(injection, "_generate_wrapper", return_value=None):
+        return inject(fn)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    sync_before, sync_after = generic(sync_target), inject(sync_target)
+    assert sync_before("db") == sync_after("db") == ("db", 8080, 5.0)
+    report(
+        "@inject sync function, per call:",
+        {
+            "generic, injected (before)": measure(lambda: sync_before("db")),
+            "generated, injected (after)": measure(lambda: sync_after("db")),
+            "generic, passed (before)": measure(lambda: sync_before("db", 1)),
+            "generated, passed (after)": measure(lambda: sync_after("db", 1)),
+        },
+    )
+
+    loop = asyncio.new_event_loop()
+    async_before, async_after = generic(async_target), inject(async_target)
+    assert (
+        loop.run_until_complete(async_before("db")) == loop.run_until_complete(async_after("db")) == ("db", 8080, 5.0)
+    )
+    report(
+        "@inject async function, per call:",
+        {
+            "generic, injected (before)": measure(lambda: loop.run_until_complete(async_before("db"))),
+            "generated, injected (after)": measure(lambda: loop.run_until_complete(async_after("db"))),
+            "generic, passed (before)": measure(lambda: loop.run_until_complete(async_before("db", 1))),
+            "generated, passed (after)": measure(lambda: loop.run_until_complete(async_after("db", 1))),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
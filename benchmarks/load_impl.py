@@ -0,0 +1,65 @@
+"""Per-call cost of ``Load`` on a raw type.
+
+Compares building a fresh default loader on every call (the previous
+``_load_impl`` behaviour) against reusing the cached, ready-built loader.
+
+Run with ``python -m benchmarks.load_impl``.
+"""
+
+import os
+
+from pydantic import BaseModel
+
+from ab_core.dependency import Load
+from ab_core.dependency.default import DefaultLoader
+
+from .timing import measure, report
+
+
+class BenchDatabase(BaseModel):
+    """Nested model loaded from the environment."""
+
+    host: str = "localhost"
+    port: int = 5432
+
+
+class BenchConfig(BaseModel):
+    """Target model loaded from the environment."""
+
+    name: str
+    debug: bool = False
+    database: BenchDatabase = BenchDatabase()
+
+
+def fresh_loader() -> BenchConfig:
+    """Build a new loader per call, as before loaders were reused."""
+    return DefaultLoader[BenchConfig]()()
+
+
+def cached_loader() -> BenchConfig:
+    """Go through ``Load``, which reuses the cached loader."""
+    return Load(BenchConfig)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    os.environ.update(
+        {
+            "BENCH_CONFIG_NAME": "bench",
+            "BENCH_CONFIG_DEBUG": "true",
+            "BENCH_CONFIG_DATABASE_HOST": "db",
+        }
+    )
+    assert fresh_loader() == cached_loader()
+
+    report(
+        "Load(raw type), per call:",
+        {
+            "fresh loader (before)": measure(fresh_loader),
+            "cached loader (after)": measure(cached_loader),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Benchmark suite covering the library's hot paths.
+
+Each group sets up its own models and environment, and times a set of
+repeatable scenarios: loading models, building environment trees,
+reshaping indexed lists, upgrading attrs classes, ``@inject`` call
+overhead and FastAPI round trips.
+
+Results can be saved and compared against an earlier run, e.g. the last
+release, failing when a scenario got slower than a threshold::
+
+    python -m benchmarks.suite --save baseline.json      # on the release
+    python -m benchmarks.suite --compare baseline.json   # on the change
+
+Run with ``python -m benchmarks.suite [--filter TEXT] [--save PATH]
+[--compare PATH] [--threshold RATIO]``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Discriminator
+
+from ab_core.dependency import Depends, Load, inject, pydanticize_data, sentinel
+from ab_core.dependency.pydanticize import cached_type_adapter
+from ab_core.dependency.utils import extract_env_tree
+
+from .timing import measure, report
+
+Scenarios = dict[str, Callable[[], object]]
+
+
+# --------------------------------------------------------------------- #
+# Load                                                                  #
+# --------------------------------------------------------------------- #
+class BenchFlat(BaseModel):
+    """A flat model of scalars."""
+
+    name: str
+    port: int = 8080
+    debug: bool = False
+    ratio: float = 0.5
+    region: str = "eu-west-1"
+
+
+class BenchDatabase(BaseModel):
+    """A nested model."""
+
+    host: str
+    port: int = 5432
+
+
+class BenchNested(BaseModel):
+    """A model with nested models."""
+
+    name: str
+    primary: BenchDatabase
+    replica: BenchDatabase
+
+
+class BenchStorageS3(BaseModel):
+    """A branch of the discriminated union."""
+
+    type: Literal["S3"] = "S3"
+    bucket: str
+
+
+class BenchStorageDisk(BaseModel):
+    """A branch of the discriminated union."""
+
+    type: Literal["DISK"] = "DISK"
+    path: str
+
+
+BenchStorage = Annotated[BenchStorageS3 | BenchStorageDisk, Discriminator("type")]
+
+
+def load_scenarios() -> Scenarios:
+    """Load flat, nested and discriminated models from the environment."""
+    os.environ.update(
+        {
+            "BENCH_FLAT_NAME": "bench",
+            "BENCH_FLAT_DEBUG": "true",
+            "BENCH_NESTED_NAME": "bench",
+            "BENCH_NESTED_PRIMARY_HOST": "primary",
+            "BENCH_NESTED_REPLICA_HOST": "replica",
+            "BENCH_STORAGE_TYPE": "S3",
+            "BENCH_STORAGE_S3_BUCKET": "bench",
+        }
+    )
+    return {
+        "flat model": lambda: Load(BenchFlat),
+        "nested model": lambda: Load(BenchNested),
+        "discriminated union": lambda: Load(BenchStorage),
+        "persisted model": lambda: Load(BenchNested, persist=True),
+    }
+
+
+# --------------------------------------------------------------------- #
+# extract_env_tree                                                      #
+# --------------------------------------------------------------------- #
+def env_tree_scenarios(size: int = 10_000) -> Scenarios:
+    """Build nested trees from a large environment."""
+    matching = {f"BENCH_APP_SECTION{index % 100}_KEY{index}": str(index) for index in range(size)}
+    mostly_other = {f"OTHER_SECTION{index % 100}_KEY{index}": str(index) for index in range(size - size // 10)}
+    mostly_other.update(list(matching.items())[: size // 10])
+    return {
+        f"{size // 1000}k keys, all matching": lambda: extract_env_tree(matching, "BENCH_APP"),
+        f"{size // 1000}k keys, 10% matching": lambda: extract_env_tree(mostly_other, "BENCH_APP"),
+    }
+
+
+# --------------------------------------------------------------------- #
+# pydanticize_data                                                      #
+# --------------------------------------------------------------------- #
+class BenchItem(BaseModel):
+    """An item of an indexed list."""
+
+    name: str
+    storage: BenchStorage
+
+
+class BenchInventory(BaseModel):
+    """A model holding an indexed list."""
+
+    items: list[BenchItem]
+
+
+def pydanticize_scenarios(size: int = 100) -> Scenarios:
+    """Reshape indexed lists, as read from ``ITEMS_<index>_...`` variables."""
+    core_schema = cached_type_adapter(BenchInventory).core_schema
+    indexed = {
+        "items": {
+            str(index): {"name": f"item-{index}", "storage": {"type": "S3", "s3": {"bucket": f"bucket-{index}"}}}
+            for index in range(size)
+        }
+    }
+    return {f"indexed list of {size}": lambda: pydanticize_data(indexed, core_schema, inplace=False)}
+
+
+# --------------------------------------------------------------------- #
+# AttrsPlugin.upgrade                                                   #
+# --------------------------------------------------------------------- #
+def attrs_scenarios(fields: int = 20) -> Scenarios:
+    """Upgrade attrs classes shaped like generated API clients and models."""
+    try:
+        import attrs
+
+        from ab_core.dependency.pydanticize.cast.adaptors.attrs import AttrsPlugin
+    except ModuleNotFoundError:
+        print("Skipping AttrsPlugin.upgrade: attrs is not installed", file=sys.stderr)
+        return {}
+
+    @attrs.define
+    class GeneratedClient:
+        base_url: str
+        token: str
+        timeout: float = 5.0
+        verify_ssl: bool = True
+        headers: dict[str, str] = attrs.field(factory=dict)
+
+    GeneratedModel = attrs.make_class(
+        "GeneratedModel",
+        {f"field_{index}": attrs.field(type=str | None, default=None) for index in range(fields)},
+    )
+
+    plugin = AttrsPlugin()
+    return {
+        "client": lambda: plugin.upgrade(GeneratedClient),
+        f"model of {fields} fields": lambda: plugin.upgrade(GeneratedModel),
+    }
+
+
+# --------------------------------------------------------------------- #
+# @inject                                                               #
+# --------------------------------------------------------------------- #
+def inject_scenarios() -> Scenarios:
+    """Call functions and classes with injected dependencies."""
+    load_scenarios()  # environment for the models
+
+    def provide_session():
+        yield "session"
+
+    @inject
+    def sync_target(
+        config: Annotated[BenchFlat, Depends(BenchFlat, persist=True)] = sentinel(),  # noqa: B008
+        database: Annotated[BenchNested, Depends(BenchNested)] = sentinel(),  # noqa: B008
+    ) -> int:
+        return config.port + database.primary.port
+
+    @inject
+    async def async_target(
+        config: Annotated[BenchFlat, Depends(BenchFlat, persist=True)] = sentinel(),  # noqa: B008
+        database: Annotated[BenchNested, Depends(BenchNested)] = sentinel(),  # noqa: B008
+    ) -> int:
+        return config.port + database.primary.port
+
+    @inject
+    def generator_target(session: Annotated[str, Depends(provide_session)] = sentinel()) -> str:  # noqa: B008
+        return session
+
+    @inject
+    class ClassTarget:
+        config: Annotated[BenchFlat, Depends(BenchFlat, persist=True)]
+        database: Annotated[BenchNested, Depends(BenchNested)]
+
+    loop = asyncio.new_event_loop()
+    return {
+        "sync function": sync_target,
+        "async function": lambda: loop.run_until_complete(async_target()),
+        "generator dependency": generator_target,
+        "class": ClassTarget,
+    }
+
+
+# --------------------------------------------------------------------- #
+# FastAPI                                                               #
+# --------------------------------------------------------------------- #
+def fastapi_scenarios() -> Scenarios:
+    """Round-trip requests through a FastAPI TestClient."""
+    try:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+    except ModuleNotFoundError:
+        print("Skipping FastAPI: fastapi is not installed", file=sys.stderr)
+        return {}
+
+    load_scenarios()  # environment for the models
+    app = FastAPI()
+
+    @app.get("/plain")
+    def plain() -> dict[str, int]:
+        return {"port": 8080}
+
+    @app.get("/depends")
+    def depends(config: Annotated[BenchFlat, Depends(BenchFlat, persist=True)]) -> dict[str, int]:
+        return {"port": config.port}
+
+    client = TestClient(app)
+    return {
+        "without Depends": lambda: client.get("/plain"),
+        "with Depends": lambda: client.get("/depends"),
+    }
+
+
+GROUPS: dict[str, Callable[[], Scenarios]] = {
+    "Load": load_scenarios,
+    "extract_env_tree": env_tree_scenarios,
+    "pydanticize_data": pydanticize_scenarios,
+    "AttrsPlugin.upgrade": attrs_scenarios,
+    "@inject": inject_scenarios,
+    "FastAPI TestClient": fastapi_scenarios,
+}
+
+
+def run(name_filter: str = "") -> dict[str, float]:
+    """Run the scenarios whose ``group/name`` contains `name_filter`, printing each group."""
+    results: dict[str, float] = {}
+    for group, setup in GROUPS.items():
+        scenarios = {name: func for name, func in setup().items() if name_filter in f"{group}/{name}"}
+        if not scenarios:
+            continue
+        for func in scenarios.values():
+            func()  # warm caches, so the first timing is not an outlier
+        timings = {name: measure(func) for name, func in scenarios.items()}
+        report(f"{group}, per call:", timings)
+        results.update({f"{group}/{name}": seconds for name, seconds in timings.items()})
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Print each scenario's time relative to `baseline`, returning those slower than `threshold`."""
+    print("Compared with the baseline:")
+    regressions = []
+    width = max(map(len, results), default=0)
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        ratio = seconds / baseline[name]
+        slower = ratio > threshold
+        print(f"  {name:<{width}}  {ratio:5.2f}x the time{'  <- slower' if slower else ''}")
+        if slower:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, optionally saving or comparing the results."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filter", default="", help="only run scenarios whose group/name contains this")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with results saved by an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = run(args.filter)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            sys.exit(f"{len(regressions)} scenario(s) slower than {args.threshold}x the baseline")
+
+
+if __name__ == "__main__":
+    main()
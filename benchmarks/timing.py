@@ -0,0 +1,21 @@
+"""Shared timing helpers for the standalone benchmark scripts."""
+
+import timeit
+from collections.abc import Callable
+
+
+def measure(func: Callable[[], object], *, number: int | None = None, repeat: int = 5) -> float:
+    """Return the best observed time per call, in seconds."""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(title: str, results: dict[str, float]) -> None:
+    """Print per-call timings in microseconds, relative to the first entry."""
+    print(title)
+    baseline = next(iter(results.values()))
+    width = max(map(len, results))
+    for name, seconds in results.items():
+        print(f"  {name:<{width}}  {seconds * 1e6:10.2f} us/call  ({baseline / seconds:5.1f}x)")
@@ -0,0 +1,96 @@
+"""Python versus JSON-bytes validation of environment-sourced payloads.
+
+Loads a wide model (hundreds of scalar fields) and a deep model (nested
+models and lists) from the environment, validating the reshaped data
+either as Python objects (``ValidationMode.PYTHON``, the default) or
+serialized to JSON bytes and validated by ``validate_json``
+(``ValidationMode.JSON``).
+
+Run with ``python -m benchmarks.validation_mode``.
+"""
+
+import os
+
+from pydantic import BaseModel, create_model
+
+from ab_core.dependency.loaders import ObjectLoaderEnvironment
+from ab_core.dependency.schema import ValidationMode
+
+from .timing import measure, report
+
+
+class BenchLeaf(BaseModel):
+    """Innermost model of the deep config."""
+
+    name: str = ""
+    port: int = 0
+    ratio: float = 0.0
+
+
+def wide_model(ints: int = 200, strings: int = 100, flags: int = 50) -> type[BaseModel]:
+    """Build a flat model with many scalar fields."""
+    fields: dict[str, tuple[type, object]] = {}
+    fields.update({f"int{index}": (int, 0) for index in range(ints)})
+    fields.update({f"str{index}": (str, "") for index in range(strings)})
+    fields.update({f"flag{index}": (bool, False) for index in range(flags)})
+    return create_model("BenchWide", **fields)  # type: ignore[call-overload]
+
+
+def deep_model(depth: int = 6) -> type[BaseModel]:
+    """Build a model nesting `depth` levels, each with scalars and a list of leaves."""
+    model: type[BaseModel] = BenchLeaf
+    for level in range(depth):
+        model = create_model(
+            f"BenchLevel{level}",
+            count=(int, 0),
+            label=(str, ""),
+            child=(model | None, None),
+            leaves=(list[BenchLeaf], []),
+        )
+    return create_model("BenchDeep", root=(model, ...))
+
+
+def wide_environ(prefix: str, ints: int = 200, strings: int = 100, flags: int = 50) -> dict[str, str]:
+    """Environment variables setting every field of the wide model."""
+    environ = {f"{prefix}_INT{index}": str(index) for index in range(ints)}
+    environ.update({f"{prefix}_STR{index}": f"value-{index}" for index in range(strings)})
+    environ.update({f"{prefix}_FLAG{index}": "true" for index in range(flags)})
+    return environ
+
+
+def deep_environ(prefix: str, depth: int = 6) -> dict[str, str]:
+    """Environment variables setting every level of the deep model."""
+    environ = {}
+    path = f"{prefix}_ROOT"
+    for _ in range(depth):
+        environ[f"{path}_COUNT"] = "3"
+        environ[f"{path}_LABEL"] = "level"
+        for index in range(3):
+            environ[f"{path}_LEAVES_{index}_NAME"] = f"leaf-{index}"
+            environ[f"{path}_LEAVES_{index}_PORT"] = "8080"
+            environ[f"{path}_LEAVES_{index}_RATIO"] = "0.5"
+        path = f"{path}_CHILD"
+    return environ
+
+
+def compare(title: str, model: type[BaseModel], prefix: str) -> None:
+    """Report the load time of `model` in each validation mode."""
+    loaders = {
+        mode: ObjectLoaderEnvironment[model](env_prefix=prefix, validation_mode=mode)  # type: ignore[valid-type]
+        for mode in ValidationMode
+    }
+    assert loaders[ValidationMode.PYTHON].load() == loaders[ValidationMode.JSON].load()
+    report(title, {f"{mode.lower()} validation": measure(loader.load) for mode, loader in loaders.items()})
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    os.environ.update(wide_environ("BENCH_WIDE"))
+    os.environ.update(deep_environ("BENCH_DEEP"))
+
+    compare("Wide model (350 fields), per load:", wide_model(), "BENCH_WIDE")
+    compare("Deep model (6 levels), per load:", deep_model(), "BENCH_DEEP")
+
+
+if __name__ == "__main__":
+    main()
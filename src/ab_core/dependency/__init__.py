@@ -1,22 +1,84 @@
-from .depends import Depends, Load
-from .injection import inject
-from .pydanticize import (
-    cached_type_adapter,
-    is_supported_by_pydantic,
-    pydanticize_data,
-    pydanticize_object,
-    pydanticize_type,
-)
+"""Dependency loading and injection.
+
+Public names are imported on first access, so importing the package does
+not pull in the loaders, FastAPI or attrs until they are used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# imported eagerly: it is tiny, and the submodule shares the function's name
 from .sentinel import sentinel
 
+if TYPE_CHECKING:
+    from .depends import Depends, Load, LoadMany, aLoad
+    from .fork import warm_up
+    from .graph import dependency_graph
+    from .hooks import ResolveHook, add_hook, remove_hook
+    from .injection import inject
+    from .pydanticize import (
+        cached_type_adapter,
+        is_supported_by_pydantic,
+        pydanticize_data,
+        pydanticize_object,
+        pydanticize_type,
+    )
+    from .reload import reload
+    from .stats import cache_stats, reset_cache_stats
+
+_LAZY_EXPORTS = {
+    "Depends": ".depends",
+    "Load": ".depends",
+    "LoadMany": ".depends",
+    "aLoad": ".depends",
+    "inject": ".injection",
+    "reload": ".reload",
+    "warm_up": ".fork",
+    "dependency_graph": ".graph",
+    "add_hook": ".hooks",
+    "remove_hook": ".hooks",
+    "ResolveHook": ".hooks",
+    "cache_stats": ".stats",
+    "reset_cache_stats": ".stats",
+    "pydanticize_data": ".pydanticize",
+    "pydanticize_type": ".pydanticize",
+    "pydanticize_object": ".pydanticize",
+    "cached_type_adapter": ".pydanticize",
+    "is_supported_by_pydantic": ".pydanticize",
+}
+
 __all__ = [
-    Depends,
-    Load,
-    inject,
-    sentinel,
-    pydanticize_data,
-    pydanticize_type,
-    pydanticize_object,
-    cached_type_adapter,
-    is_supported_by_pydantic,
+    "Depends",
+    "Load",
+    "LoadMany",
+    "aLoad",
+    "inject",
+    "reload",
+    "warm_up",
+    "dependency_graph",
+    "add_hook",
+    "remove_hook",
+    "ResolveHook",
+    "cache_stats",
+    "reset_cache_stats",
+    "sentinel",
+    "pydanticize_data",
+    "pydanticize_type",
+    "pydanticize_object",
+    "cached_type_adapter",
+    "is_supported_by_pydantic",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access, caching them on the package."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -1,11 +1,29 @@
-"""Default dependency loader selection."""
+"""Default dependency loader selection.
+
+``DefaultLoader`` is resolved on first access rather than at import, since
+selecting it builds a type adapter for the whole ``Loader`` union and reads
+the ``LOADER_*`` environment variables.
+"""
+
+from typing import Any
 
-from .loaders import Loader, ObjectLoaderEnvironment
 from .schema.loader_type import LoaderSource
 
-# use the loader to determine the default loader
-DefaultLoader = ObjectLoaderEnvironment[Loader](
-    # default loader is environment loader, unless configured
-    # to something else in the environment
-    default_discriminator_value=LoaderSource.ENVIRONMENT_OBJECT,
-).discriminate_type()
+
+def _select_default_loader() -> Any:
+    from .loaders import Loader, ObjectLoaderEnvironment
+
+    # use the loader to determine the default loader
+    return ObjectLoaderEnvironment[Loader](
+        # default loader is environment loader, unless configured
+        # to something else in the environment
+        default_discriminator_value=LoaderSource.ENVIRONMENT_OBJECT,
+    ).discriminate_type()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``DefaultLoader`` lazily, caching it on the module."""
+    if name == "DefaultLoader":
+        globals()[name] = default_loader = _select_default_loader()
+        return default_loader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
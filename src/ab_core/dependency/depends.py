@@ -17,19 +17,26 @@ Supports three kinds of *load targets*:
     * coroutine -> coroutine object (caller awaits)
     * plain function -> return value
 
-There are two public entry points:
+There are three public entry points:
 
 * :func:`Load` - synchronous facade (blocks if passed an awaitable)
 * :func:`aLoad` - asynchronous facade (always ``await``-safe)
+* :func:`LoadMany` - synchronous facade loading several targets from a
+  single environment snapshot
 
-Both share a single private implementation, so maintenance cost is low.
+All share a single private implementation, so maintenance cost is low.
 """
 
-from collections.abc import Awaitable
-from typing import TypeVar
+from collections.abc import Awaitable, Callable
+from functools import cache, cached_property, partial
+from inspect import isawaitable, iscoroutinefunction
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
-from .loaders.base import LoaderBase
+from . import hooks
+from .environ import ENVIRON_INDEX, EnvironSnapshot
+from .loaders.base import AsyncLoaderBase, LoaderBase
 from .singleton import SingletonRegistry
+from .stats import counted_cache
 from .types import LoadTarget
 from .utils import is_real_callable
 
@@ -41,50 +48,162 @@ class NullDepends:
         """Store constructor compatibility with FastAPI Depends."""
 
 
-# ------------------------------------------------------------------ #
-# Optional FastAPI integration
-# ------------------------------------------------------------------ #
-try:
-    from fastapi.params import Depends as _FastapiDepends
-except ModuleNotFoundError:  # running without FastAPI
-    _FastapiDepends = NullDepends  # type: ignore[assignment,misc]
-
 T = TypeVar("T")
 Ret = T | Awaitable[T]
 
+# upper bound on the number of raw types with a ready-built default loader
+DEFAULT_LOADER_CACHE_SIZE = 512
+
+
+def _build_default_loader(load_target: Any) -> LoaderBase | None:
+    """Build the default loader for a raw type, or ``None`` if unsupported.
+
+    The loader's type, type adaptor and core schema are resolved up front, so
+    each call only pays for :meth:`LoaderBase.load`.
+    """
+    from .default import DefaultLoader  # local import to avoid cycle
+
+    if not DefaultLoader.supports(load_target):
+        return None
+    loader = DefaultLoader[load_target]()
+    loader.core_schema  # noqa: B018  (resolve cached properties eagerly)
+    return loader
+
+
+_cached_default_loader = counted_cache("default_loaders", maxsize=DEFAULT_LOADER_CACHE_SIZE)(_build_default_loader)
+
+
+def default_loader_for(load_target: Any) -> LoaderBase | None:
+    """Return a ready default loader for a raw type, or ``None`` if unsupported.
+
+    Loaders are reused across calls, bounded by ``DEFAULT_LOADER_CACHE_SIZE``.
+    """
+    try:
+        hash(load_target)
+    except TypeError:  # e.g. Annotated metadata without __hash__, cannot be cached
+        return _build_default_loader(load_target)
+    return _cached_default_loader(load_target)
+
+
 # --------------------------------------------------------------------- #
 # Core implementation (sync; never awaits)                              #
 # --------------------------------------------------------------------- #
 
 
-def _load_impl[T](load_target: LoadTarget[T], *, persist: bool) -> T:  # noqa: C901
-    """Return either *T* or an *Awaitable[T]* depending on target nature."""
-    from .default import DefaultLoader  # local import to avoid cycle
+def _loader_call[T](loader: LoaderBase[T], environ: EnvironSnapshot | None) -> LoaderBase[T] | partial[T]:
+    """Return a callable loading with `loader`, from `environ` when given."""
+    return loader if environ is None else partial(loader.load, environ)
+
+
+class ResolvedTarget[T](NamedTuple):
+    """A load target resolved to what loads it."""
 
+    # zero-argument callable loading the target
+    call: Callable[[], T]
+    # key of the instance persisted for the target
+    key: Any
+    loader: LoaderBase[T] | None
+
+
+def _resolve_target[T](
+    load_target: LoadTarget[T],
+    environ: EnvironSnapshot | None = None,
+) -> ResolvedTarget[T]:
+    """Return a zero-argument callable loading the target, its persistence key and its loader, if any."""
     # --- 1. Callable ------------------------------------------------- #
     if is_real_callable(load_target):
-        if persist:
-            return SingletonRegistry(load_target, key=load_target)  # cache by the function instance
-        return load_target()  # plain function
+        return ResolvedTarget(load_target, load_target, None)  # cache by the function instance
 
     # --- 2. Loader instance ----------------------------------------- #
     elif isinstance(load_target, LoaderBase):
-        if persist:
-            return SingletonRegistry(load_target, key=load_target.type)  # cache by the type
-        return load_target()
+        return ResolvedTarget(_loader_call(load_target, environ), load_target.type, load_target)  # cache by the type
 
     # --- 3. Raw type ------------------------------------------------- #
-    elif DefaultLoader.supports(load_target):
-        loader = DefaultLoader[load_target]()
-        if persist:
-            return SingletonRegistry(loader, key=load_target)  # cache by the type
-        return loader()
+    elif (loader := default_loader_for(load_target)) is not None:
+        return ResolvedTarget(_loader_call(loader, environ), load_target, loader)  # cache by the type
 
     raise TypeError(
         f"Unsupported load_target type: {type(load_target).__name__}. Expected LoaderBase instance, class, or callable."
     )
 
 
+def _load_impl[T](
+    load_target: LoadTarget[T],
+    *,
+    persist: bool,
+    environ: EnvironSnapshot | None = None,
+) -> T:
+    """Return either *T* or an *Awaitable[T]* depending on target nature.
+
+    Loaders read environment variables from `environ` when given, rather
+    than from the current environment.
+    """
+    return _load_resolved(load_target, _resolve_target(load_target, environ), persist=persist, environ=environ)
+
+
+def _load_resolved[T](
+    load_target: LoadTarget[T],
+    resolved: ResolvedTarget[T],
+    *,
+    persist: bool,
+    environ: EnvironSnapshot | None = None,
+) -> T:
+    """Load a target already resolved by :func:`_resolve_target`, as :func:`_load_impl` does."""
+    call, key, loader = resolved
+    if hooks._registered:
+        return _load_traced(load_target, call, key, loader, persist=persist, environ=environ)
+    if persist:
+        if loader is not None and not isinstance(loader, AsyncLoaderBase):
+            # keeps the raw data, so the instance can be reloaded
+            return SingletonRegistry.load(loader, key=key, environ=environ)
+        # async loaders and functions return an awaitable caching the awaited value, never the awaitable itself
+        return SingletonRegistry.call_async(call, key=key)
+    return call()
+
+
+def _load_traced[T](
+    load_target: LoadTarget[T],
+    call: Callable[[], T],
+    key: Any,
+    loader: LoaderBase[T] | None,
+    *,
+    persist: bool,
+    environ: EnvironSnapshot | None,
+) -> T:
+    """Load as :func:`_load_impl` does, reporting the resolve to the registered hooks."""
+    if not persist:
+        return hooks.trace(call, load_target)
+    cached = key in SingletonRegistry
+    if loader is not None and not isinstance(loader, AsyncLoaderBase):
+        call = partial(SingletonRegistry.load, loader, key=key, environ=environ)
+    else:
+        call = partial(SingletonRegistry.call_async, call, key=key)
+    return hooks.trace(call, load_target, persist=True, cached=cached)
+
+
+def _aload_start[T](load_target: LoadTarget[T], *, persist: bool) -> Ret[T]:
+    """Start loading for an async context, returning *T* or an *Awaitable[T]*.
+
+    Unlike :func:`_load_impl`, persisted awaitables are cached by their
+    awaited value, so they can be resolved more than once.
+    """
+    return _aload_resolved(load_target, _resolve_target(load_target), persist=persist)
+
+
+def _aload_resolved[T](load_target: LoadTarget[T], resolved: ResolvedTarget[T], *, persist: bool) -> Ret[T]:
+    """Start loading a target already resolved by :func:`_resolve_target`, as :func:`_aload_start` does."""
+    call, key, _ = resolved
+    if hooks._registered:
+        if not persist:
+            return hooks.trace(call, load_target)
+        cached = key in SingletonRegistry
+        call = partial(SingletonRegistry.call_async, call, key=key)
+        return hooks.trace(call, load_target, persist=True, cached=cached)
+    if persist:
+        return SingletonRegistry.call_async(call, key=key)
+    return call()
+
+
 def Load[T](load_target: LoadTarget[T], *, persist: bool = False) -> T:  # type: ignore[override]  # noqa: D401
     """Load **synchronously**.
 
@@ -94,13 +213,50 @@ def Load[T](load_target: LoadTarget[T], *, persist: bool = False) -> T:  # type:
     return _load_impl(load_target, persist=persist)
 
 
-class Depends[T](_FastapiDepends):
-    """Factory for dependency-injection annotations.
+async def aLoad[T](load_target: LoadTarget[T], *, persist: bool = False) -> T:  # noqa: D401, N802
+    """Load **asynchronously**.
+
+    Async functions and :class:`AsyncLoaderBase` loaders are awaited, so the
+    event loop is not blocked while they load; other targets are loaded as
+    with :func:`Load`. With ``persist=True`` the awaited value is cached.
+    """
+    value = _aload_start(load_target, persist=persist)
+    if isawaitable(value):
+        return await value
+    return value
+
+
+def LoadMany(*load_targets: "LoadTarget[Any] | DependsBase[Any]", persist: bool = False) -> tuple[Any, ...]:
+    """Load several targets **synchronously** from one environment snapshot.
+
+    The environment is read once, and each environment-backed target only
+    looks up the keys under its own prefix. A :class:`Depends` may be given
+    in place of a target to choose ``persist`` for it; other targets use
+    `persist`. Results are returned in the order of the targets.
 
     Example::
 
-        def provide_db() -> DB: ...
-        user: Annotated[DB, Depends(provide_db)]
+        config, port = LoadMany(
+            AppConfig,
+            Depends(LoaderEnvironment[int](key="PORT"), persist=True),
+        )
+    """
+    environ = ENVIRON_INDEX.current()
+    results = []
+    for load_target in load_targets:
+        if isinstance(load_target, DependsBase):
+            results.append(_load_impl(load_target.load_target, persist=load_target.persist, environ=environ))
+        else:
+            results.append(_load_impl(load_target, persist=persist, environ=environ))
+    return tuple(results)
+
+
+class DependsBase[T]:
+    """Dependency-injection annotation resolving a load target.
+
+    This holds the behaviour of :class:`Depends`, which combines it with
+    FastAPI's ``Depends`` when FastAPI is installed. Use it for
+    ``isinstance`` checks that should not trigger importing FastAPI.
     """
 
     def __init__(
@@ -110,14 +266,72 @@ class Depends[T](_FastapiDepends):
         persist: bool = False,
     ) -> None:
         """Create a dependency wrapper for a target loader or callable."""
-        super().__init__(dependency=self.__call__, use_cache=persist)  # type: ignore[misc]
+        is_async = isinstance(type_or_loader, AsyncLoaderBase) or iscoroutinefunction(type_or_loader)
+        dependency = self._call_awaited if is_async else self.__call__
+        super().__init__(dependency=dependency, use_cache=persist)  # type: ignore[call-arg]
 
         self.load_target = type_or_loader
         self.persist = persist
 
     # The provider is designed to be called *by* the DI system, not by
-    # user code. It uses the synchronous facade because FastAPI will
-    # `await` if it receives a coroutine.
+    # user code. FastAPI is given this synchronous facade, or
+    # `_call_awaited` for async targets, as it only awaits `async def`
+    # dependencies.
     def __call__(self) -> T:  # noqa: D401
         """Resolve the wrapped dependency target."""
-        return Load(self.load_target, persist=self.persist)
+        return _load_resolved(self.load_target, self.resolved, persist=self.persist)
+
+    def call_async(self) -> Ret[T]:
+        """Resolve the wrapped dependency target for an async context.
+
+        Returns the value, or an awaitable for it; see :func:`aLoad`.
+        """
+        return _aload_resolved(self.load_target, self.resolved, persist=self.persist)
+
+    async def _call_awaited(self) -> T:
+        """Resolve an async target, for FastAPI, which only awaits dependencies declared ``async def``."""
+        value = self.call_async()
+        if isawaitable(value):
+            return await value
+        return value
+
+    @cached_property
+    def resolved(self) -> ResolvedTarget[T]:
+        """The target resolved on first use, e.g. to the default loader of a raw type."""
+        return _resolve_target(self.load_target)
+
+
+# ------------------------------------------------------------------ #
+# Optional FastAPI integration
+# ------------------------------------------------------------------ #
+@cache
+def _create_depends() -> type[DependsBase]:
+    """Create :class:`Depends`, importing FastAPI only now, on first use."""
+    try:
+        from fastapi.params import Depends as _FastapiDepends
+    except ModuleNotFoundError:  # running without FastAPI
+        _FastapiDepends = NullDepends  # type: ignore[assignment,misc]
+
+    class Depends[T](DependsBase[T], _FastapiDepends):
+        """Factory for dependency-injection annotations.
+
+        Example::
+
+            def provide_db() -> DB: ...
+            user: Annotated[DB, Depends(provide_db)]
+        """
+
+    Depends.__qualname__ = "Depends"
+    return Depends
+
+
+if TYPE_CHECKING:
+    Depends = DependsBase
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``Depends`` lazily, so importing this module skips FastAPI."""
+    if name == "Depends":
+        globals()[name] = depends = _create_depends()
+        return depends
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
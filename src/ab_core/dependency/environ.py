@@ -0,0 +1,148 @@
+"""Indexed, change-aware snapshot of the process environment.
+
+Reading ``os.environ`` key by key goes through its encode/decode layer,
+and scanning it for a prefix touches every variable. The index instead
+keeps a plain-dict snapshot with a sorted key array, so prefix lookups
+are a binary search over only the matching keys.
+
+The snapshot is rebuilt only when the environment changes. Changes are
+tracked with a version counter bumped by ``os.putenv``/``os.unsetenv``,
+which every ``os.environ`` mutation goes through.
+"""
+
+import os
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from functools import wraps
+from typing import Any, NamedTuple
+
+_version = 0
+_hooks_installed = False
+
+
+def environ_version() -> int:
+    """Return a counter that changes whenever the environment is modified."""
+    return _version
+
+
+def _track_changes(func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def tracked(*args, **kwargs):
+        global _version
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _version += 1
+
+    tracked.__environ_tracked__ = True  # type: ignore[attr-defined]
+    return tracked
+
+
+def _install_hooks() -> None:
+    """Wrap ``os.putenv``/``os.unsetenv`` so environment changes bump the version."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    for name in ("putenv", "unsetenv"):
+        func = getattr(os, name, None)
+        if func is not None and not getattr(func, "__environ_tracked__", False):
+            setattr(os, name, _track_changes(func))
+    _hooks_installed = True
+
+
+class EnvironSnapshot(NamedTuple):
+    """A read-only view of the environment at one version."""
+
+    environ: Mapping[str, str] | None
+    version: int
+    size: int
+    data: dict[str, str]
+    keys: list[str]
+    prefixes: dict[str, dict[str, str]]
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Return the value of an environment variable."""
+        return self.data.get(key, default)
+
+    def with_prefix(self, prefix: str) -> Mapping[str, str]:
+        """Return the variables whose names start with `prefix` (do not mutate).
+
+        Results are memoised per prefix for the lifetime of the snapshot.
+        """
+        matched = self.prefixes.get(prefix)
+        if matched is None:
+            keys = self.keys
+            start = bisect_left(keys, prefix)
+            stop = bisect_left(keys, prefix[:-1] + chr(ord(prefix[-1]) + 1)) if prefix else len(keys)
+            matched = {key: self.data[key] for key in keys[start:stop]}
+            self.prefixes[prefix] = matched
+        return matched
+
+
+_EMPTY = EnvironSnapshot(environ=None, version=-1, size=-1, data={}, keys=[], prefixes={})
+
+
+class EnvironIndex:
+    """A sorted snapshot of ``os.environ``, rebuilt only when it changes.
+
+    If ``os.environ`` has been replaced by something other than the
+    standard mapping (e.g. a test double), changes cannot be tracked and
+    the snapshot is rebuilt on every access instead.
+    """
+
+    def __init__(self):
+        """Start with an empty snapshot, built on first access."""
+        self._snapshot = _EMPTY
+
+    @property
+    def version(self) -> int:
+        """The environment version the current snapshot was taken at."""
+        return self.current().version
+
+    def current(self) -> EnvironSnapshot:
+        """Return a snapshot of the current environment, rebuilding it if it changed."""
+        environ = os.environ
+        snapshot = self._snapshot
+        if not isinstance(environ, os._Environ):
+            return self._rebuild(environ, -1)
+
+        _install_hooks()
+        if snapshot.environ is environ and snapshot.version == _version and snapshot.size == len(environ):
+            return snapshot
+        return self._rebuild(environ, _version)
+
+    def _rebuild(self, environ: Mapping[str, str], version: int) -> EnvironSnapshot:
+        data = dict(environ)
+        snapshot = EnvironSnapshot(
+            environ=environ,
+            version=version,
+            size=len(data),
+            data=data,
+            keys=sorted(data),
+            prefixes={},
+        )
+        # swapped in as a whole, so concurrent readers never see a partial rebuild
+        self._snapshot = snapshot
+        return snapshot
+
+    def refresh(self) -> None:
+        """Rebuild the snapshot if the environment changed since it was taken."""
+        self.current()
+
+    def snapshot(self) -> Mapping[str, str]:
+        """Return the current environment as a plain dict (do not mutate)."""
+        return self.current().data
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Return the value of an environment variable."""
+        return self.current().get(key, default)
+
+    def with_prefix(self, prefix: str) -> Mapping[str, str]:
+        """Return the variables whose names start with `prefix` (do not mutate).
+
+        Results are memoised per prefix until the environment changes.
+        """
+        return self.current().with_prefix(prefix)
+
+
+ENVIRON_INDEX = EnvironIndex()
@@ -0,0 +1,236 @@
+"""Change-aware cache of parsed files.
+
+File-backed loaders parse the same files on every load, e.g. a config
+file or secrets mounted into a container. The cache keeps each parsed file keyed by
+its path and parser, and reuses it for as long as the file's inode,
+modification time and size are unchanged, so an unchanged file costs a
+single ``stat`` call per load.
+
+Parsed values are shared between callers and must not be mutated.
+"""
+
+import os
+import threading
+import tomllib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic_core import from_json
+
+from .schema.file_format import FileFormat
+
+Parser = Callable[[bytes], Any]
+
+
+def file_stamp(st: os.stat_result) -> tuple[int, int, int]:
+    """Return what identifies a version of a file: its inode, modification time and size."""
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def read_file_bytes(path: str | os.PathLike[str]) -> tuple[tuple[int, int, int], bytes]:
+    """Read a file, returning its change stamp and contents.
+
+    The stamp is taken from the open file, so it always matches the
+    contents even if the file is replaced concurrently.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # a single read of the whole file; the parsers need it as one `bytes` object anyway
+        return file_stamp(st), f.read()
+
+
+class _CachedFile(NamedTuple):
+    stamp: tuple[int, int, int]
+    value: Any
+
+
+class _CachedListing(NamedTuple):
+    stamps: list[tuple[str, tuple[int, int]]]
+    files: dict[tuple[str, ...], str]
+
+
+class FileCache:
+    """Parsed files and directory listings, reused until they change on disk."""
+
+    def __init__(self):
+        """Start with an empty cache."""
+        self._files: dict[tuple[str, Parser], _CachedFile] = {}
+        self._listings: dict[str, _CachedListing] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str | os.PathLike[str], parse: Parser) -> Any:
+        """Return `path` parsed by `parse`, parsing it again only if the file changed.
+
+        Raises ``OSError`` if the file cannot be read.
+        """
+        key = (os.fspath(path), parse)
+        cached = self._files.get(key)
+        if cached is not None and cached.stamp == file_stamp(os.stat(key[0])):
+            return cached.value
+
+        stamp, data = read_file_bytes(key[0])
+        value = parse(data)
+        with self._lock:
+            self._files[key] = _CachedFile(stamp, value)
+        return value
+
+    def scan(self, directory: str | os.PathLike[str]) -> dict[tuple[str, ...], str]:
+        """Return the files under `directory`, keyed by their path parts relative to it.
+
+        Hidden entries (starting with ``.``) are skipped. The listing is
+        rescanned only when one of the directories changes, so an unchanged
+        tree costs one ``stat`` call per directory. Raises ``OSError`` if
+        `directory` cannot be read.
+        """
+        directory = os.fspath(directory)
+        cached = self._listings.get(directory)
+        if cached is not None:
+            try:
+                if all(_dir_stamp(os.stat(path)) == stamp for path, stamp in cached.stamps):
+                    return cached.files
+            except OSError:  # a subdirectory was removed
+                pass
+
+        listing = _CachedListing(stamps=[], files={})
+        _scan_into(listing, directory, ())
+        with self._lock:
+            self._listings[directory] = listing
+        return listing.files
+
+    def invalidate(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Forget the parsed contents or listing of `path`, or everything if not given."""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._listings.clear()
+                return
+            path = os.fspath(path)
+            for key in [key for key in self._files if key[0] == path]:
+                del self._files[key]
+            self._listings.pop(path, None)
+
+
+def _dir_stamp(st: os.stat_result) -> tuple[int, int]:
+    return st.st_ino, st.st_mtime_ns
+
+
+def _scan_into(listing: _CachedListing, directory: str, parts: tuple[str, ...]) -> None:
+    # stamp before listing, so a change made while scanning triggers a rescan next time
+    listing.stamps.append((directory, _dir_stamp(os.stat(directory))))
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                _scan_into(listing, entry.path, (*parts, entry.name))
+            elif entry.is_file():
+                listing.files[(*parts, entry.name)] = entry.path
+
+
+FILE_CACHE = FileCache()
+
+
+def parse_json(data: bytes) -> Any:
+    """Parse a JSON document."""
+    return from_json(data)
+
+
+def parse_toml(data: bytes) -> Any:
+    """Parse a TOML document."""
+    return tomllib.loads(data.decode())
+
+
+def parse_dotenv(data: bytes) -> dict[str, str]:
+    r"""Parse a ``.env`` file into a mapping of variable names to values.
+
+    Supports ``KEY=value`` lines with an optional ``export`` prefix, ``#``
+    comments, and single- or double-quoted values (double quotes expand
+    ``\n``, ``\t``, ``\"`` and ``\\``). Variables are not interpolated.
+    """
+    values: dict[str, str] = {}
+    for line in data.decode().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        values[key] = _parse_dotenv_value(value.strip())
+    return values
+
+
+_DOTENV_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+
+def _parse_dotenv_value(value: str) -> str:
+    if value[:1] == "'":
+        end = value.find("'", 1)
+        return value[1:end] if end != -1 else value[1:]
+    if value[:1] == '"':
+        chars = []
+        i = 1
+        while i < len(value) and value[i] != '"':
+            if value[i] == "\\" and i + 1 < len(value):
+                i += 1
+                chars.append(_DOTENV_ESCAPES.get(value[i], "\\" + value[i]))
+            else:
+                chars.append(value[i])
+            i += 1
+        return "".join(chars)
+    # unquoted: an inline comment starts at whitespace followed by "#"
+    for i, char in enumerate(value):
+        if char == "#" and i and value[i - 1].isspace():
+            return value[:i].rstrip()
+    return value
+
+
+def parse_secret(data: bytes) -> str:
+    """Decode a secret file, dropping the trailing newline most tools write."""
+    return data.decode().rstrip("\r\n")
+
+
+_PARSERS: dict[FileFormat, Parser] = {
+    FileFormat.JSON: parse_json,
+    FileFormat.TOML: parse_toml,
+}
+
+_SUFFIX_FORMATS = {
+    ".json": FileFormat.JSON,
+    ".toml": FileFormat.TOML,
+}
+
+
+def infer_file_format(path: str | os.PathLike[str]) -> FileFormat:
+    """Infer the format of a structured file from its suffix."""
+    suffix = Path(path).suffix.lower()
+    try:
+        return _SUFFIX_FORMATS[suffix]
+    except KeyError:
+        raise ValueError(
+            f"Unable to infer the format of `{os.fspath(path)}` from its suffix `{suffix}`."
+            f" Expected one of {sorted(_SUFFIX_FORMATS)}, or set the format explicitly."
+        ) from None
+
+
+def load_document(path: str | os.PathLike[str], file_format: FileFormat | None = None) -> Any:
+    """Return the parsed contents of a JSON or TOML file, cached until it changes."""
+    return FILE_CACHE.load(path, _PARSERS[file_format or infer_file_format(path)])
+
+
+def lookup_key_path(document: Any, key_path: str | None, *, delimiter: str = ".") -> Any:
+    """Return the value at a `delimiter`-separated key path, or ``None`` if absent.
+
+    An empty or missing key path returns the whole document.
+    """
+    if not key_path:
+        return document
+    value = document
+    for part in key_path.split(delimiter):
+        if not isinstance(value, Mapping) or part not in value:
+            return None
+        value = value[part]
+    return value
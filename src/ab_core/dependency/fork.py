@@ -0,0 +1,54 @@
+"""Pre-fork warm-up of persisted dependencies.
+
+Servers such as gunicorn fork their workers from a master process. Each
+worker would otherwise load every persisted dependency again after
+forking. :func:`warm_up` loads them in the master instead, so workers
+inherit them, sharing their memory copy-on-write.
+
+Instances that cannot be shared across processes, such as clients holding
+open sockets, are warmed up with ``fork_policy=ForkPolicy.RECREATE``:
+each child drops the inherited instance and loads its own on first use.
+
+Example (gunicorn config)::
+
+    def on_starting(server):
+        warm_up(AppConfig, FeatureFlags)
+        warm_up(DatabaseClient, fork_policy=ForkPolicy.RECREATE)
+"""
+
+import gc
+from typing import Any
+
+from .depends import DependsBase, LoadMany, _resolve_target
+from .schema.fork_policy import ForkPolicy
+from .singleton import SingletonRegistry
+from .types import LoadTarget
+
+
+def warm_up(
+    *load_targets: "LoadTarget[Any] | DependsBase[Any]",
+    fork_policy: ForkPolicy = ForkPolicy.SHARE,
+    freeze: bool = False,
+) -> tuple[Any, ...]:
+    """Load persisted targets before forking, returning their instances in order.
+
+    The targets are loaded from one environment snapshot with
+    ``persist=True``, and later ``Load(..., persist=True)`` calls in the
+    parent or in forked children return the same instances, unless
+    `fork_policy` is :attr:`ForkPolicy.RECREATE`. A :class:`Depends` may be
+    given in place of a target; it is always persisted.
+
+    With `freeze`, :func:`gc.freeze` is called afterwards, so the garbage
+    collector of forked children does not touch, and so copy, the memory of
+    objects loaded so far.
+    """
+    targets = [target.load_target if isinstance(target, DependsBase) else target for target in load_targets]
+    policy = ForkPolicy(fork_policy)
+    for target in targets:
+        _, key, _ = _resolve_target(target)
+        SingletonRegistry.set_fork_policy(key, policy)
+
+    instances = LoadMany(*targets, persist=True)
+    if freeze:
+        gc.freeze()
+    return instances
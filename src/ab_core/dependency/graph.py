@@ -0,0 +1,229 @@
+"""Static dependency graph of injected callables and classes.
+
+:func:`dependency_graph` walks the ``Annotated[..., Depends(...)]``
+parameters of ``@inject``-decorated functions (and the annotations of
+injected classes), following providers that declare dependencies of
+their own, without resolving anything. The graph records how each
+dependency is loaded and whether it is persisted, and any cycles.
+
+Example::
+
+    graph = dependency_graph(login, refresh_token)
+    print(graph.to_dot())  # render with `dot -Tsvg`
+
+A dependency that is not persisted is resolved again for every call that
+reaches it; one with several dependents in the graph is resolved once per
+dependent::
+
+    for node in graph.nodes.values():
+        if len(graph.dependents(node.id)) > 1:
+            ...
+"""
+
+import inspect
+import json
+from typing import Any, NamedTuple
+
+from .depends import default_loader_for
+from .hooks import target_name
+from .injection import declared_dependencies
+from .loaders.base import LoaderBase
+from .schema.dependency_kind import DependencyKind
+from .utils import is_real_callable
+
+
+class DependencyNode(NamedTuple):
+    """A dependency, or an injected callable or class given as a root."""
+
+    id: str
+    target: Any
+    kind: DependencyKind
+    # how loaders read their data, e.g. `ENVIRONMENT_OBJECT`, and from where
+    source: str | None = None
+    env_prefix: str | None = None
+    key: str | None = None
+
+
+class DependencyEdge(NamedTuple):
+    """A dependency of `dependent` on `dependency`, through the parameter or field `parameter`."""
+
+    dependent: str
+    dependency: str
+    parameter: str
+    persist: bool
+
+
+def _identity(target: Any) -> Any:
+    try:
+        hash(target)
+    except TypeError:  # e.g. loaders, which are unhashable models
+        return id(target)
+    return target
+
+
+class DependencyGraph:
+    """Dependencies of a set of roots, as nodes and directed edges from dependent to dependency.
+
+    Nodes are identified by the name of their target, disambiguated with a
+    ``#<n>`` suffix when distinct targets share a name.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty graph."""
+        self.nodes: dict[str, DependencyNode] = {}
+        self.edges: list[DependencyEdge] = []
+        self.roots: list[str] = []
+        # each cycle as the ids along it, starting and ending with the same node
+        self.cycles: list[list[str]] = []
+        self._ids: dict[Any, str] = {}
+
+    def dependencies(self, node_id: str) -> list[DependencyEdge]:
+        """Return the edges from `node_id` to the dependencies it declares."""
+        return [edge for edge in self.edges if edge.dependent == node_id]
+
+    def dependents(self, node_id: str) -> list[DependencyEdge]:
+        """Return the edges to `node_id` from the nodes depending on it."""
+        return [edge for edge in self.edges if edge.dependency == node_id]
+
+    def _add_node(self, target: Any, kind: DependencyKind, loader: LoaderBase | None = None) -> tuple[str, bool]:
+        """Add a node for `target`, returning its id and whether it was added now."""
+        identity = _identity(target)
+        if identity in self._ids:
+            return self._ids[identity], False
+
+        node_id = name = target_name(target)
+        suffix = 1
+        while node_id in self.nodes:
+            suffix += 1
+            node_id = f"{name}#{suffix}"
+        self._ids[identity] = node_id
+        self.nodes[node_id] = DependencyNode(
+            id=node_id,
+            target=target,
+            kind=kind,
+            source=None if loader is None else str(getattr(loader, "source", "")) or None,
+            env_prefix=getattr(loader, "env_prefix", None),
+            key=getattr(loader, "key", None),
+        )
+        return node_id, True
+
+    def _add_dependency(self, load_target: Any) -> tuple[str, bool]:
+        """Add a node for a :class:`Depends` target, returning its id and whether it was added now."""
+        if is_real_callable(load_target):
+            return self._add_node(load_target, DependencyKind.FUNCTION)
+        if isinstance(load_target, LoaderBase):
+            return self._add_node(load_target, DependencyKind.LOADER, load_target)
+        loader = default_loader_for(load_target)
+        if loader is not None:
+            return self._add_node(load_target, DependencyKind.LOADER, loader)
+        return self._add_node(load_target, DependencyKind.TYPE)
+
+    def _walk(self, roots: tuple[Any, ...]) -> None:
+        pending: list[tuple[str, Any]] = []
+        for root in roots:
+            kind = DependencyKind.CLASS if inspect.isclass(root) else DependencyKind.FUNCTION
+            root_id, added = self._add_node(root, kind)
+            self.roots.append(root_id)
+            if added:
+                pending.append((root_id, root))
+
+        while pending:
+            node_id, target = pending.pop()
+            for parameter, depends in declared_dependencies(target):
+                dependency_id, added = self._add_dependency(depends.load_target)
+                self.edges.append(DependencyEdge(node_id, dependency_id, parameter, depends.persist))
+                if added and self.nodes[dependency_id].kind is DependencyKind.FUNCTION:
+                    pending.append((dependency_id, depends.load_target))
+
+    def _find_cycles(self) -> None:
+        adjacency: dict[str, list[str]] = {node_id: [] for node_id in self.nodes}
+        for edge in self.edges:
+            adjacency[edge.dependent].append(edge.dependency)
+
+        done: set[str] = set()
+        for start in self.nodes:
+            if start in done:
+                continue
+            # iterative depth-first search, keeping the path to report cycles along it
+            path = [start]
+            on_path = {start}
+            iterators = [iter(adjacency[start])]
+            while iterators:
+                for child in iterators[-1]:
+                    if child in on_path:
+                        self.cycles.append([*path[path.index(child) :], child])
+                    elif child not in done:
+                        path.append(child)
+                        on_path.add(child)
+                        iterators.append(iter(adjacency[child]))
+                        break
+                else:
+                    iterators.pop()
+                    done.add(path[-1])
+                    on_path.discard(path.pop())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the graph as JSON-compatible data, without the targets themselves."""
+        return {
+            "roots": self.roots,
+            "nodes": [
+                {
+                    "id": node.id,
+                    "kind": str(node.kind),
+                    "source": node.source,
+                    "env_prefix": node.env_prefix,
+                    "key": node.key,
+                }
+                for node in self.nodes.values()
+            ],
+            "edges": [edge._asdict() for edge in self.edges],
+            "cycles": self.cycles,
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Return the graph as a JSON document; `kwargs` are passed to :func:`json.dumps`."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_dot(self) -> str:
+        """Return the graph in Graphviz DOT format.
+
+        Loaders are drawn as boxes labelled with their source and prefix or
+        key, persisted dependencies with dashed edges, and edges along
+        cycles in red.
+        """
+        cycle_edges = {(cycle[i], cycle[i + 1]) for cycle in self.cycles for i in range(len(cycle) - 1)}
+        lines = ["digraph dependencies {", "  rankdir=LR;"]
+        for node in self.nodes.values():
+            label = "\n".join(filter(None, [node.id, node.source, node.env_prefix or node.key]))
+            shape = "box" if node.kind is DependencyKind.LOADER else "ellipse"
+            style = ", peripheries=2" if node.id in self.roots else ""
+            lines.append(f"  {_quote(node.id)} [label={_quote(label)}, shape={shape}{style}];")
+        for edge in self.edges:
+            attributes = [f"label={_quote(edge.parameter)}"]
+            if edge.persist:
+                attributes.append("style=dashed")
+            if (edge.dependent, edge.dependency) in cycle_edges:
+                attributes.append("color=red")
+            lines.append(f"  {_quote(edge.dependent)} -> {_quote(edge.dependency)} [{', '.join(attributes)}];")
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _quote(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def dependency_graph(*roots: Any) -> DependencyGraph:
+    """Build the dependency graph of injected functions or classes, without resolving anything.
+
+    The ``Annotated[..., Depends(...)]`` parameters of each root are
+    followed to their providers, and on to the dependencies providers
+    declare in turn. Loaders and raw types are leaves, recording the
+    loader's source and environment prefix or key. Cycles are recorded in
+    :attr:`DependencyGraph.cycles` rather than raised.
+    """
+    graph = DependencyGraph()
+    graph._walk(roots)
+    graph._find_cycles()
+    return graph
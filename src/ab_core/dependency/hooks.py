@@ -0,0 +1,300 @@
+"""Hooks observing dependency resolution, and a tracing span emitter.
+
+Register a :class:`ResolveHook` with :func:`add_hook` to be told when
+dependencies are resolved, loaded, set up and torn down, how long each
+stage took and how it ended. While no hook is registered, resolution only
+pays for checking that none is.
+
+Example::
+
+    class SlowDependencies(ResolveHook):
+        def on_resolve_end(self, event):
+            if event.duration > 0.05:
+                logger.warning("%s took %.0f ms", event.name, event.duration * 1000)
+
+    add_hook(SlowDependencies())
+
+:class:`SpanEmitter` reports each stage as an OpenTelemetry span instead.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any
+
+from .schema.resolve_outcome import ResolveOutcome
+from .schema.resolve_stage import ResolveStage
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span, Tracer
+
+logger = logging.getLogger(__name__)
+
+
+def target_name(target: Any) -> str:
+    """Return a short, readable name for a load target or loader."""
+    if isinstance(target, type) or callable(target) and hasattr(target, "__qualname__"):
+        return target.__qualname__
+    if getattr(target, "__module__", None) == "typing":  # e.g. an Annotated union
+        return repr(target)
+    return type(target).__name__  # a loader, named with its type parameter
+
+
+@dataclass(eq=False, slots=True)
+class ResolveEvent:
+    """A stage of resolving a dependency, as reported to hooks.
+
+    The same event is passed to the start and end hooks of a stage, and is
+    completed with its `duration` (in seconds), `outcome` and `error` when
+    the stage ends.
+    """
+
+    target: Any
+    stage: ResolveStage
+    persist: bool = False
+    # the stage this one ran within, if any, e.g. the resolve of a loader's load
+    parent: "ResolveEvent | None" = None
+    duration: float | None = None
+    outcome: ResolveOutcome | None = None
+    error: BaseException | None = None
+
+    @property
+    def name(self) -> str:
+        """A short, readable name for the target."""
+        return target_name(self.target)
+
+
+class ResolveHook:
+    """Base class for hooks; override the methods for the events of interest.
+
+    Hooks are called synchronously on the resolving thread, so should be
+    quick. Exceptions raised by a hook are logged and otherwise ignored.
+    """
+
+    def on_resolve_start(self, event: ResolveEvent) -> None:
+        """Handle the start of a resolve, load or setup stage."""
+
+    def on_resolve_end(self, event: ResolveEvent) -> None:
+        """Handle the end of a resolve, load or setup stage, with its duration and outcome."""
+
+    def on_cache_hit(self, event: ResolveEvent) -> None:
+        """Handle the reuse of a persisted instance, between the start and end of its resolve."""
+
+    def on_teardown(self, event: ResolveEvent) -> None:
+        """Handle the end of tearing down a generator dependency, with its duration and outcome."""
+
+
+# replaced, never mutated, so resolving threads can iterate it without locking
+_registered: tuple[ResolveHook, ...] = ()
+_registered_lock = threading.Lock()
+
+# the stage running in the current context, the parent of stages started within it
+_current: ContextVar[ResolveEvent | None] = ContextVar("ab_dependency_resolve_event", default=None)
+
+
+def add_hook(hook: ResolveHook) -> ResolveHook:
+    """Register `hook` to be called on resolution events, returning it."""
+    global _registered
+    with _registered_lock:
+        _registered = (*_registered, hook)
+    return hook
+
+
+def remove_hook(hook: ResolveHook) -> None:
+    """Unregister `hook`, if registered."""
+    global _registered
+    with _registered_lock:
+        _registered = tuple(registered for registered in _registered if registered is not hook)
+
+
+def registered_hooks() -> tuple[ResolveHook, ...]:
+    """Return the registered hooks, in the order they are called."""
+    return _registered
+
+
+def _notify(method: str, event: ResolveEvent) -> None:
+    for hook in _registered:
+        try:
+            getattr(hook, method)(event)
+        except Exception:
+            logger.exception("Dependency hook %r failed in %s", hook, method)
+
+
+def _end(
+    method: str,
+    event: ResolveEvent,
+    started: float,
+    outcome: ResolveOutcome,
+    error: BaseException | None,
+) -> None:
+    event.duration = time.perf_counter() - started
+    event.outcome = outcome
+    event.error = error
+    _notify(method, event)
+
+
+def _run(
+    method: str,
+    event: ResolveEvent,
+    call: Callable[[], Any],
+    outcome: ResolveOutcome,
+    expected: BaseException | None,
+) -> Any:
+    """Call `call` as the stage `event`, ending it with `method` once done, or once awaited.
+
+    Raising `expected`, the exception thrown into a generator, is not an error of the stage.
+    """
+    started = time.perf_counter()
+    token = _current.set(event)
+    try:
+        value = call()
+    except BaseException as e:
+        _current.reset(token)
+        _end(method, event, started, outcome if e is expected else ResolveOutcome.ERROR, None if e is expected else e)
+        raise
+    _current.reset(token)
+    if isawaitable(value):
+        return _run_awaited(method, event, value, started, outcome, expected)
+    _end(method, event, started, outcome, None)
+    return value
+
+
+async def _run_awaited(
+    method: str,
+    event: ResolveEvent,
+    awaitable: Awaitable[Any],
+    started: float,
+    outcome: ResolveOutcome,
+    expected: BaseException | None,
+) -> Any:
+    token = _current.set(event)
+    try:
+        value = await awaitable
+    except BaseException as e:
+        _end(method, event, started, outcome if e is expected else ResolveOutcome.ERROR, None if e is expected else e)
+        raise
+    finally:
+        _current.reset(token)
+    _end(method, event, started, outcome, None)
+    return value
+
+
+def trace[T](
+    call: Callable[[], T],
+    target: Any,
+    *,
+    stage: ResolveStage = ResolveStage.RESOLVE,
+    persist: bool = False,
+    cached: bool = False,
+) -> T:
+    """Call `call` as a stage of resolving `target`, reporting it to the registered hooks.
+
+    If `call` returns an awaitable, an awaitable is returned instead, and
+    the stage ends once it has been awaited. With `cached`, the stage is
+    reported as reusing a persisted instance.
+    """
+    event = ResolveEvent(target, stage, persist, _current.get())
+    _notify("on_resolve_start", event)
+    if cached:
+        _notify("on_cache_hit", event)
+    return _run(
+        "on_resolve_end", event, call, ResolveOutcome.CACHED if cached else ResolveOutcome.SUCCESS, expected=None
+    )
+
+
+def trace_teardown[T](
+    call: Callable[[], T],
+    target: Any,
+    *,
+    persist: bool = False,
+    thrown: BaseException | None = None,
+) -> T:
+    """Call `call`, tearing down a generator dependency of `target`, reporting it to the registered hooks.
+
+    `thrown` is the exception thrown into the generator, if any; the
+    teardown only failed if it raised another. As with :func:`trace`,
+    awaitables are reported once awaited.
+    """
+    event = ResolveEvent(target, ResolveStage.TEARDOWN, persist, _current.get())
+    return _run("on_teardown", event, call, ResolveOutcome.SUCCESS, expected=thrown)
+
+
+# --------------------------------------------------------------------- #
+# OpenTelemetry                                                         #
+# --------------------------------------------------------------------- #
+def _import_opentelemetry():
+    try:
+        from opentelemetry import trace as otel_trace
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Emitting spans requires opentelemetry-api. Install it with `pip install ab-dependency[otel]`."
+        ) from e
+    return otel_trace
+
+
+class SpanEmitter(ResolveHook):
+    """Hook emitting an OpenTelemetry span for each stage of resolving a dependency.
+
+    Spans are named after their stage and target, e.g. ``RESOLVE AppConfig``,
+    and nest under the stage they ran within, or else the current span, such
+    as that of the request being served. Cache hits are recorded as events.
+
+    Example::
+
+        add_hook(SpanEmitter())
+    """
+
+    def __init__(self, tracer: "Tracer | None" = None):
+        """Emit spans with `tracer`, by default the global tracer provider's."""
+        self._trace = _import_opentelemetry()
+        self.tracer = tracer or self._trace.get_tracer("ab_core.dependency")
+        self._spans: dict[int, Span] = {}
+        self._lock = threading.Lock()
+
+    def _start_span(self, event: ResolveEvent, start_time: int | None = None) -> "Span":
+        parent = self._spans.get(id(event.parent)) if event.parent is not None else None
+        return self.tracer.start_span(
+            f"{event.stage} {event.name}",
+            context=self._trace.set_span_in_context(parent) if parent is not None else None,
+            start_time=start_time,
+            attributes={
+                "dependency.target": event.name,
+                "dependency.stage": str(event.stage),
+                "dependency.persist": event.persist,
+            },
+        )
+
+    def _end_span(self, span: "Span", event: ResolveEvent) -> None:
+        span.set_attribute("dependency.outcome", str(event.outcome))
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, repr(event.error)))
+        span.end()
+
+    def on_resolve_start(self, event: ResolveEvent) -> None:
+        """Start the span of the stage."""
+        span = self._start_span(event)
+        with self._lock:
+            self._spans[id(event)] = span
+
+    def on_cache_hit(self, event: ResolveEvent) -> None:
+        """Record the reuse of a persisted instance on the span of the resolve."""
+        span = self._spans.get(id(event))
+        if span is not None:
+            span.add_event("dependency.cache_hit")
+
+    def on_resolve_end(self, event: ResolveEvent) -> None:
+        """End the span of the stage."""
+        with self._lock:
+            span = self._spans.pop(id(event), None)
+        if span is not None:
+            self._end_span(span, event)
+
+    def on_teardown(self, event: ResolveEvent) -> None:
+        """Emit a span covering the teardown, which has just ended."""
+        duration = int((event.duration or 0.0) * 1e9)
+        self._end_span(self._start_span(event, start_time=time.time_ns() - duration), event)
@@ -1,40 +1,83 @@
 """Dependency injection decorator and runtime helpers."""
 
+import asyncio
 import inspect
 from collections.abc import Callable
-from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
-from functools import wraps
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    ExitStack,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from functools import partial, wraps
 from inspect import isawaitable
 from types import AsyncGeneratorType, GeneratorType
-from typing import Annotated, Any, ParamSpec, TypeVar, get_args, get_origin, overload
+from typing import Annotated, Any, NamedTuple, ParamSpec, TypeVar, get_args, get_origin, overload
 
-from .depends import Depends
+from . import hooks
+from .depends import DependsBase
+from .loaders.base import LoaderBase
+from .schema.dependency_kind import DependencyKind
+from .schema.resolve_stage import ResolveStage
+from .utils import is_real_callable
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
+# ---------- Generator setup & teardown, reported to any hooks ----------
+def _set_up(dep: DependsBase, start: Callable[[], Any]) -> Any:
+    """Run a generator dependency up to its ``yield`` with `start`; may return an awaitable."""
+    if hooks._registered:
+        return hooks.trace(start, dep.load_target, stage=ResolveStage.SETUP, persist=dep.persist)
+    return start()
+
+
+def _resume(gen: GeneratorType, exc: BaseException | None) -> None:
+    try:
+        if exc is None:
+            # normal completion: drive teardown path without GeneratorExit
+            gen.send(None)
+        else:
+            # error path: propagate into generator for cleanup
+            gen.throw(exc)
+    except StopIteration:
+        pass
+
+
+async def _aresume(agen: AsyncGeneratorType, exc: BaseException | None) -> None:
+    try:
+        if exc is None:
+            await agen.asend(None)
+        else:
+            await agen.athrow(exc)
+    except StopAsyncIteration:
+        pass
+
+
+def _tear_down(dep: DependsBase, resume: Callable[[], Any], exc: BaseException | None) -> Any:
+    """Run a generator dependency past its ``yield`` with `resume`; may return an awaitable."""
+    if hooks._registered:
+        return hooks.trace_teardown(resume, dep.load_target, persist=dep.persist, thrown=exc)
+    return resume()
+
+
 # ---------- Wrap a single provider as a *sync* context manager ----------
 @contextmanager
-def _dep_to_cm(dep: Depends):
-    obj = dep()  # value | awaitable | gen | async-gen
+def _dep_to_cm(obj: Any, dep: DependsBase):
+    # `obj` is the result of `dep()`: value | awaitable | gen | async-gen
     # sync generator dep
     if isinstance(obj, GeneratorType):
+        val = _set_up(dep, partial(next, obj))
         try:
-            val = next(obj)
             yield val
-            # normal completion: drive teardown path without GeneratorExit
-            try:
-                obj.send(None)
-            except StopIteration:
-                pass
         except BaseException as exc:
-            # error path: propagate into generator for cleanup
-            try:
-                obj.throw(exc)
-            except StopIteration:
-                pass
+            _tear_down(dep, partial(_resume, obj, exc), exc)
             raise
+        else:
+            _tear_down(dep, partial(_resume, obj, None), None)
         return
 
     # async generator dep (allowed in sync only if it yields a sync-safe value)
@@ -43,6 +86,8 @@ def _dep_to_cm(dep: Depends):
 
     # awaitable (not allowed in sync)
     if isawaitable(obj):
+        if inspect.iscoroutine(obj):
+            obj.close()  # never awaited; close it so it is not reported as such
         raise RuntimeError("Awaitable dependency cannot be used in a sync context")
 
     # plain value
@@ -54,27 +99,21 @@ def _dep_to_cm(dep: Depends):
 
 # ---------- Wrap a single provider as an *async* context manager ----------
 @asynccontextmanager
-async def _dep_to_acm(dep: Depends):
-    obj = dep()
+async def _dep_to_acm(obj: Any, dep: DependsBase):
+    # `obj` is the result of `dep.call_async()`: value | awaitable | gen | async-gen
 
     # async generator dep
     if isinstance(obj, AsyncGeneratorType):
         try:
-            val = await obj.__anext__()
+            val = await _set_up(dep, obj.__anext__)
 
             try:
                 yield val
             except BaseException as exc:
-                try:
-                    await obj.athrow(type(exc), exc, exc.__traceback__)
-                except StopAsyncIteration:
-                    pass
+                await _tear_down(dep, partial(_aresume, obj, exc), exc)
                 raise
             else:
-                try:
-                    await obj.asend(None)
-                except StopAsyncIteration:
-                    pass
+                await _tear_down(dep, partial(_aresume, obj, None), None)
 
         finally:
             try:
@@ -87,21 +126,15 @@ async def _dep_to_acm(dep: Depends):
     # sync generator dep, lifted into async context
     if isinstance(obj, GeneratorType):
         try:
-            val = next(obj)
+            val = _set_up(dep, partial(next, obj))
 
             try:
                 yield val
             except BaseException as exc:
-                try:
-                    obj.throw(type(exc), exc, exc.__traceback__)
-                except StopIteration:
-                    pass
+                _tear_down(dep, partial(_resume, obj, exc), exc)
                 raise
             else:
-                try:
-                    obj.send(None)
-                except StopIteration:
-                    pass
+                _tear_down(dep, partial(_resume, obj, None), None)
 
         finally:
             try:
@@ -121,33 +154,100 @@ async def _dep_to_acm(dep: Depends):
     yield obj
 
 
-# ---------- Resolve & enter all dependencies ----------
-def _collect_dep_specs(sig: inspect.Signature):
-    specs: list[tuple[str, Depends]] = []
-    for name, param in sig.parameters.items():
-        anno = param.annotation
-        if get_origin(anno) is Annotated:
-            _, *extras = get_args(anno)
-            for e in extras:
-                if isinstance(e, Depends):
-                    specs.append((name, e))
+# ---------- Resolution plan, built once per decorated target ----------
+def declared_dependencies(target: Any) -> list[tuple[str, DependsBase]]:
+    """Return the parameters or class fields of `target` annotated with a :class:`Depends`, in order."""
+    if inspect.isclass(target):
+        annotations = getattr(target, "__annotations__", {})
+    else:
+        try:
+            signature = inspect.signature(target)  # follows `__wrapped__`, so sees through @inject
+        except (TypeError, ValueError):  # e.g. builtins without a signature
+            return []
+        annotations = {name: parameter.annotation for name, parameter in signature.parameters.items()}
+
+    dependencies = []
+    for name, annotation in annotations.items():
+        if get_origin(annotation) is Annotated:
+            for extra in get_args(annotation)[1:]:
+                if isinstance(extra, DependsBase):
+                    dependencies.append((name, extra))
                     break
-    return specs
+    return dependencies
+
+
+def dependency_kind(load_target: Any) -> DependencyKind:
+    """Return what a load target is resolved with; raw types get their default loader on first use."""
+    if is_real_callable(load_target):
+        return DependencyKind.FUNCTION
+    if isinstance(load_target, LoaderBase):
+        return DependencyKind.LOADER
+    return DependencyKind.TYPE
 
 
-def _resolve_deps_sync(sig: inspect.Signature, bound: inspect.BoundArguments) -> ExitStack:
+class InjectedParameter(NamedTuple):
+    """A parameter or class field resolved by :func:`inject`."""
+
+    name: str
+    depends: DependsBase
+    kind: DependencyKind
+
+
+class InjectionPlan(NamedTuple):
+    """The dependencies :func:`inject` resolves for a target, parsed once when decorating it."""
+
+    parameters: tuple[InjectedParameter, ...]
+    names: frozenset[str]
+
+
+def injection_plan(target: Any) -> InjectionPlan:
+    """Build the injection plan of a function or class."""
+    parameters = tuple(
+        InjectedParameter(name, depends, dependency_kind(depends.load_target))
+        for name, depends in declared_dependencies(target)
+    )
+    return InjectionPlan(parameters, frozenset(parameter.name for parameter in parameters))
+
+
+def _is_plain(obj: Any) -> bool:
+    """Return whether a resolved dependency is a value, rather than an awaitable or (async) generator."""
+    return not (isinstance(obj, GeneratorType | AsyncGeneratorType) or isawaitable(obj))
+
+
+# ---------- Resolve & enter all dependencies ----------
+def _resolve_sync(dep: DependsBase, stack: ExitStack) -> Any:
+    obj = dep()
+    # plain values need no context; generators are torn down on exit
+    return obj if _is_plain(obj) else stack.enter_context(_dep_to_cm(obj, dep))
+
+
+async def _resolve_async(deps: list[DependsBase], astack: AsyncExitStack) -> list[Any]:
+    objs = [dep.call_async() for dep in deps]
+
+    # await several awaitables (e.g. async loaders) concurrently, not one after another
+    awaiting = [i for i, obj in enumerate(objs) if isawaitable(obj)]
+    if len(awaiting) > 1:
+        for i, val in zip(awaiting, await asyncio.gather(*(objs[i] for i in awaiting)), strict=True):
+            objs[i] = val
+
+    for i, (dep, obj) in enumerate(zip(deps, objs, strict=True)):
+        if not _is_plain(obj):
+            objs[i] = await astack.enter_async_context(_dep_to_acm(obj, dep))
+    return objs
+
+
+def _resolve_deps_sync(plan: InjectionPlan, bound: inspect.BoundArguments) -> ExitStack:
     stack = ExitStack()
-    for name, dep in _collect_dep_specs(sig):
-        if name in bound.arguments:
-            continue
-        val = stack.enter_context(_dep_to_cm(dep))
-        bound.arguments[name] = val
+    arguments = bound.arguments
+    for name, dep, _ in plan.parameters:
+        if name not in arguments:
+            arguments[name] = _resolve_sync(dep, stack)
     return stack
 
 
-async def _resolve_deps_async(sig: inspect.Signature, bound: inspect.BoundArguments) -> AsyncExitStack:
+async def _resolve_deps_async(plan: InjectionPlan, bound: inspect.BoundArguments) -> AsyncExitStack:
     astack = AsyncExitStack()
-    await astack.enter_async_context(_AsyncDepsBinder(astack, sig, bound))
+    await astack.enter_async_context(_AsyncDepsBinder(astack, plan, bound))
     return astack
 
 
@@ -162,17 +262,16 @@ def _resolve_class_dep_value(dep) -> Any:
 class _AsyncDepsBinder:
     """Helper to enter all async dep contexts under a single AsyncExitStack."""
 
-    def __init__(self, astack: AsyncExitStack, sig: inspect.Signature, bound: inspect.BoundArguments):
+    def __init__(self, astack: AsyncExitStack, plan: InjectionPlan, bound: inspect.BoundArguments):
         self.astack = astack
-        self.sig = sig
+        self.plan = plan
         self.bound = bound
 
     async def __aenter__(self):
-        for name, dep in _collect_dep_specs(self.sig):
-            if name in self.bound.arguments:
-                continue
-            val = await self.astack.enter_async_context(_dep_to_acm(dep))
-            self.bound.arguments[name] = val
+        pending = [(name, dep) for name, dep, _ in self.plan.parameters if name not in self.bound.arguments]
+        objs = await _resolve_async([dep for _, dep in pending], self.astack)
+        for (name, _), obj in zip(pending, objs, strict=True):
+            self.bound.arguments[name] = obj
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -180,6 +279,110 @@ class _AsyncDepsBinder:
         return False
 
 
+# ---------- Wrappers generated for a function's exact signature ----------
+_MISSING = object()  # an injectable argument the caller did not pass
+
+# names used by generated code, which parameters must not shadow
+_GENERATED_PREFIX = "__inject_"
+
+
+def _generate_wrapper(fn: Callable[..., Any], sig: inspect.Signature, plan: InjectionPlan) -> Callable[..., Any] | None:
+    """Generate a wrapper of a sync or coroutine function specialised to its signature.
+
+    As dataclasses generate ``__init__``, the wrapper is compiled from
+    source: it takes the function's own parameters as locals, with a
+    marker default for each injected one, resolves the injected ones the
+    caller did not pass and calls the function directly, without binding
+    arguments. Returns ``None`` for callables other than plain functions,
+    e.g. partials and callable instances, and for signatures the wrapper
+    cannot mirror, e.g. a required parameter after an injected positional one.
+    """
+    if not inspect.isfunction(fn):
+        return None
+    injected = {name: dep for name, dep, _ in plan.parameters}
+    namespace: dict[str, Any] = {
+        "__inject_fn": fn,
+        "__inject_MISSING": _MISSING,
+        "__inject_ExitStack": ExitStack,
+        "__inject_AsyncExitStack": AsyncExitStack,
+        "__inject_resolve": _resolve_sync,
+        "__inject_resolve_async": _resolve_async,
+        # builtins too, which the function's parameters may shadow, e.g. `next` in middleware
+        "__inject_iter": iter,
+        "__inject_next": next,
+    }
+    params: list[str] = []
+    call: list[str] = []
+    previous = None  # the kind of the previous parameter
+    optional = False  # whether a positional parameter so far can be omitted
+    for name, param in sig.parameters.items():
+        if name.startswith(_GENERATED_PREFIX):
+            return None
+        kind = param.kind
+        if previous is param.POSITIONAL_ONLY and kind is not param.POSITIONAL_ONLY:
+            params.append("/")
+        if kind is param.KEYWORD_ONLY and previous not in (param.VAR_POSITIONAL, param.KEYWORD_ONLY):
+            params.append("*")
+        previous = kind
+
+        if kind is param.VAR_POSITIONAL or kind is param.VAR_KEYWORD:
+            star = "*" if kind is param.VAR_POSITIONAL else "**"
+            params.append(f"{star}{name}")
+            call.append(f"{star}{name}")
+            continue
+        if name in injected:
+            namespace[f"__inject_dep_{name}"] = injected[name]
+            params.append(f"{name}=__inject_MISSING")
+        elif param.default is not param.empty:
+            namespace[f"__inject_default_{name}"] = param.default
+            params.append(f"{name}=__inject_default_{name}")
+        elif optional and kind is not param.KEYWORD_ONLY:
+            return None  # a required positional parameter cannot follow one that can be omitted
+        else:
+            params.append(name)
+        optional |= kind is not param.KEYWORD_ONLY and "=" in params[-1]
+        call.append(f"{name}={name}" if kind is param.KEYWORD_ONLY else name)
+    if previous is inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+
+    is_coro = inspect.iscoroutinefunction(fn)
+    invoke = f"{'await ' if is_coro else ''}__inject_fn({', '.join(call)})"
+    lines: list[str] = []
+
+    def emit(depth: int, line: str) -> None:
+        lines.append("    " * depth + line)
+
+    emit(0, f"def __inject_create({', '.join(namespace)}):")
+    emit(1, f"{'async ' if is_coro else ''}def wrapper({', '.join(params)}):")
+    if not injected:
+        emit(2, f"return {invoke}")
+    else:
+        emit(2, f"if {' and '.join(f'{name} is not __inject_MISSING' for name in injected)}:")
+        emit(3, f"return {invoke}")
+        if is_coro:
+            # collected first, so several async loaders are awaited concurrently
+            emit(2, "async with __inject_AsyncExitStack() as __inject_stack:")
+            emit(3, "__inject_deps = []")
+            for name in injected:
+                emit(3, f"if {name} is __inject_MISSING:")
+                emit(4, f"__inject_deps.append(__inject_dep_{name})")
+            emit(3, "__inject_values = __inject_iter(await __inject_resolve_async(__inject_deps, __inject_stack))")
+            for name in injected:
+                emit(3, f"if {name} is __inject_MISSING:")
+                emit(4, f"{name} = __inject_next(__inject_values)")
+        else:
+            emit(2, "with __inject_ExitStack() as __inject_stack:")
+            for name in injected:
+                emit(3, f"if {name} is __inject_MISSING:")
+                emit(4, f"{name} = __inject_resolve(__inject_dep_{name}, __inject_stack)")
+        emit(3, f"return {invoke}")
+    emit(1, "return wrapper")
+
+    local: dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<inject {fn.__qualname__}>", "exec"), {}, local)  # noqa: S102
+    return local["__inject_create"](**namespace)
+
+
 # ---------- Decorator ----------
 @overload
 def inject[**P, R](__fn: Callable[P, R]) -> Callable[P, R]: ...
@@ -192,17 +395,26 @@ def inject(target: Callable[..., Any] | type | None = None):
 
     def _wrap_fn(fn: Callable[P, R]) -> Callable[P, R]:
         sig = inspect.signature(fn)
+        plan = injection_plan(fn)
         is_coro = inspect.iscoroutinefunction(fn)
         is_gen = inspect.isgeneratorfunction(fn)
         is_async_gen = inspect.isasyncgenfunction(fn)
 
+        # Sync function or coroutine, through a wrapper generated for its signature
+        if not (is_gen or is_async_gen):
+            generated = _generate_wrapper(fn, sig, plan)
+            if generated is not None:
+                return wraps(fn)(generated)  # type: ignore[return-value]
+
         # Sync function
         if not (is_coro or is_gen or is_async_gen):
 
             @wraps(fn)
             def wrapper(*args: P.args, **kw: P.kwargs):
+                if plan.names <= kw.keys():  # every dependency given by the caller
+                    return fn(*args, **kw)
                 bound = sig.bind_partial(*args, **kw)
-                with _resolve_deps_sync(sig, bound):
+                with _resolve_deps_sync(plan, bound):
                     return fn(**bound.arguments)  # type: ignore[arg-type]
 
             return wrapper  # type: ignore[return-value]
@@ -212,8 +424,10 @@ def inject(target: Callable[..., Any] | type | None = None):
 
             @wraps(fn)
             async def wrapper(*args: P.args, **kw: P.kwargs):
+                if plan.names <= kw.keys():
+                    return await fn(*args, **kw)
                 bound = sig.bind_partial(*args, **kw)
-                async with await _resolve_deps_async(sig, bound):
+                async with await _resolve_deps_async(plan, bound):
                     return await fn(**bound.arguments)  # type: ignore[arg-type]
 
             return wrapper  # type: ignore[return-value]
@@ -223,8 +437,10 @@ def inject(target: Callable[..., Any] | type | None = None):
 
             @wraps(fn)
             def wrapper(*args: P.args, **kw: P.kwargs):
+                if plan.names <= kw.keys():
+                    return (yield from fn(*args, **kw))
                 bound = sig.bind_partial(*args, **kw)
-                with _resolve_deps_sync(sig, bound):
+                with _resolve_deps_sync(plan, bound):
                     gen = fn(**bound.arguments)
                     try:
                         while True:
@@ -254,9 +470,13 @@ def inject(target: Callable[..., Any] | type | None = None):
 
             @wraps(fn)
             async def wrapper(*args: P.args, **kw: P.kwargs):
-                bound = sig.bind_partial(*args, **kw)
-                async with await _resolve_deps_async(sig, bound):
-                    agen = fn(**bound.arguments)
+                resolving: AbstractAsyncContextManager[Any] = nullcontext()
+                if not plan.names <= kw.keys():  # unless the caller gave every dependency
+                    bound = sig.bind_partial(*args, **kw)
+                    resolving = await _resolve_deps_async(plan, bound)
+                    args, kw = (), bound.arguments  # type: ignore[assignment]
+                async with resolving:
+                    agen = fn(*args, **kw)
 
                     try:
                         while True:
@@ -292,6 +512,7 @@ def inject(target: Callable[..., Any] | type | None = None):
     def _wrap_cls(cls: type) -> type:
         """Inject :class:`Depends` fields at construction."""
         orig_init = cls.__init__
+        plan = injection_plan(cls)
         is_plain = orig_init is object.__init__
 
         # Optional: detect Pydantic BaseModel to pass kwargs instead of setattr
@@ -306,16 +527,10 @@ def inject(target: Callable[..., Any] | type | None = None):
         def __init__(self, *args, **kwargs):  # type: ignore[no-self-use]
             injected: dict[str, Any] = {}
 
-            for name, anno in getattr(cls, "__annotations__", {}).items():
-                if name in kwargs:
-                    continue
-                if get_origin(anno) is Annotated:
-                    _, *extras = get_args(anno)
-                    for e in extras:
-                        # Only resolve if not provided by caller
-                        if isinstance(e, Depends):
-                            injected[name] = _resolve_class_dep_value(e)
-                            break
+            for name, dep, _ in plan.parameters:
+                # Only resolve if not provided by caller
+                if name not in kwargs:
+                    injected[name] = _resolve_class_dep_value(dep)
 
             if is_pydantic:
                 # Pydantic must receive values via kwargs (no setattr before __init__)
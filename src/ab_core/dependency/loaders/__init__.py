@@ -4,11 +4,45 @@ from typing import Annotated
 
 from pydantic import Discriminator
 
+from .composite import (
+    CompositeLoader,
+    CompositeSource,
+    DefaultsSource,
+    DotenvSource,
+    EnvironmentSource,
+    FileSource,
+)
 from .environment import LoaderEnvironment
 from .environment_object import ObjectLoaderEnvironment
+from .file import LoaderFile
+from .http import AsyncLoaderHttp, LoaderHttp
+from .secrets import ObjectLoaderSecrets
 from .template import LoaderTemplate
 
 Loader = Annotated[
-    ObjectLoaderEnvironment | LoaderEnvironment | LoaderTemplate,
+    ObjectLoaderEnvironment
+    | LoaderEnvironment
+    | CompositeLoader
+    | LoaderFile
+    | LoaderHttp
+    | ObjectLoaderSecrets
+    | LoaderTemplate,
     Discriminator("source"),
 ]
+
+__all__ = [
+    "Loader",
+    "AsyncLoaderHttp",
+    "CompositeLoader",
+    "CompositeSource",
+    "DefaultsSource",
+    "DotenvSource",
+    "EnvironmentSource",
+    "FileSource",
+    "LoaderEnvironment",
+    "LoaderFile",
+    "LoaderHttp",
+    "LoaderTemplate",
+    "ObjectLoaderEnvironment",
+    "ObjectLoaderSecrets",
+]
@@ -1,18 +1,34 @@
 """Base loader abstractions."""
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from functools import cached_property
+from collections.abc import Mapping
+from functools import cached_property, partial
 from typing import (
     Any,
+    Literal,
     TypeVar,
+    get_args,
+    get_origin,
 )
 
 from generic_preserver.wrapper import generic_preserver
 from pydantic import BaseModel, Discriminator, TypeAdapter, model_validator
+from pydantic_core import to_json
 from pydantic_core.core_schema import CoreSchema
 
-from ab_core.dependency.pydanticize import cached_type_adapter, pydanticize_data, pydanticize_type
+from ab_core.dependency import hooks
+from ab_core.dependency.environ import EnvironSnapshot
+from ab_core.dependency.pydanticize import (
+    cached_reshaper,
+    cached_trusted_constructor,
+    cached_type_adapter,
+    pydanticize_type,
+)
+from ab_core.dependency.pydanticize.pydanticize import Reshaper
+from ab_core.dependency.schema.resolve_stage import ResolveStage
+from ab_core.dependency.schema.validation_mode import ValidationMode
+from ab_core.dependency.snapshot import active_snapshot
+from ab_core.dependency.trust import should_validate, validate_in_background
 from ab_core.dependency.utils import extract_target_types, type_name_intersection
 
 T = TypeVar("T")
@@ -23,6 +39,12 @@ class LoaderBase[T](BaseModel, ABC):
     """Base class for all loaders."""
 
     default_value: T | None = None
+    # build the raw data into the type without reshaping or validating it, for trusted sources
+    trust: bool = False
+    # fraction of trusted loads also validated in full in the background, to catch drift
+    trust_validation_rate: float = 0.01
+    # validate the reshaped data as Python objects, or serialized to JSON bytes
+    validation_mode: ValidationMode = ValidationMode.PYTHON
 
     def __call__(
         self,
@@ -37,18 +59,91 @@ class LoaderBase[T](BaseModel, ABC):
         """Load the raw data before any processing."""
         ...
 
+    def load_raw_from(
+        self,
+        environ: EnvironSnapshot,
+    ) -> Any:
+        """Load the raw data, reading environment variables from `environ`.
+
+        Environment-backed loaders override this so several loads can share
+        one snapshot; other loaders ignore `environ`.
+        """
+        return self.load_raw()
+
     def load(
         self,
+        environ: EnvironSnapshot | None = None,
     ) -> T:
-        """Load and return the data of the specified type, applying type plugins."""
+        """Load and return the data of the specified type, applying type plugins.
+
+        Every loader loads through here, so the load is reported to any
+        registered hooks; subclasses customise :meth:`_load` instead.
+        """
+        if hooks._registered:
+            return hooks.trace(partial(self._load, environ), self, stage=ResolveStage.LOAD)
+        return self._load(environ)
+
+    def _load(
+        self,
+        environ: EnvironSnapshot | None,
+    ) -> T:
+        return self.load_from_raw(self.read_raw(environ))
+
+    def read_raw(
+        self,
+        environ: EnvironSnapshot | None = None,
+    ) -> Any:
+        """Load the raw data, from `environ` when given, raising ``RuntimeError`` on failure."""
         try:
-            data = self.load_raw()
+            return self.load_raw() if environ is None else self.load_raw_from(environ)
         except Exception as e:
             raise RuntimeError(f"Error loading `{repr(self.type)}`: {e}") from e
+
+    def load_from_raw(
+        self,
+        data: Any,
+    ) -> T:
+        """Validate raw data, as returned by `load_raw`, into the type.
+
+        In ``trust`` mode the data must already be shaped like the type,
+        e.g. dumped from a previously validated instance. It is built with
+        ``model_construct`` instead, and only validated for a sample of loads,
+        in the background. While a :class:`~ab_core.dependency.snapshot.Snapshot`
+        is active, data it has seen before is built from the snapshot.
+        """
         if not data and self.default_value:
             return self.default_value
-        data_restructured = pydanticize_data(deepcopy(data), self.core_schema)
-        return self.type_adaptor.validate_python(data_restructured)
+        snapshot = active_snapshot()
+        if snapshot is not None:
+            return snapshot.load(self, data, self.build)
+        return self.build(data)
+
+    def build(
+        self,
+        data: Any,
+    ) -> T:
+        """Build raw data into the type: constructed if trusted, validated otherwise."""
+        if self.trust:
+            return self.construct_trusted(data)
+        if self.validation_mode is ValidationMode.JSON:
+            return self.type_adaptor.validate_json(to_json(self.restructure(data)))
+        return self.type_adaptor.validate_python(self.restructure(data))
+
+    def construct_trusted(
+        self,
+        data: Any,
+    ) -> T:
+        """Build trusted data into the type without validation, sampling it for background validation."""
+        if should_validate(self.trust_validation_rate):
+            validate_in_background(self.type_adaptor, data, self.type)
+        return cached_trusted_constructor(self.type)(data)
+
+    def restructure(
+        self,
+        data: Any,
+    ) -> Any:
+        """Reshape raw data to match the core schema of the type, leaving `data` untouched."""
+        return self.reshaper(data)
 
     @cached_property
     def native_type(self) -> type[T]:
@@ -70,6 +165,25 @@ class LoaderBase[T](BaseModel, ABC):
         """Generates the core schema for the type, applying any type plugins."""
         return self.type_adaptor.core_schema
 
+    @cached_property
+    def reshaper(self) -> Reshaper:
+        """The reshaper compiled for the core schema, leaving its input untouched."""
+        return cached_reshaper(self.core_schema, inplace=False)
+
+    @cached_property
+    def snapshot_key(self) -> str:
+        """Identifies the loader in a snapshot file, by its type and configuration.
+
+        Only fields shown in the loader's repr are included, less its
+        default value, so secrets such as request headers stay out of the file.
+        """
+        config = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name, field in type(self).model_fields.items()
+            if field.repr and name != "default_value"
+        )
+        return f"{self.type!r}: {type(self).__name__}({config})"
+
     @classmethod
     def supports(cls, obj: Any) -> bool:
         """Check if the loader supports the given type."""
@@ -80,6 +194,31 @@ class LoaderBase[T](BaseModel, ABC):
             return False
 
 
+class AsyncLoaderBase(LoaderBase[T], ABC):
+    """Base class for loaders reading from asynchronous (I/O-bound) sources.
+
+    Calling or loading returns an awaitable, so the event loop is not
+    blocked while the raw data is fetched. Validation is unchanged.
+    """
+
+    @abstractmethod
+    async def load_raw(  # type: ignore[override]
+        self,
+    ) -> Any:
+        """Load the raw data before any processing."""
+        ...
+
+    async def _load(  # type: ignore[override]
+        self,
+        environ: EnvironSnapshot | None,
+    ) -> T:
+        try:
+            data = await (self.load_raw() if environ is None else self.load_raw_from(environ))
+        except Exception as e:
+            raise RuntimeError(f"Error loading `{repr(self.type)}`: {e}") from e
+        return self.load_from_raw(data)
+
+
 class ObjectLoaderBase(LoaderBase[T], ABC):
     """Base class for loaders that handle Pydantic BaseModel objects."""
 
@@ -95,7 +234,7 @@ class ObjectLoaderBase(LoaderBase[T], ABC):
             self.discriminator_key = self.discriminator.discriminator
         return self
 
-    @property
+    @cached_property
     def alias_name(self) -> str:
         """Generates an alias name for the loader based on the intersection of type names."""
         assumed_name = type_name_intersection(self.types)
@@ -119,19 +258,56 @@ class ObjectLoaderBase(LoaderBase[T], ABC):
         except StopIteration:
             return None
 
+    @cached_property
+    def discriminator_table(self) -> dict[str, type[BaseModel]]:
+        """Maps each discriminator value to its union branch, if a discriminator is defined.
+
+        Values are keyed as strings, as they are read from raw sources.
+        """
+        if not self.discriminator:
+            return {}
+        table: dict[str, type[BaseModel]] = {}
+        for _type in self.types:
+            field = _type.model_fields.get(self.discriminator_key)
+            if field is None:
+                continue
+            tags = get_args(field.annotation) if get_origin(field.annotation) is Literal else (field.default,)
+            for tag in tags:
+                table.setdefault(str(getattr(tag, "value", tag)), _type)
+        return table
+
     @cached_property
     def discriminator_choices(self) -> list[str] | None:
         """Extracts the discriminator choices if a discriminator is defined."""
         if not self.discriminator:
             return None
-        return [_type.model_fields[self.discriminator_key].default for _type in self.types]
+        return list(self.discriminator_table)
 
-    def discriminate_type(
+    def discriminate(
         self,
+        data: Mapping[str, Any],
     ) -> type[T]:
-        """Determine the specific type to use based on the discriminator value."""
+        """Return the union branch selected by the discriminator value in raw `data`."""
         if self.discriminator is None:
             return self.type
 
-        discriminator_value = self.load_raw()[self.discriminator_key]
-        return self.type_adaptor.core_schema["choices"][discriminator_value]["schema"]["schema"]["cls"]
+        value = data.get(self.discriminator_key)
+        branch = self.discriminator_table.get(str(getattr(value, "value", value)))
+        if branch is None:
+            raise ValueError(
+                f"Unknown discriminator choice {value!r} for `{self.discriminator_key}`,"
+                f" expected one of the following: {'|'.join(self.discriminator_choices)}"
+            )
+        return branch
+
+    def discriminate_type(
+        self,
+        data: Mapping[str, Any] | None = None,
+    ) -> type[T]:
+        """Determine the specific type to use based on the discriminator value.
+
+        Pass the raw data when it has already been read, to avoid reading it again.
+        """
+        if self.discriminator is None:
+            return self.type
+        return self.discriminate(self.load_raw() if data is None else data)
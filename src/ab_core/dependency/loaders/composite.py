@@ -0,0 +1,213 @@
+"""Layered loader merging several configuration sources."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, override
+
+from pydantic import BaseModel, model_validator
+
+from ab_core.dependency.environ import ENVIRON_INDEX, EnvironSnapshot
+from ab_core.dependency.files import FILE_CACHE, load_document, lookup_key_path, parse_dotenv
+from ab_core.dependency.pydanticize import EnvLoadPlan, cached_env_plan
+from ab_core.dependency.schema.file_format import FileFormat
+from ab_core.dependency.schema.loader_type import LoaderSource
+from ab_core.dependency.utils import apply_suffix, extract_env_items, to_env_prefix
+
+from .base import ObjectLoaderBase, T
+
+
+class CompositeSource(BaseModel, ABC):
+    """A source of raw data for :class:`CompositeLoader`."""
+
+    @abstractmethod
+    def load_tree(
+        self,
+        loader: "CompositeLoader",
+        environ: EnvironSnapshot,
+    ) -> Mapping[str, Any] | None:
+        """Return the data shaped for the loader's type, or ``None`` if the source is empty.
+
+        The returned mapping may be shared, and must not be mutated.
+        """
+        ...
+
+
+class EnvironmentSource(CompositeSource):
+    """Environment variables under a prefix, as read by :class:`ObjectLoaderEnvironment`."""
+
+    # defaults to the loader's prefix, inferred from the type name
+    env_prefix: str | None = None
+
+    @override
+    def load_tree(
+        self,
+        loader: "CompositeLoader",
+        environ: EnvironSnapshot,
+    ) -> Mapping[str, Any] | None:
+        """Return the prefixed environment variables, shaped by the loader's load plan."""
+        prefix = self.env_prefix or loader.env_prefix
+        return loader.build_tree(extract_env_items(environ.with_prefix(apply_suffix(prefix, "_")), prefix))
+
+
+class DotenvSource(CompositeSource):
+    """Variables from a ``.env`` file, named as in the environment.
+
+    The parsed file is cached until it changes on disk. A missing file is
+    skipped, unless `required`.
+    """
+
+    path: str
+    # defaults to the loader's prefix, inferred from the type name
+    env_prefix: str | None = None
+    required: bool = False
+
+    @override
+    def load_tree(
+        self,
+        loader: "CompositeLoader",
+        environ: EnvironSnapshot,
+    ) -> Mapping[str, Any] | None:
+        """Return the prefixed variables of the file, shaped by the loader's load plan."""
+        try:
+            variables = FILE_CACHE.load(self.path, parse_dotenv)
+        except FileNotFoundError:
+            if self.required:
+                raise
+            return None
+        return loader.build_tree(extract_env_items(variables, self.env_prefix or loader.env_prefix))
+
+
+class FileSource(CompositeSource):
+    """A section of a JSON or TOML file, as read by :class:`LoaderFile`.
+
+    A missing file is skipped, unless `required`.
+    """
+
+    path: str
+    # dot-separated path of the section to load, e.g. "services.db"; the whole file if unset
+    key: str | None = None
+    # inferred from the file suffix if unset
+    format: FileFormat | None = None
+    required: bool = True
+
+    @override
+    def load_tree(
+        self,
+        loader: "CompositeLoader",
+        environ: EnvironSnapshot,
+    ) -> Mapping[str, Any] | None:
+        """Return the section of the parsed file at the configured key."""
+        try:
+            return lookup_key_path(load_document(self.path, self.format), self.key)
+        except FileNotFoundError:
+            if self.required:
+                raise
+            return None
+
+
+class DefaultsSource(CompositeSource):
+    """Values given in code, shaped like the type."""
+
+    values: dict[str, Any]
+
+    @override
+    def load_tree(
+        self,
+        loader: "CompositeLoader",
+        environ: EnvironSnapshot,
+    ) -> Mapping[str, Any] | None:
+        """Return the configured values."""
+        return self.values
+
+
+def merge_trees(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
+    """Deep-merge `override` onto `base`, without mutating either.
+
+    Mappings are merged key by key; any other value in `override`, lists
+    included, replaces the value in `base`.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(value, Mapping) and isinstance(current, Mapping):
+            merged[key] = merge_trees(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class CompositeLoader(ObjectLoaderBase[T]):
+    """Load structured objects from several sources, layered by precedence.
+
+    Sources are listed from highest to lowest precedence. Each is shaped
+    for the type, then all are deep-merged, so a source only needs to
+    provide the fields it overrides, and the result is validated once.
+
+    Example::
+
+        CompositeLoader[AppConfig](
+            sources=[
+                EnvironmentSource(),
+                DotenvSource(path=".env"),
+                FileSource(path="config.json"),
+                DefaultsSource(values={"log_level": "INFO"}),
+            ]
+        )
+    """
+
+    # These get pulled from env or you can override in code:
+    source: Literal[LoaderSource.COMPOSITE] = LoaderSource.COMPOSITE
+
+    sources: list[CompositeSource]
+    # prefix for environment-style sources that do not set their own; inferred from the type name
+    env_prefix: str | None = None
+
+    @model_validator(mode="after")
+    def default_env_prefix(self):
+        """Populate a default prefix from the inferred alias name."""
+        if self.env_prefix is None:
+            self.env_prefix = to_env_prefix(self.alias_name)
+        return self
+
+    @override
+    def load_raw(
+        self,
+    ) -> dict[str, Any]:
+        """Merge the data of every source into one tree."""
+        return self.load_raw_from(ENVIRON_INDEX.current())
+
+    @override
+    def load_raw_from(
+        self,
+        environ: EnvironSnapshot,
+    ) -> dict[str, Any]:
+        """Merge the data of every source into one tree, reading the environment from `environ`."""
+        merged: dict[str, Any] = {}
+        for source in reversed(self.sources):  # lowest precedence first
+            tree = source.load_tree(self, environ)
+            if tree:
+                merged = merge_trees(merged, tree)
+
+        if self.discriminator_key and not merged.get(self.discriminator_key) and self.default_discriminator_value:
+            merged[self.discriminator_key] = str(self.default_discriminator_value)
+        return merged
+
+    @override
+    def restructure(
+        self,
+        data: dict[str, Any],
+    ) -> Any:
+        """Return the merged tree, already shaped for the type by its sources."""
+        return data
+
+    def build_tree(self, items: Mapping[str, Any]) -> Any:
+        """Shape flat, prefix-stripped environment-style keys for the type."""
+        if not items:
+            return None
+        return self.load_plan.build(items)
+
+    @cached_property
+    def load_plan(self) -> EnvLoadPlan:
+        """The environment load plan compiled for the type."""
+        return cached_env_plan(self.type)
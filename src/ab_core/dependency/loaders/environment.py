@@ -1,8 +1,8 @@
 """Environment-backed scalar loader implementation."""
 
-import os
 from typing import Any, Literal, override
 
+from ab_core.dependency.environ import ENVIRON_INDEX, EnvironSnapshot
 from ab_core.dependency.schema.loader_type import LoaderSource
 
 from .base import LoaderBase, T
@@ -25,4 +25,12 @@ class LoaderEnvironment(LoaderBase[T]):
         self,
     ) -> Any:
         """Return the raw string value from the configured environment key."""
-        return os.getenv(self.key)
+        return self.load_raw_from(ENVIRON_INDEX.current())
+
+    @override
+    def load_raw_from(
+        self,
+        environ: EnvironSnapshot,
+    ) -> Any:
+        """Return the raw string value of the configured key in `environ`."""
+        return environ.get(self.key)
@@ -1,12 +1,14 @@
 """Environment-backed object loader implementation."""
 
-import os
+from functools import cached_property
 from typing import Any, Literal, override
 
 from pydantic import model_validator
 
+from ab_core.dependency.environ import ENVIRON_INDEX, EnvironSnapshot
+from ab_core.dependency.pydanticize import EnvLoadPlan, cached_env_plan
 from ab_core.dependency.schema.loader_type import LoaderSource
-from ab_core.dependency.utils import extract_env_tree, to_env_prefix
+from ab_core.dependency.utils import apply_suffix, extract_env_items, to_env_prefix
 
 from .base import ObjectLoaderBase, T
 
@@ -15,7 +17,7 @@ class ObjectLoaderEnvironment(ObjectLoaderBase[T]):
     """Load structured objects from environment variables.
 
     Data is collected using a configurable prefix and reshaped to match
-    the target model schema.
+    the target model schema by a load plan compiled once per type.
     """
 
     # These get pulled from env or you can override in code:
@@ -34,16 +36,24 @@ class ObjectLoaderEnvironment(ObjectLoaderBase[T]):
     def load_raw(
         self,
     ) -> dict[str, Any]:
-        """Build a nested dictionary from environment keys for model parsing."""
-        tree = extract_env_tree(
-            os.environ,
+        """Collect prefixed environment keys into a flat mapping for the load plan."""
+        return self.load_raw_from(ENVIRON_INDEX.current())
+
+    @override
+    def load_raw_from(
+        self,
+        environ: EnvironSnapshot,
+    ) -> dict[str, Any]:
+        """Collect prefixed keys from `environ` into a flat mapping for the load plan."""
+        items = extract_env_items(
+            environ.with_prefix(apply_suffix(self.env_prefix, "_")),
             self.env_prefix,
         )
 
         if self.discriminator_key:
-            if not tree.get(self.discriminator_key):
+            if not items.get(self.discriminator_key):
                 if self.default_discriminator_value:
-                    tree[self.discriminator_key] = str(self.default_discriminator_value)
+                    items[self.discriminator_key] = str(self.default_discriminator_value)
                 else:
                     raise ValueError(
                         f"No discriminator choice provided for `{self.discriminator_key}`, loading"
@@ -52,4 +62,17 @@ class ObjectLoaderEnvironment(ObjectLoaderBase[T]):
                         f" one of the following: {'|'.join(self.discriminator_choices)}"
                     )
 
-        return tree
+        return items
+
+    @override
+    def restructure(
+        self,
+        data: dict[str, Any],
+    ) -> Any:
+        """Assemble the flat environment mapping using the compiled load plan."""
+        return self.load_plan.build(data)
+
+    @cached_property
+    def load_plan(self) -> EnvLoadPlan:
+        """The environment load plan compiled for the type."""
+        return cached_env_plan(self.type)
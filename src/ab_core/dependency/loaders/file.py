@@ -0,0 +1,35 @@
+"""Structured-file-backed loader implementation."""
+
+from typing import Any, Literal, override
+
+from ab_core.dependency.files import load_document, lookup_key_path
+from ab_core.dependency.schema.file_format import FileFormat
+from ab_core.dependency.schema.loader_type import LoaderSource
+
+from .base import LoaderBase, T
+
+
+class LoaderFile(LoaderBase[T]):
+    """Load a value from a JSON or TOML file.
+
+    The file is parsed once and cached until it changes on disk, so several
+    loaders may read different sections of one file by `key` without
+    parsing it again. A missing `key` loads as empty, falling back to
+    `default_value`.
+    """
+
+    # These get pulled from env or you can override in code:
+    source: Literal[LoaderSource.FILE] = LoaderSource.FILE
+
+    path: str
+    # dot-separated path of the section to load, e.g. "services.db"; the whole file if unset
+    key: str | None = None
+    # inferred from the file suffix if unset
+    format: FileFormat | None = None
+
+    @override
+    def load_raw(
+        self,
+    ) -> Any:
+        """Return the section of the parsed file at the configured key."""
+        return lookup_key_path(load_document(self.path, self.format), self.key)
@@ -0,0 +1,77 @@
+"""Secrets-directory-backed object loader implementation."""
+
+from functools import cached_property
+from typing import Any, Literal, override
+
+from ab_core.dependency.files import FILE_CACHE, parse_secret
+from ab_core.dependency.pydanticize import EnvLoadPlan, cached_env_plan
+from ab_core.dependency.schema.loader_type import LoaderSource
+from ab_core.dependency.utils import apply_suffix, check_key_collisions
+
+from .base import ObjectLoaderBase, T
+
+
+class ObjectLoaderSecrets(ObjectLoaderBase[T]):
+    """Load structured objects from a directory with one file per field.
+
+    This matches Docker and Kubernetes secret mounts. Nested fields map to
+    subdirectories or underscore-joined file names, e.g. ``database/password``
+    or ``database_password``, the same way environment variables are
+    reshaped by :class:`ObjectLoaderEnvironment`. Files are cached until
+    they change on disk, so unchanged secrets are not read again.
+    """
+
+    # These get pulled from env or you can override in code:
+    source: Literal[LoaderSource.SECRETS] = LoaderSource.SECRETS
+
+    secrets_dir: str = "/run/secrets"
+    # when set, only files named with this prefix are read, e.g. "oauth" for "oauth_client_id"
+    prefix: str | None = None
+
+    @override
+    def load_raw(
+        self,
+    ) -> dict[str, Any]:
+        """Collect the secret files into a flat mapping for the load plan."""
+        try:
+            files = FILE_CACHE.scan(self.secrets_dir)
+        except FileNotFoundError:  # nothing mounted, load as empty
+            files = {}
+
+        prefix = apply_suffix(self.prefix.lower(), "_") if self.prefix else ""
+        items: dict[str, Any] = {}
+        for parts, path in files.items():
+            key = "_".join(parts).lower()
+            if not key.startswith(prefix):
+                continue
+            key = key[len(prefix) :]
+            if key in items:
+                raise ValueError(
+                    f"Secret collision: key {key!r} is defined by more than one file in {self.secrets_dir}."
+                )
+            items[key] = FILE_CACHE.load(path, parse_secret)
+        check_key_collisions(items)
+
+        if self.discriminator_key and not items.get(self.discriminator_key):
+            if not self.default_discriminator_value:
+                raise ValueError(
+                    f"No discriminator choice provided for `{self.discriminator_key}`."
+                    f" `{prefix}{self.discriminator_key}` in {self.secrets_dir} should contain"
+                    f" one of the following: {'|'.join(self.discriminator_choices)}"
+                )
+            items[self.discriminator_key] = str(self.default_discriminator_value)
+
+        return items
+
+    @override
+    def restructure(
+        self,
+        data: dict[str, Any],
+    ) -> Any:
+        """Assemble the flat secrets mapping using the compiled load plan."""
+        return self.load_plan.build(data)
+
+    @cached_property
+    def load_plan(self) -> EnvLoadPlan:
+        """The load plan compiled for the type."""
+        return cached_env_plan(self.type)
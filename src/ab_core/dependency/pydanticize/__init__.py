@@ -1,12 +1,21 @@
 """Pydanticize module for dependency management."""
 
 from .cast.helpers import cached_type_adapter, is_supported_by_pydantic, pydanticize_object, pydanticize_type
-from .pydanticize import pydanticize_data
+from .construct import cached_trusted_constructor, compile_trusted_constructor
+from .plan import EnvLoadPlan, cached_env_plan, compile_env_plan
+from .pydanticize import cached_reshaper, compile_reshaper, pydanticize_data
 
 __all__ = [
     pydanticize_data,
+    compile_reshaper,
+    cached_reshaper,
     pydanticize_type,
     pydanticize_object,
     cached_type_adapter,
     is_supported_by_pydantic,
+    EnvLoadPlan,
+    compile_env_plan,
+    cached_env_plan,
+    compile_trusted_constructor,
+    cached_trusted_constructor,
 ]
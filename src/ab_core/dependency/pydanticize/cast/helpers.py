@@ -1,37 +1,41 @@
 """Helpers for casting objects to Pydantic models using type plugins."""
 
 import inspect
-from collections.abc import Callable
 from functools import cache
-from typing import ParamSpec, TypeVar, cast
+from typing import Any
 
 from pydantic import TypeAdapter
 
-from .adaptors.attrs import HAS_ATTRS, AttrsPlugin
+from ab_core.dependency.stats import counted_cache
+
 from .adaptors.base import BaseTypePlugin
-from .adaptors.unset import UnsetStripPlugin
 
-# ---------- typed cache wrapper ----------
-P = ParamSpec("P")
-R = TypeVar("R")
 
+@cache
+def load_plugins() -> list[BaseTypePlugin]:
+    """Instantiate the available type plugins, importing attrs only now."""
+    from .adaptors.attrs import HAS_ATTRS, AttrsPlugin
+    from .adaptors.unset import UnsetStripPlugin
 
-def typed_cache[**P, R](func: Callable[P, R]) -> Callable[P, R]:
-    """Wrap functools.cache while preserving callable type information."""
-    return cast(Callable[P, R], cache(func))
+    plugins: list[BaseTypePlugin] = []
+    if HAS_ATTRS:
+        plugins.append(AttrsPlugin())
+        # This UnsetStripPlugin is a patch for ab_client 'Unset' types, which are not
+        # supported by pydantic
+        plugins.append(UnsetStripPlugin())
+    return plugins
 
 
-PLUGINS: list[BaseTypePlugin] = []
-if HAS_ATTRS:
-    PLUGINS.append(AttrsPlugin())
-    # This UnsetStripPlugin is a patch for ab_client 'Unset' types, which are not
-    # supported by pydantic
-    PLUGINS.append(UnsetStripPlugin())
+def __getattr__(name: str) -> Any:
+    """Expose ``PLUGINS`` lazily, so importing this module skips attrs."""
+    if name == "PLUGINS":
+        return load_plugins()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def lookup_plugin(obj: object) -> BaseTypePlugin | None:
     """Find a plugin that can handle the given object."""
-    for plugin in PLUGINS:
+    for plugin in load_plugins():
         if plugin.matches(obj):
             return plugin
 
@@ -46,7 +50,7 @@ def try_type_adaptor(_type: object) -> TypeAdapter | Exception:
         return e
 
 
-@typed_cache
+@counted_cache("type_adapters")
 def cached_try_type_adapter(_type: object) -> TypeAdapter:
     """Return a cached TypeAdapter or exception for the given type."""
     return try_type_adaptor(_type)
@@ -71,7 +75,7 @@ def is_supported_by_pydantic(_type: object) -> bool:
         return False
 
 
-@typed_cache
+@counted_cache("pydanticized_types")
 def pydanticize_type[T](_type: type[T]) -> type[T]:
     """Convert an type to a Pydantic-compatible type."""
     # 1. try pydantic native support for the object
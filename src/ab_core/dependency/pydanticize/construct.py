@@ -0,0 +1,190 @@
+"""Compiled constructors building trusted data into models without validation.
+
+Data from a trusted source, e.g. a snapshot of previously validated
+models, is already shaped like the type. A constructor is compiled once
+per type by walking its core schema, and builds each nested model as
+``model_construct`` would, choosing discriminated-union branches by their
+tag.
+Everything else, including field validators, is skipped: values are used
+as given.
+"""
+
+from collections.abc import Callable, Mapping
+from enum import Enum
+from functools import partial
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core.core_schema import CoreSchema
+
+from ab_core.dependency.stats import counted_cache
+
+from .cast.helpers import cached_type_adapter
+
+Constructor = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class _ConstructorCompiler:
+    """Walk a core schema once, producing linked constructors."""
+
+    def __init__(self):
+        self.definitions: dict[str, CoreSchema] = {}
+        # constructors of referenced definitions, filled in when linked
+        self.cells: dict[str, list[Constructor]] = {}
+
+    def compile(self, schema: CoreSchema) -> Constructor:
+        if "ref" in schema:
+            self.definitions.setdefault(schema["ref"], schema)
+        return self._compile(schema)
+
+    def _compile(self, schema: CoreSchema) -> Constructor:  # noqa: C901
+        schema_type = schema.get("type")
+
+        if schema_type == "model":
+            return self._compile_model(schema)
+        if schema_type == "tagged-union":
+            return self._compile_tagged_union(schema)
+        if schema_type == "definitions":
+            for definition in schema["definitions"]:
+                self.definitions[definition["ref"]] = definition  # compiled when linked, if referenced
+            return self.compile(schema["schema"])
+        if schema_type == "definition-ref":
+            cell = self.cells.setdefault(schema["schema_ref"], [_identity])
+            return lambda value: cell[0](value)
+        if schema_type == "nullable":
+            inner = self.compile(schema["schema"])
+            if inner is _identity:
+                return _identity
+            return lambda value: None if value is None else inner(value)
+        if schema_type == "list":
+            item = self.compile(schema["items_schema"])
+            if item is _identity:
+                return _identity
+            return lambda value: [item(entry) for entry in value] if isinstance(value, list | tuple) else value
+        if schema_type == "dict":
+            item = self.compile(schema["values_schema"])
+            if item is _identity:
+                return _identity
+            return lambda value: (
+                {key: item(entry) for key, entry in value.items()} if isinstance(value, Mapping) else value
+            )
+        if "schema" in schema:  # model-field, default, function-* wrappers, ...
+            return self.compile(schema["schema"])
+        return _identity
+
+    def _compile_model(self, schema: CoreSchema) -> Constructor:
+        cls = schema["cls"]
+        inner = schema["schema"]
+
+        if schema.get("root_model"):
+            root = self.compile(inner)
+            return lambda value: value if isinstance(value, cls) else cls.model_construct(root(value))
+
+        fields: dict[str, Constructor] = {}
+        if inner.get("type") == "model-fields":
+            for name, field in inner["fields"].items():
+                fields[name] = constructor = self.compile(field)
+                alias = field.get("validation_alias")
+                if isinstance(alias, str):
+                    fields[alias] = constructor
+
+        if (
+            getattr(cls, "__pydantic_post_init__", None)
+            or cls.model_config.get("extra") == "allow"
+            or set(fields) != set(cls.model_fields)
+        ):
+            # post-init hooks, private attributes, extra fields or aliases: leave it to pydantic
+            def construct_model(value: Any) -> Any:
+                if not isinstance(value, Mapping):
+                    return value
+                return cls.model_construct(
+                    **{key: fields[key](entry) if key in fields else entry for key, entry in value.items()}
+                )
+
+            return construct_model
+
+        return _compile_plain_model(cls, fields)
+
+    def _compile_tagged_union(self, schema: CoreSchema) -> Constructor:
+        discriminator = schema["discriminator"]
+        if not isinstance(discriminator, str):
+            # callable or path discriminators cannot be resolved from the data
+            return _identity
+
+        choices: dict[Any, Constructor] = {}
+        for tag, choice in schema["choices"].items():
+            choices[tag] = choices[getattr(tag, "value", tag)] = self.compile(choice)
+
+        def construct_union(value: Any) -> Any:
+            if isinstance(value, Mapping):
+                choice = choices.get(value.get(discriminator))
+                if choice is not None:
+                    return choice(value)
+            return value
+
+        return construct_union
+
+    def link(self) -> None:
+        # compiling a definition may reference further definitions
+        linked: set[str] = set()
+        while pending := [ref for ref in self.cells if ref not in linked]:
+            for ref in pending:
+                self.cells[ref][0] = self._compile(self.definitions[ref])
+                linked.add(ref)
+
+
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+
+def _compile_plain_model(cls: type[BaseModel], fields: dict[str, Constructor]) -> Constructor:
+    """Construct a model with no post-init hooks directly, as ``model_construct`` would, but faster."""
+    slots: list[tuple[str, Constructor, Callable[[], Any] | None]] = []
+    for name, info in cls.model_fields.items():
+        if info.is_required():
+            get_default = None  # left out when missing, as `model_construct` does
+        elif info.default_factory is None and isinstance(info.default, _IMMUTABLE):
+            get_default = lambda default=info.default: default  # noqa: E731
+        else:
+            get_default = partial(info.get_default, call_default_factory=True)
+        slots.append((name, fields[name], get_default))
+
+    new = cls.__new__
+    setattr_ = object.__setattr__
+
+    def construct_model(value: Any) -> Any:
+        if not isinstance(value, Mapping):
+            return value
+        data: dict[str, Any] = {}
+        fields_set: set[str] = set()
+        for name, constructor, get_default in slots:
+            if name in value:
+                data[name] = constructor(value[name])
+                fields_set.add(name)
+            elif get_default is not None:
+                data[name] = get_default()
+        instance = new(cls)
+        setattr_(instance, "__dict__", data)
+        setattr_(instance, "__pydantic_fields_set__", fields_set)
+        setattr_(instance, "__pydantic_extra__", None)
+        setattr_(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct_model
+
+
+def compile_trusted_constructor(core_schema: CoreSchema) -> Constructor:
+    """Compile a constructor building trusted data for the given core schema."""
+    compiler = _ConstructorCompiler()
+    constructor = compiler.compile(core_schema)
+    compiler.link()
+    return constructor
+
+
+@counted_cache("trusted_constructors")
+def cached_trusted_constructor(_type: object) -> Constructor:
+    """Return the cached trusted-data constructor for a pydantic-supported type."""
+    return compile_trusted_constructor(cached_type_adapter(_type).core_schema)
@@ -0,0 +1,311 @@
+"""Compiled load plans mapping flat environment keys onto core schemas.
+
+A plan is compiled once per target type by walking its core schema, and
+turns a flat mapping of lower-cased, prefix-stripped environment keys
+(e.g. ``{"database_host": "localhost"}``) into data shaped for
+validation in a single pass, without building and reshaping an
+intermediate tree.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic_core.core_schema import CoreSchema
+
+from ab_core.dependency.stats import counted_cache
+
+from .cast.helpers import cached_type_adapter
+from .pydanticize import Reshaper, _normalise_indexed_list, compile_reshaper
+
+KEY_DELIM = "_"
+
+Segments = tuple[str, ...]
+Items = list[tuple[Segments, Any]]
+
+
+def _insert(tree: dict[str, Any], segments: Segments, value: Any) -> None:
+    """Insert `value` at `segments`, rejecting value/object collisions."""
+    *parents, leaf = segments
+    for key in parents:
+        child = tree.setdefault(key, {})
+        if not isinstance(child, dict):
+            raise ValueError(f"Environment variable collision: key {key!r} is already defined as a value.")
+        tree = child
+    if isinstance(tree.get(leaf), dict):
+        raise ValueError(f"Environment variable collision: key {leaf!r} is already defined as an object.")
+    tree[leaf] = value
+
+
+def _nest(items: Items) -> Any:
+    """Assemble items that the schema does not describe into a nested tree."""
+    if len(items) == 1 and not items[0][0]:
+        return items[0][1]
+
+    tree: dict[str, Any] = {}
+    for segments, value in items:
+        if not segments:
+            raise ValueError("Environment variable collision: a value is also defined as an object.")
+        _insert(tree, segments, value)
+    return tree
+
+
+class PlanNode(ABC):
+    """A compiled step assembling schema-shaped data from flat items."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def build(self, items: Items) -> Any:
+        """Assemble the items routed to this node."""
+        ...
+
+    def build_flat(self, data: Mapping[str, Any]) -> Any:
+        """Assemble a flat mapping of underscore-joined keys."""
+        return self.build([(tuple(key.split(KEY_DELIM)), value) for key, value in data.items()])
+
+
+class LeafNode(PlanNode):
+    """A schema node with no environment-specific reshaping."""
+
+    __slots__ = ()
+
+    def build(self, items: Items) -> Any:
+        """Return the value as-is, or nest deeper keys verbatim."""
+        return _nest(items)
+
+
+class RefNode(PlanNode):
+    """A `definition-ref` node, linked to its target once compiled."""
+
+    __slots__ = ("ref", "target")
+
+    def __init__(self, ref: str):
+        """Store the definition reference to link later."""
+        self.ref = ref
+        self.target: PlanNode | None = None
+
+    def build(self, items: Items) -> Any:
+        """Delegate to the linked definition."""
+        return self.target.build(items)
+
+    def build_flat(self, data: Mapping[str, Any]) -> Any:
+        """Delegate to the linked definition."""
+        return self.target.build_flat(data)
+
+
+class ModelFieldsNode(PlanNode):
+    """Route items to model fields by their underscore-joined names."""
+
+    __slots__ = ("fields", "depth", "leaves")
+
+    def __init__(self, fields: dict[str, PlanNode]):
+        """Index fields by name, tracking the longest name in segments."""
+        self.fields = fields
+        self.depth = max((name.count(KEY_DELIM) + 1 for name in fields), default=0)
+        # fields whose value is used as-is; a key naming one exactly is its whole value
+        self.leaves = frozenset(name for name, node in fields.items() if isinstance(node, LeafNode))
+
+    def build_flat(self, data: Mapping[str, Any]) -> Any:
+        """Assemble a flat mapping, copying keys that name a leaf field exactly.
+
+        Only the remaining keys are split and routed. This is the common
+        case for wide models, whose keys mostly name scalar fields.
+        """
+        leaves = self.leaves
+        direct: dict[str, Any] = {}
+        rest: Items = []
+        for key, value in data.items():
+            if key in leaves:
+                direct[key] = value
+            else:
+                rest.append((tuple(key.split(KEY_DELIM)), value))
+        if not rest:
+            return direct
+
+        built = self.build(rest)
+        if not isinstance(built, dict) or not direct.keys().isdisjoint(built):
+            # a leaf is also the parent of other keys; let the full routing report it
+            return self.build([(tuple(key.split(KEY_DELIM)), value) for key, value in data.items()])
+        built.update(direct)
+        return built
+
+    def build(self, items: Items) -> Any:
+        """Group items by field (longest name first) and build each field."""
+        if len(items) == 1 and not items[0][0]:
+            return items[0][1]
+
+        fields = self.fields
+        grouped: dict[str, Items] = {}
+        extras: Items = []
+        single = self.depth == 1  # no field name spans several segments
+        for segments, value in items:
+            if not segments:
+                raise ValueError("Environment variable collision: an object is also defined as a value.")
+            if single:
+                if segments[0] in fields:
+                    grouped.setdefault(segments[0], []).append((segments[1:], value))
+                else:
+                    extras.append((segments, value))
+                continue
+            for size in range(min(len(segments), self.depth), 0, -1):
+                name = KEY_DELIM.join(segments[:size])
+                if name in fields:
+                    grouped.setdefault(name, []).append((segments[size:], value))
+                    break
+            else:
+                extras.append((segments, value))
+
+        data = _nest(extras) if extras else {}
+        leaves = self.leaves
+        for name, field_items in grouped.items():
+            if name in leaves and len(field_items) == 1 and not field_items[0][0]:
+                data[name] = field_items[0][1]
+            else:
+                data[name] = fields[name].build(field_items)
+        return data
+
+
+class ListNode(PlanNode):
+    """Build lists from JSON values or contiguous indexed keys."""
+
+    __slots__ = ("schema", "item", "definitions", "reshaper")
+
+    def __init__(self, schema: CoreSchema, item: PlanNode, definitions: dict[str, CoreSchema]):
+        """Store the list schema (for JSON values) and the item plan."""
+        self.schema = schema
+        self.item = item
+        self.definitions = definitions
+        # compiled on first use, once every definition of the plan is known
+        self.reshaper: Reshaper | None = None
+
+    def build(self, items: Items) -> Any:
+        """Decode a JSON list, or collect `<index>_...` keys into a list."""
+        if len(items) == 1 and not items[0][0]:
+            value = items[0][1]
+            if isinstance(value, str):
+                value = json.loads(value)
+            if self.reshaper is None:
+                self.reshaper = compile_reshaper(self.schema, definitions=self.definitions)
+            return self.reshaper(value)
+
+        grouped: dict[str, Items] = {}
+        for segments, value in items:
+            if not segments:
+                raise ValueError("Environment variable collision: a list is defined both as a value and by index.")
+            grouped.setdefault(segments[0], []).append((segments[1:], value))
+
+        return [self.item.build(entry) for entry in _normalise_indexed_list(grouped)]
+
+
+class TaggedUnionNode(PlanNode):
+    """Select a union branch by discriminator and route its prefixed keys."""
+
+    __slots__ = ("discriminator", "tag_segments", "choices")
+
+    def __init__(self, discriminator: str, choices: dict[str, PlanNode]):
+        """Index each choice by tag, along with its lower-cased key prefix."""
+        self.discriminator = discriminator
+        self.tag_segments = tuple(discriminator.split(KEY_DELIM))
+        self.choices = {tag: (tuple(tag.lower().split(KEY_DELIM)), node) for tag, node in choices.items()}
+
+    def build(self, items: Items) -> Any:
+        """Build the chosen branch from direct and branch-prefixed keys."""
+        tag = next((value for segments, value in items if segments == self.tag_segments), None)
+        if tag not in self.choices:
+            # missing or unknown tag, leave it to validation to report
+            return _nest(items)
+
+        prefix, node = self.choices[tag]
+        size = len(prefix)
+        direct: dict[Segments, Any] = {}
+        branch: dict[Segments, Any] = {}
+        for segments, value in items:
+            if len(segments) > size and segments[:size] == prefix:
+                branch[segments[size:]] = value
+            else:
+                direct[segments] = value
+
+        # branch values take precedence over direct ones
+        return node.build(list((direct | branch).items()))
+
+
+class _PlanCompiler:
+    """Walk a core schema once, producing linked plan nodes."""
+
+    def __init__(self):
+        self.definitions: dict[str, CoreSchema] = {}
+        self.nodes: dict[str, PlanNode] = {}
+        self.refs: list[RefNode] = []
+
+    def compile(self, schema: CoreSchema) -> PlanNode:
+        node = self._compile(schema)
+        if "ref" in schema:
+            self.definitions.setdefault(schema["ref"], schema)
+            self.nodes.setdefault(schema["ref"], node)
+        return node
+
+    def _compile(self, schema: CoreSchema) -> PlanNode:  # noqa: C901
+        schema_type = schema.get("type")
+
+        if schema_type == "model-fields":
+            return ModelFieldsNode({name: self.compile(field) for name, field in schema["fields"].items()})
+        if schema_type == "list":
+            return ListNode(schema, self.compile(schema["items_schema"]), self.definitions)
+        if schema_type == "tagged-union":
+            discriminator = schema["discriminator"]
+            if not isinstance(discriminator, str):
+                # callable or path discriminators cannot be routed by key
+                return LeafNode()
+            return TaggedUnionNode(
+                discriminator,
+                {str(getattr(tag, "value", tag)): self.compile(choice) for tag, choice in schema["choices"].items()},
+            )
+        if schema_type == "definition-ref":
+            node = RefNode(schema["schema_ref"])
+            self.refs.append(node)
+            return node
+        if schema_type == "definitions":
+            for definition in schema["definitions"]:
+                self.compile(definition)
+            return self.compile(schema["schema"])
+        if "schema" in schema:
+            return self.compile(schema["schema"])
+        return LeafNode()
+
+    def link(self) -> None:
+        for node in self.refs:
+            node.target = self.nodes[node.ref]
+
+
+class EnvLoadPlan:
+    """A per-type plan turning flat environment keys into validation input.
+
+    Keys are the lower-cased environment variable names with the loader
+    prefix removed, so ``APP_CONFIG_DATABASE_HOST`` reaches the plan for
+    ``AppConfig`` as ``database_host``.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, core_schema: CoreSchema):
+        """Compile the plan for `core_schema`."""
+        compiler = _PlanCompiler()
+        self.root = compiler.compile(core_schema)
+        compiler.link()
+
+    def build(self, data: Mapping[str, Any]) -> Any:
+        """Assemble schema-shaped data from a flat key mapping."""
+        return self.root.build_flat(data)
+
+
+def compile_env_plan(core_schema: CoreSchema) -> EnvLoadPlan:
+    """Compile an environment load plan for the given core schema."""
+    return EnvLoadPlan(core_schema)
+
+
+@counted_cache("env_plans")
+def cached_env_plan(_type: object) -> EnvLoadPlan:
+    """Return the cached environment load plan for a pydantic-supported type."""
+    return compile_env_plan(cached_type_adapter(_type).core_schema)
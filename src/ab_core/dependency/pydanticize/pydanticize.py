@@ -1,16 +1,30 @@
-"""Reshape environment-derived payloads to match Pydantic core schemas."""
+"""Reshape environment-derived payloads to match Pydantic core schemas.
+
+A reshaper is compiled once per core schema by walking it, and is a tree
+of closures specialised to each schema node, with definition references
+linked ahead of time. Reshaping is then a chain of direct calls, with no
+dispatch on the schema type.
+"""
 
 import json
+import threading
+from collections.abc import Callable
 from typing import Any
 
 from pydantic_core.core_schema import CoreSchema
 
+Reshaper = Callable[[Any], Any]
+
+# upper bound on the number of core schemas with a compiled reshaper kept
+RESHAPER_CACHE_SIZE = 512
+
 
 def _clean_field(
     obj: dict[str, Any],
     field_path: list[str] | str,
     *,
     key_delim: str = "_",
+    inplace: bool = True,
 ) -> None:
     """Remove the branch specified by `field_path`.
 
@@ -26,6 +40,9 @@ def _clean_field(
         or a single string with keys joined by `key_delim`, e.g. "a_b_c".
     key_delim : str, default "_"
         Delimiter to split `field_path` when it is given as a string.
+    inplace : bool, default True
+        When False, nested dictionaries along the path are copied before
+        being modified, so only `obj` itself is changed.
 
     Examples
     --------
@@ -67,7 +84,9 @@ def _clean_field(
     else:
         child = obj[key]
         if isinstance(child, dict):
-            _clean_field(child, path[1:], key_delim=key_delim)
+            if not inplace:
+                child = obj[key] = dict(child)
+            _clean_field(child, path[1:], key_delim=key_delim, inplace=inplace)
             if not child:  # became empty → delete this branch
                 del obj[key]
 
@@ -77,6 +96,7 @@ def _align_field(
     field_name: str,
     *,
     key_delim: str = "_",
+    inplace: bool = True,
 ) -> None:
     # scenario 1, the whole key was defined in obj
     if field_name in obj:
@@ -96,7 +116,7 @@ def _align_field(
     # so we need to perform the cleaning. Since it is nested, there may be
     # other values under the same sub branch, so need to ensuure we don't
     # accidentally delete some overlapping data.
-    _clean_field(obj, field_name.split(key_delim))
+    _clean_field(obj, field_name.split(key_delim), inplace=inplace)
     obj[field_name] = next_value
 
 
@@ -109,160 +129,177 @@ def _normalise_indexed_list(obj: dict[str, Any]) -> list[Any]:
     return [obj[str(index)] for index in indexes]
 
 
-def pydanticize_model_fields(
-    obj: dict[str, Any],
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> dict[str, Any]:
-    """Transform all model fields according to their child schemas."""
-    fields = schema["fields"]
-    for field_name, field_schema in fields.items():
-        _align_field(obj, field_name)
-
-        if field_name not in obj:
-            continue
-
-        obj[field_name] = pydanticize_data(
-            obj.pop(field_name),
-            field_schema,
-            definition_map=definition_map,
-        )
-
-    return obj
-
-
-def pydanticize_model_field(
-    obj: dict[str, Any] | Any,
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> dict[str, Any] | Any:
-    """Transform a single model field using its nested schema."""
-    inner_schema = schema.get("schema")
-
-    if obj is not None and inner_schema is not None:
-        return pydanticize_data(
-            obj,
-            inner_schema,
-            definition_map=definition_map,
-        )
-
+def _identity(obj: Any) -> Any:
     return obj
 
 
-def pydanticize_list(
-    obj: list[Any] | dict[str, Any] | str | Any,
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> list[Any]:
-    """Normalize list-shaped input and transform each list item."""
-    if isinstance(obj, str):
-        obj = json.loads(obj)
-
-    if isinstance(obj, dict):
-        obj = _normalise_indexed_list(obj)
-
-    item_schema = schema["items_schema"]
-
-    return [
-        pydanticize_data(
-            item,
-            item_schema,
-            definition_map=definition_map,
-        )
-        for item in obj
-    ]
-
-
-def pydanticize_tagged_union(
-    obj: dict[str, Any],
-    schema: CoreSchema,
+class _ReshaperCompiler:
+    """Walk a core schema once, producing linked reshapers."""
+
+    def __init__(self, inplace: bool, definitions: dict[str, CoreSchema] | None = None):
+        self.inplace = inplace
+        self.definitions: dict[str, CoreSchema] = {} if definitions is None else definitions
+        # reshapers of referenced definitions, filled in when linked
+        self.cells: dict[str, list[Reshaper]] = {}
+
+    def compile(self, schema: CoreSchema) -> Reshaper:  # noqa: C901
+        schema_type = schema.get("type")
+
+        if schema_type == "model-field":
+            return self._compile_model_field(schema)
+        if schema_type == "model-fields":
+            return self._compile_model_fields(schema)
+        if schema_type == "list":
+            return self._compile_list(schema)
+        if schema_type == "tagged-union":
+            return self._compile_tagged_union(schema)
+        if schema_type == "definition-ref":
+            cell = self.cells.setdefault(schema["schema_ref"], [_identity])
+            return lambda obj: cell[0](obj)
+        if schema_type == "definitions":
+            for definition in schema["definitions"]:
+                self.definitions[definition["ref"]] = definition  # compiled when linked, if referenced
+            return self.compile(schema["schema"])
+        if "schema" in schema:
+            return self.compile(schema["schema"])
+        # already pydanticised
+        return _identity
+
+    def _compile_model_field(self, schema: CoreSchema) -> Reshaper:
+        inner_schema = schema.get("schema")
+        if inner_schema is None:
+            return _identity
+        inner = self.compile(inner_schema)
+        if inner is _identity:
+            return _identity
+        return lambda obj: obj if obj is None else inner(obj)
+
+    def _compile_model_fields(self, schema: CoreSchema) -> Reshaper:
+        """Transform all model fields according to their child schemas."""
+        inplace = self.inplace
+        # whether the field name spans several keys, and so may need aligning
+        fields = [(name, "_" in name, self.compile(field)) for name, field in schema["fields"].items()]
+
+        def reshape_model_fields(obj: Any) -> Any:
+            if not inplace and isinstance(obj, dict):
+                obj = dict(obj)
+            is_dict = isinstance(obj, dict)
+            for field_name, nested, reshape in fields:
+                if nested or not is_dict:
+                    _align_field(obj, field_name, inplace=inplace)
+                if field_name not in obj:
+                    continue
+                obj[field_name] = reshape(obj.pop(field_name))
+            return obj
+
+        return reshape_model_fields
+
+    def _compile_list(self, schema: CoreSchema) -> Reshaper:
+        """Normalize list-shaped input and transform each list item."""
+        item = self.compile(schema["items_schema"])
+
+        def reshape_list(obj: Any) -> list[Any]:
+            if isinstance(obj, str):
+                obj = json.loads(obj)
+            if isinstance(obj, dict):
+                obj = _normalise_indexed_list(obj)
+            return [item(entry) for entry in obj]
+
+        return reshape_list
+
+    def _compile_tagged_union(self, schema: CoreSchema) -> Reshaper:
+        """Flatten tagged-union payloads into the selected branch schema."""
+        inplace = self.inplace
+        discriminator = schema["discriminator"]
+        if not isinstance(discriminator, str):
+            # callable or path discriminators cannot be read from the payload
+            return _identity
+        choices = {tag: self.compile(choice) for tag, choice in schema["choices"].items()}
+
+        def reshape_tagged_union(obj: Any) -> Any:
+            discriminator_choice = obj[discriminator]
+            if not isinstance(discriminator_choice, str):
+                raise TypeError(
+                    f"Invalid Discriminator Choice. Expected {repr(str)}, found {repr(type(discriminator_choice))}."
+                )
+
+            # the name of the field on obj which points to values
+            discriminator_values_field = discriminator_choice.lower()
+
+            if not inplace:
+                obj = dict(obj)
+
+            # apply correction to field for discriminator choice
+            _align_field(obj, discriminator_values_field, inplace=inplace)
+
+            # extract the values and flatten, for pydantic
+            if discriminator_values_field in obj:
+                discriminator_values = obj.pop(discriminator_values_field)
+                if not isinstance(discriminator_values, dict):
+                    raise TypeError(
+                        f"Invalid Discriminator Body. Expected {repr(dict)}, found {repr(type(discriminator_values))}."
+                    )
+                return obj | choices[discriminator_choice](discriminator_values)
+
+            return obj
+
+        return reshape_tagged_union
+
+    def link(self) -> None:
+        # compiling a definition may reference further definitions
+        linked: set[str] = set()
+        while pending := [ref for ref in self.cells if ref not in linked]:
+            for ref in pending:
+                definition = self.definitions.get(ref)
+                self.cells[ref][0] = _unresolved(ref) if definition is None else self.compile(definition)
+                linked.add(ref)
+
+
+def _unresolved(ref: str) -> Reshaper:
+    def reshape_unresolved(_obj: Any) -> Any:
+        raise KeyError(ref)
+
+    return reshape_unresolved
+
+
+def compile_reshaper(
+    core_schema: CoreSchema,
     *,
-    definition_map: dict | None = None,
-) -> dict[str, Any]:
-    """Flatten tagged-union payloads into the selected branch schema."""
-    discriminator = schema["discriminator"]
-    discriminator_choice = obj[discriminator]
-    if not isinstance(discriminator_choice, str):
-        raise TypeError(
-            f"Invalid Discriminator Choice. Expected {repr(str)}, found {repr(type(discriminator_choice))}."
-        )
-
-    # the name of the field on obj which points to values
-    discriminator_values_field = discriminator_choice.lower()
-
-    # apply correction to field for discriminator choice
-    _align_field(obj, discriminator_values_field)
-
-    # extract the values and flatten, for pydantic
-    if discriminator_values_field in obj:
-        discriminator_values = obj.pop(discriminator_choice.lower())
-        if not isinstance(discriminator_values, dict):
-            raise TypeError(
-                f"Invalid Discriminator Body. Expected {repr(dict)}, found {repr(type(discriminator_values))}."
-            )
-        discriminator_choice_schema = schema["choices"][discriminator_choice]
-        pydanticized_body = pydanticize_data(
-            discriminator_values,
-            discriminator_choice_schema,
-            definition_map=definition_map,
-        )
-        return obj | pydanticized_body
-
-    return obj
+    inplace: bool = True,
+    definitions: dict[str, CoreSchema] | None = None,
+) -> Reshaper:
+    """Compile a reshaper for the given core schema.
 
+    `definitions` resolves references to definitions declared outside
+    `core_schema`, e.g. when it is part of a larger schema.
+    """
+    compiler = _ReshaperCompiler(inplace, None if definitions is None else dict(definitions))
+    reshaper = compiler.compile(core_schema)
+    compiler.link()
+    return reshaper
 
-def pydanticize_definitions(
-    obj: dict[str, Any],
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> dict[str, Any]:
-    """Build a definition lookup map and continue with the root schema."""
-    if definition_map is None:
-        definition_map = {}
-    definitions = schema["definitions"]
-    for definition in definitions:
-        definition_map[definition["ref"]] = definition
 
-    return pydanticize_data(
-        obj,
-        schema["schema"],
-        definition_map=definition_map,
-    )
+_reshapers: dict[tuple[int, bool], tuple[CoreSchema, Reshaper]] = {}
+_reshapers_lock = threading.Lock()
 
 
-def pydanticize_definition_ref(
-    obj: dict[str, Any],
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> dict[str, Any]:
-    """Resolve a definition-ref schema and transform data against it."""
-    schema_ref = schema["schema_ref"]
-    schema = definition_map[schema_ref]
-    return pydanticize_data(
-        obj,
-        schema,
-        definition_map=definition_map,
-    )
+def cached_reshaper(core_schema: CoreSchema, *, inplace: bool = True) -> Reshaper:
+    """Return the cached reshaper for a core schema, keyed by the schema's identity.
 
+    Core schemas are not hashable; the schema is kept alongside its
+    reshaper, so its identity cannot be reused while it is cached.
+    """
+    key = (id(core_schema), inplace)
+    cached = _reshapers.get(key)
+    if cached is not None and cached[0] is core_schema:
+        return cached[1]
 
-def pydanticize_child_schema(
-    obj: dict[str, Any],
-    schema: CoreSchema,
-    *,
-    definition_map: dict | None = None,
-) -> dict[str, Any]:
-    """Transform data using a nested `schema` member."""
-    field_schema = schema["schema"]
-    return pydanticize_data(
-        obj,
-        field_schema,
-        definition_map=definition_map,
-    )
+    reshaper = compile_reshaper(core_schema, inplace=inplace)
+    with _reshapers_lock:
+        if len(_reshapers) >= RESHAPER_CACHE_SIZE:
+            del _reshapers[next(iter(_reshapers))]  # evict the oldest
+        _reshapers[key] = (core_schema, reshaper)
+    return reshaper
 
 
 def pydanticize_data(
@@ -270,57 +307,16 @@ def pydanticize_data(
     core_schema: CoreSchema,
     *,
     definition_map: dict | None = None,
+    inplace: bool = True,
 ) -> dict[str, Any]:
-    """Dispatch transformation based on core schema type metadata."""
-    if definition_map is None:
-        definition_map = {}
-
-    if "type" in core_schema:
-        type = core_schema["type"]
-
-        if type == "model-field":
-            return pydanticize_model_field(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-        if type == "model-fields":
-            return pydanticize_model_fields(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-        if type == "list":
-            return pydanticize_list(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-        if type == "tagged-union":
-            return pydanticize_tagged_union(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-        if type == "definition-ref":
-            return pydanticize_definition_ref(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-        if type == "definitions":
-            return pydanticize_definitions(
-                obj,
-                core_schema,
-                definition_map=definition_map,
-            )
-
-    if "schema" in core_schema:
-        return pydanticize_child_schema(
-            obj,
-            core_schema,
-            definition_map=definition_map,
-        )
-
-    # already pydanticised
-    return obj
+    """Reshape `obj` to match the core schema, with a reshaper compiled once per schema.
+
+    By default dictionaries in `obj` are reshaped in place. With
+    ``inplace=False`` they are left untouched: each reshaped level is a
+    shallow copy, and nested dictionaries are only copied when modified.
+    `definition_map` resolves references to definitions declared outside
+    `core_schema`; a reshaper compiled with it is not cached.
+    """
+    if definition_map:
+        return compile_reshaper(core_schema, inplace=inplace, definitions=definition_map)(obj)
+    return cached_reshaper(core_schema, inplace=inplace)(obj)
@@ -0,0 +1,118 @@
+"""Hot reload of persisted dependencies.
+
+Persisted (``persist=True``) dependencies are built once per process.
+:func:`reload` re-reads their sources and rebuilds only those whose raw
+data changed, so e.g. a rotated secret is picked up without a restart.
+Instances already handed out are left untouched; later loads receive the
+rebuilt ones.
+
+Reloading is opt-in: call :func:`reload` directly, or use a
+:class:`Reloader` to trigger it on a signal or when files change.
+"""
+
+import logging
+import os
+import signal
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .files import file_stamp
+from .singleton import SingletonRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def reload() -> dict[Any, set[str]]:
+    """Rebuild the persisted dependencies whose sources changed.
+
+    Returns the paths that changed in the raw data of each rebuilt
+    dependency, keyed by its persistence key (usually its type).
+    """
+    return SingletonRegistry.reload()
+
+
+def _stamp_or_none(path: str) -> tuple[int, int, int] | None:
+    try:
+        return file_stamp(os.stat(path))
+    except OSError:
+        return None
+
+
+class Reloader:
+    """Triggers :func:`reload` on a signal or when watched files change.
+
+    Example::
+
+        reloader = Reloader().on_signal(signal.SIGHUP).watch("/run/secrets", "/etc/app/config.toml")
+        ...
+        reloader.stop()
+    """
+
+    def __init__(self, reload: Callable[[], Any] = reload):
+        """Create a reloader calling `reload` when triggered."""
+        self._reload = reload
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._previous_handlers: dict[int, Any] = {}
+
+    def trigger(self) -> None:
+        """Reload in a background thread, e.g. from a signal handler."""
+        threading.Thread(target=self._run, name="ab-dependency-reload", daemon=True).start()
+
+    def _run(self) -> None:
+        try:
+            self._reload()
+        except Exception:
+            logger.exception("Reloading persisted dependencies failed")
+
+    def on_signal(self, signum: int | None = None) -> "Reloader":
+        """Reload when the process receives `signum` (``SIGHUP`` by default); call from the main thread.
+
+        The reload runs in a background thread rather than in the signal
+        handler, so it cannot deadlock on a lock held by the interrupted code.
+        """
+        if signum is None:
+            signum = getattr(signal, "SIGHUP", None)
+            if signum is None:  # not on Windows
+                raise ValueError("SIGHUP is not available on this platform; pass the signal to reload on")
+        self._previous_handlers.setdefault(signum, signal.getsignal(signum))
+        signal.signal(signum, lambda *_: self.trigger())
+        return self
+
+    def watch(self, *paths: str | os.PathLike[str], interval: float = 1.0) -> "Reloader":
+        """Reload when any of `paths` changes, polling every `interval` seconds.
+
+        A file changes when its inode, modification time or size does; a
+        directory when entries are added, removed or replaced (as when
+        Kubernetes updates a mounted secret or ConfigMap).
+        """
+        watched = [os.fspath(path) for path in paths]
+        # taken now, so changes made as soon as this returns are not missed
+        stamps = [_stamp_or_none(path) for path in watched]
+        thread = threading.Thread(
+            target=self._poll,
+            args=(watched, stamps, interval),
+            name="ab-dependency-watch",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+        return self
+
+    def _poll(self, paths: list[str], stamps: list[tuple[int, int, int] | None], interval: float) -> None:
+        while not self._stopped.wait(interval):
+            current = [_stamp_or_none(path) for path in paths]
+            if current != stamps:
+                stamps = current
+                self._run()
+
+    def stop(self) -> None:
+        """Stop watching files, and restore the previous signal handlers."""
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
+        self._previous_handlers.clear()
@@ -0,0 +1,182 @@
+"""Conditional fetching of remote JSON config documents over HTTP.
+
+Remote config rarely changes, so each document is kept with its ``ETag``
+and revalidated with ``If-None-Match``: an unchanged document costs a
+``304 Not Modified`` response with no body, and the cached document is
+returned as the same object. Connections are pooled and kept alive in
+one shared client, plus one async client per event loop, closed when the
+loop shuts down its async generators (as ``asyncio.run`` does on exit) or
+by :meth:`RemoteDocumentCache.aclose`.
+
+Requires ``httpx`` (``pip install ab-dependency[http]``). Parsed documents
+are shared between callers and must not be mutated.
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import AsyncGenerator, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+from pydantic_core import from_json
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class RemoteDocument(NamedTuple):
+    """A parsed remote document and the ``ETag`` it was served with."""
+
+    etag: str | None
+    document: Any
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Loading remote config requires httpx. Install it with `pip install ab-dependency[http]`."
+        ) from e
+    return httpx
+
+
+async def _async_client_lifetime(client: "httpx.AsyncClient") -> AsyncGenerator["httpx.AsyncClient", None]:
+    # an async generator, so the loop closes the client when it shuts down its async generators
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+class RemoteDocumentCache:
+    """Remote documents by URL and request headers, revalidated by ``ETag``."""
+
+    def __init__(self):
+        """Start with an empty cache; clients are created on first use."""
+        self._documents: dict[tuple[str, tuple[tuple[str, str], ...]], RemoteDocument] = {}
+        self._client: httpx.Client | None = None
+        self._async_clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, AsyncGenerator[httpx.AsyncClient, None]]
+        ] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        # clients inherited across a fork, kept referenced so they are neither closed nor finalized
+        self._inherited: list[Any] = []
+
+    @property
+    def client(self) -> "httpx.Client":
+        """The shared keep-alive client for synchronous requests."""
+        if self._client is None:
+            httpx = _import_httpx()
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=DEFAULT_TIMEOUT)
+        return self._client
+
+    async def get_async_client(self) -> "httpx.AsyncClient":
+        """Return the keep-alive client for asynchronous requests on the running event loop.
+
+        It is closed when the loop shuts down its async generators, or by :meth:`aclose`.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            lifetime = _async_client_lifetime(_import_httpx().AsyncClient(timeout=DEFAULT_TIMEOUT))
+            # runs up to its `yield` without suspending, so no other task can create a second client
+            entry = self._async_clients[loop] = (await anext(lifetime), lifetime)
+        return entry[0]
+
+    def _prepare(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> tuple[tuple[str, tuple[tuple[str, str], ...]], RemoteDocument | None, dict[str, str]]:
+        key = (url, tuple(sorted(headers.items())))
+        cached = self._documents.get(key)
+        request_headers = {"Accept": "application/json", **headers}
+        if cached is not None:
+            request_headers["If-None-Match"] = cached.etag  # type: ignore[assignment]
+        return key, cached, request_headers
+
+    def _handle(self, key, cached: RemoteDocument | None, response: "httpx.Response") -> RemoteDocument:
+        if response.status_code == 304 and cached is not None:
+            return cached
+        response.raise_for_status()
+
+        remote = RemoteDocument(etag=response.headers.get("ETag"), document=from_json(response.content))
+        with self._lock:
+            if remote.etag:
+                self._documents[key] = remote
+            else:  # cannot be revalidated
+                self._documents.pop(key, None)
+        return remote
+
+    def fetch(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> RemoteDocument:
+        """Fetch a JSON document, revalidating a cached copy if there is one.
+
+        Raises ``httpx.HTTPError`` if the request fails.
+        """
+        key, cached, request_headers = self._prepare(url, headers or {})
+        response = self.client.get(url, headers=request_headers, timeout=timeout)
+        return self._handle(key, cached, response)
+
+    async def afetch(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> RemoteDocument:
+        """Fetch a JSON document without blocking the event loop; see :meth:`fetch`."""
+        key, cached, request_headers = self._prepare(url, headers or {})
+        client = await self.get_async_client()
+        response = await client.get(url, headers=request_headers, timeout=timeout)
+        return self._handle(key, cached, response)
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Forget the cached documents for `url`, or every document if not given."""
+        with self._lock:
+            if url is None:
+                self._documents.clear()
+                return
+            for key in [key for key in self._documents if key[0] == url]:
+                del self._documents[key]
+
+    def close(self) -> None:
+        """Close the synchronous client; a new one is created on next use."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client of the running event loop; a new one is created on next use.
+
+        Call it on shutdown, e.g. in an application's lifespan, when the loop
+        is closed without shutting down its async generators.
+        """
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()  # closes the client
+
+    def _forget_clients(self) -> None:
+        # after a fork the pooled connections are shared with the parent; closing them
+        # would shut them down for the parent too, so they are dropped instead, and kept
+        # referenced, so they are not finalized either
+        self._inherited.append((self._client, dict(self._async_clients)))
+        self._client = None
+        self._async_clients = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+
+REMOTE_CACHE = RemoteDocumentCache()
+
+if hasattr(os, "register_at_fork"):  # not on Windows
+    os.register_at_fork(after_in_child=REMOTE_CACHE._forget_clients)
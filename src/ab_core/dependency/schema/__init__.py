@@ -1,7 +1,19 @@
 """Schema module for dependency management."""
 
+from .dependency_kind import DependencyKind
+from .file_format import FileFormat
+from .fork_policy import ForkPolicy
 from .loader_type import LoaderSource
+from .resolve_outcome import ResolveOutcome
+from .resolve_stage import ResolveStage
+from .validation_mode import ValidationMode
 
 __all__ = [
+    DependencyKind,
+    FileFormat,
+    ForkPolicy,
     LoaderSource,
+    ResolveOutcome,
+    ResolveStage,
+    ValidationMode,
 ]
@@ -0,0 +1,16 @@
+"""Kind identifiers for nodes of a dependency graph."""
+
+from enum import StrEnum
+
+
+class DependencyKind(StrEnum):
+    """What a node of a dependency graph resolves with."""
+
+    # a function, called with its own dependencies
+    FUNCTION = "FUNCTION"
+    # an injected class, constructed with its own dependencies
+    CLASS = "CLASS"
+    # a loader, or a raw type loaded with its default loader
+    LOADER = "LOADER"
+    # a raw type no loader supports
+    TYPE = "TYPE"
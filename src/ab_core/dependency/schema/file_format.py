@@ -0,0 +1,10 @@
+"""Structured file format identifiers."""
+
+from enum import StrEnum
+
+
+class FileFormat(StrEnum):
+    """Supported structured file formats."""
+
+    JSON = "JSON"
+    TOML = "TOML"
@@ -0,0 +1,12 @@
+"""Fork policy identifiers for persisted dependencies."""
+
+from enum import StrEnum
+
+
+class ForkPolicy(StrEnum):
+    """What a forked child process does with a persisted dependency."""
+
+    # keep the parent's instance, shared copy-on-write; for immutable config
+    SHARE = "SHARE"
+    # drop the parent's instance, so the child loads its own; for clients holding sockets
+    RECREATE = "RECREATE"
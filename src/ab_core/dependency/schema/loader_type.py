@@ -6,6 +6,10 @@ from enum import StrEnum
 class LoaderSource(StrEnum):
     """Supported loader source identifiers."""
 
+    COMPOSITE = "COMPOSITE"
     ENVIRONMENT = "ENVIRONMENT"
     ENVIRONMENT_OBJECT = "ENVIRONMENT_OBJECT"
+    FILE = "FILE"
+    HTTP = "HTTP"
+    SECRETS = "SECRETS"
     TEMPLATE = "TEMPLATE"
@@ -0,0 +1,12 @@
+"""Outcome identifiers for a stage of resolving a dependency."""
+
+from enum import StrEnum
+
+
+class ResolveOutcome(StrEnum):
+    """How a stage of resolving a dependency ended."""
+
+    SUCCESS = "SUCCESS"
+    # a persisted instance was reused, without loading
+    CACHED = "CACHED"
+    ERROR = "ERROR"
@@ -0,0 +1,16 @@
+"""Stage identifiers for resolving a dependency."""
+
+from enum import StrEnum
+
+
+class ResolveStage(StrEnum):
+    """A stage of resolving a dependency, as reported to hooks."""
+
+    # a load target resolved by `Load`, `aLoad`, `LoadMany` or `Depends`
+    RESOLVE = "RESOLVE"
+    # a loader reading its raw data and building it into its type
+    LOAD = "LOAD"
+    # a generator dependency running up to its `yield`
+    SETUP = "SETUP"
+    # a generator dependency running from its `yield` to its end
+    TEARDOWN = "TEARDOWN"
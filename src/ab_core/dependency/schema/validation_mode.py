@@ -0,0 +1,12 @@
+"""Validation mode identifiers."""
+
+from enum import StrEnum
+
+
+class ValidationMode(StrEnum):
+    """How loaders hand reshaped data to pydantic-core for validation."""
+
+    # validate the Python objects directly
+    PYTHON = "PYTHON"
+    # serialize to JSON bytes, then parse and validate them in one pass
+    JSON = "JSON"
@@ -1,25 +1,153 @@
 """Singleton registry used for persisted dependency instances."""
 
-from typing import Any, TypeVar
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 from pydantic import BaseModel
 
+from .schema.fork_policy import ForkPolicy
+from .stats import CacheCounter, register_cache
 from .types import LoadTarget
 
+if TYPE_CHECKING:
+    from .environ import EnvironSnapshot
+    from .loaders.base import LoaderBase
+
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
+
+class _ReloadSource(NamedTuple):
+    """The loader of a persisted instance, and the raw data it was built from."""
+
+    loader: "LoaderBase"
+    raw: Any
+
 
 class SingletonRegistryMeta(type):
     """Metaclass that memoizes constructed instances by key."""
 
     _instances: dict[tuple[Any, Any], BaseModel] = {}
+    _reload_sources: dict[Any, _ReloadSource] = {}
+    _reload_lock = threading.Lock()
+    _fork_policies: dict[Any, ForkPolicy] = {}
 
     def __call__(cls, loader: LoadTarget[T], key: Any) -> T:
         """Return a cached instance for `key`, creating it if needed."""
         if key not in cls._instances:
+            started = time.perf_counter()
             cls._instances[key] = loader()
+            _counter.record_miss(key, time.perf_counter() - started)
+        else:
+            _counter.record_hit()
         return cls._instances[key]  # type: ignore
 
+    def __contains__(cls, key: Any) -> bool:
+        """Return whether an instance is persisted for `key`."""
+        return key in cls._instances
+
+    def load(cls, loader: "LoaderBase[T]", key: Any, environ: "EnvironSnapshot | None" = None) -> T:
+        """Return a cached instance for `key`, loading it with `loader` if needed.
+
+        The raw data is kept alongside the instance, so :meth:`reload` can
+        tell whether its sources changed.
+        """
+        if key not in cls._instances:
+            started = time.perf_counter()
+            raw = loader.read_raw(environ)
+            cls._instances[key] = loader.load_from_raw(raw)
+            cls._reload_sources[key] = _ReloadSource(loader, raw)
+            _counter.record_miss(key, time.perf_counter() - started)
+        else:
+            _counter.record_hit()
+        return cls._instances[key]  # type: ignore
+
+    def call_async(cls, loader: LoadTarget[T], key: Any) -> T | Awaitable[T]:
+        """Return a cached instance for `key`, or start creating it.
+
+        Unlike calling the registry, an awaitable returned by `loader` is not
+        cached itself; an awaitable is returned instead, which caches the
+        value once awaited.
+        """
+        if key in cls._instances:
+            _counter.record_hit()
+            return cls._instances[key]  # type: ignore
+        started = time.perf_counter()
+        value = loader()
+        if isawaitable(value):
+            return cls._store_awaited(key, value, started)
+        _counter.record_miss(key, time.perf_counter() - started)
+        return cls._instances.setdefault(key, value)
+
+    async def _store_awaited(cls, key: Any, awaitable: Awaitable[T], started: float) -> T:
+        value = await awaitable
+        _counter.record_miss(key, time.perf_counter() - started)
+        # a concurrent load of the same key may have finished first; keep its value
+        return cls._instances.setdefault(key, value)  # type: ignore
+
+    def reload(cls) -> dict[Any, set[str]]:
+        """Re-read the sources of persisted instances, rebuilding those that changed.
+
+        Only instances persisted from a loader (a loader or a raw type) can
+        be reloaded; those from functions are left in place. The old and new
+        raw data are diffed, and only instances whose raw data changed are
+        validated again and replaced. If re-reading or validating fails, the
+        old instance is kept and the error is logged.
+
+        Returns the paths that changed in the raw data of each rebuilt key.
+        """
+        from deepdiff import DeepDiff
+
+        from .environ import ENVIRON_INDEX
+
+        changed: dict[Any, set[str]] = {}
+        with cls._reload_lock:
+            environ = ENVIRON_INDEX.current()
+            for key, source in list(cls._reload_sources.items()):
+                if key not in cls._instances:  # cleared since it was loaded
+                    del cls._reload_sources[key]
+                    continue
+                try:
+                    raw = source.loader.read_raw(environ)
+                    if raw == source.raw:
+                        continue
+                    instance = source.loader.load_from_raw(raw)
+                except Exception:
+                    logger.exception("Failed to reload %r, keeping the current instance", key)
+                    continue
+
+                cls._instances[key] = instance
+                cls._reload_sources[key] = _ReloadSource(source.loader, raw)
+                # paths only: values may be secrets
+                changed[key] = set(DeepDiff(source.raw, raw).affected_paths)
+                logger.info("Reloaded %r, changed: %s", key, sorted(changed[key]))
+        return changed
+
+    def set_fork_policy(cls, key: Any, policy: ForkPolicy) -> None:
+        """Set what forked child processes do with the instance persisted for `key`."""
+        cls._fork_policies[key] = policy
+
+    def _after_fork_in_child(cls) -> None:
+        # the lock may have been held by another thread of the parent, which does not exist here
+        cls._reload_lock = threading.Lock()
+        for key, policy in cls._fork_policies.items():
+            if policy is ForkPolicy.RECREATE:
+                cls._instances.pop(key, None)
+                cls._reload_sources.pop(key, None)
+
 
 class SingletonRegistry(metaclass=SingletonRegistryMeta):
     """Singleton entry point backed by `SingletonRegistryMeta`."""
+
+
+_counter = register_cache("singletons", CacheCounter(entry_count=lambda: len(SingletonRegistryMeta._instances)))
+
+
+if hasattr(os, "register_at_fork"):  # not on Windows
+    os.register_at_fork(after_in_child=SingletonRegistry._after_fork_in_child)
@@ -0,0 +1,180 @@
+"""Snapshot file of resolved dependencies, for fast cold starts.
+
+Workers started with an unchanged configuration redo the same reshaping
+and validation on every start. A :class:`Snapshot` records each value
+loaded while it is active, as JSON, keyed by the target type and loader,
+along with a fingerprint of the raw data the loader read (for environment
+loaders, the variables under its key or prefix). On later starts, a
+loader whose raw data has the same fingerprint is built from the snapshot
+instead. Raw data is still read, so a changed source is never served from
+a stale snapshot.
+
+Example::
+
+    with Snapshot("/var/cache/app/dependencies.json"):
+        app = create_app()  # written out only if this succeeds
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Secret, SecretBytes, SecretStr
+from pydantic_core import PydanticSerializationError, from_json, to_json
+
+if TYPE_CHECKING:
+    from .loaders.base import LoaderBase
+
+logger = logging.getLogger(__name__)
+
+# bumped whenever the file layout changes; snapshots of other versions are ignored
+SNAPSHOT_VERSION = 3
+
+_active: "Snapshot | None" = None
+
+
+def active_snapshot() -> "Snapshot | None":
+    """Return the snapshot loads are currently served from and recorded to, if any."""
+    return _active
+
+
+def _fingerprint(data: Any) -> str:
+    return hashlib.blake2b(to_json(data, fallback=repr), digest_size=16).hexdigest()
+
+
+def _reveal_secrets(data: Any) -> Any:
+    """Replace the secrets in dumped data by their values, returning `data` itself if it holds none.
+
+    Serializing to JSON masks secrets, which would be read back as the mask.
+    """
+    if isinstance(data, SecretStr | SecretBytes | Secret):
+        return data.get_secret_value()
+    if isinstance(data, dict):
+        revealed = {key: _reveal_secrets(value) for key, value in data.items()}
+        return data if all(revealed[key] is value for key, value in data.items()) else revealed
+    if isinstance(data, list | tuple):
+        items = [_reveal_secrets(value) for value in data]
+        return data if all(item is value for item, value in zip(items, data, strict=True)) else items
+    return data
+
+
+def _dump_json(loader: "LoaderBase", value: Any) -> bytes:
+    dumped = loader.type_adaptor.dump_python(value)
+    revealed = _reveal_secrets(dumped)
+    if revealed is dumped:
+        return loader.type_adaptor.dump_json(value)
+    return to_json(revealed)
+
+
+class Snapshot:
+    """A file of resolved dependencies, reused while their sources are unchanged.
+
+    Entries are stored as the JSON their type serializes to, so reshaping
+    and Python-level validation are skipped: the stored JSON is validated
+    in a single pass in pydantic-core, by the validator already cached for
+    the type. Entries of ``trust`` loaders are constructed without
+    validation.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Create a snapshot stored at `path`; nothing is read until it is activated."""
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def activate(self) -> "Snapshot":
+        """Read the snapshot file, and serve and record loads from now on."""
+        global _active
+        self._stored = self._read()
+        _active = self
+        return self
+
+    def deactivate(self) -> None:
+        """Stop serving and recording loads."""
+        global _active
+        if _active is self:
+            _active = None
+
+    def __enter__(self) -> "Snapshot":
+        """Activate the snapshot."""
+        return self.activate()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Deactivate the snapshot, saving it if the block succeeded."""
+        self.deactivate()
+        if exc_type is None:
+            self.save()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            document = from_json(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable dependency snapshot `%s`", self.path, exc_info=True)
+            return {}
+        if not isinstance(document, dict) or document.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return document.get("entries") or {}
+
+    def load(self, loader: "LoaderBase", data: Any, build: Callable[[Any], Any]) -> Any:
+        """Return the value of `loader` for raw `data`, from the snapshot if it is unchanged.
+
+        Otherwise the value is built with `build` and recorded.
+        """
+        key = loader.snapshot_key
+        fingerprint = _fingerprint(data)
+
+        entry = self._stored.get(key)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            try:
+                value = (
+                    loader.construct_trusted(from_json(entry["json"]))
+                    if loader.trust
+                    else loader.type_adaptor.validate_json(entry["json"])
+                )
+            except (KeyError, ValueError):  # includes ValidationError
+                logger.debug("Snapshot entry for %s no longer fits its type, rebuilding", key, exc_info=True)
+            else:
+                with self._lock:
+                    self.hits += 1
+                    self._entries[key] = entry
+                return value
+
+        value = build(data)
+        try:
+            entry = {"fingerprint": fingerprint, "json": _dump_json(loader, value).decode()}
+        except PydanticSerializationError:
+            logger.debug("Not snapshotting %s, its value cannot be serialized", key, exc_info=True)
+            return value
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+        return value
+
+    def save(self) -> None:
+        """Write the entries loaded since activation, replacing the file atomically.
+
+        Entries not loaded since are dropped. The file holds resolved
+        values, which may include secrets, so it is only readable by the
+        current user.
+        """
+        with self._lock:
+            document = to_json({"version": SNAPSHOT_VERSION, "entries": self._entries})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(document)
+            os.replace(temporary, self.path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
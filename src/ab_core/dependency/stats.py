@@ -0,0 +1,152 @@
+"""Hit and miss statistics of the package's caches.
+
+Persisted instances, type adapters, pydanticized types and the loaders,
+constructors and plans built for each type are cached for the life of the
+process. :func:`cache_stats` reports, for each cache, its hits, misses,
+entries and the time spent building entries on misses, with misses
+counted per target. A target missing many times usually means equivalent
+types are being created over and over, e.g. generic aliases parametrized
+at runtime, each of which builds its own entries.
+
+Example::
+
+    stats = cache_stats()["type_adapters"]
+    print(stats.hits, stats.misses, stats.build_time)
+    print(stats.misses_by_target.most_common(5))
+"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache, update_wrapper
+from typing import Any, NamedTuple, cast
+
+from .hooks import target_name
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the statistics of one cache, since it was created or last reset."""
+
+    hits: int
+    misses: int
+    # entries currently held, whether or not added since the last reset
+    entries: int
+    # seconds spent building entries on misses
+    build_time: float
+    # misses per target, by name
+    misses_by_target: Counter[str]
+
+
+class CacheCounter:
+    """Counts the hits and misses of one cache.
+
+    Misses are recorded with :meth:`record_miss`, which is only called on
+    the slow path. Hits are either counted with :meth:`record_hit`, or
+    read from `hit_count`, e.g. a ``functools`` cache's statistics, so the
+    hit path of such a cache is not slowed down.
+    """
+
+    def __init__(self, entry_count: Callable[[], int], hit_count: Callable[[], int] | None = None):
+        """Count a cache holding `entry_count()` entries, reading its hits from `hit_count`, if given."""
+        self._entry_count = entry_count
+        self._hit_count = hit_count
+        self._hits = 0
+        self._hits_at_reset = 0
+        self._misses: Counter[str] = Counter()
+        self._build_time = 0.0
+        self._lock = threading.Lock()
+
+    def record_hit(self) -> None:
+        """Count a hit."""
+        self._hits += 1
+
+    def record_miss(self, target: Any, build_time: float) -> None:
+        """Count a miss for `target`, whose entry took `build_time` seconds to build."""
+        name = target_name(target)
+        with self._lock:
+            self._misses[name] += 1
+            self._build_time += build_time
+
+    def _total_hits(self) -> int:
+        return self._hit_count() if self._hit_count is not None else self._hits
+
+    def stats(self) -> CacheStats:
+        """Return the statistics since the cache was created or last reset."""
+        with self._lock:
+            return CacheStats(
+                hits=self._total_hits() - self._hits_at_reset,
+                misses=self._misses.total(),
+                entries=self._entry_count(),
+                build_time=self._build_time,
+                misses_by_target=Counter(self._misses),
+            )
+
+    def reset(self) -> None:
+        """Reset the counters, keeping the cache's entries."""
+        with self._lock:
+            self._hits_at_reset = self._total_hits()
+            self._misses.clear()
+            self._build_time = 0.0
+
+
+_counters: dict[str, CacheCounter] = {}
+
+
+def register_cache(name: str, counter: CacheCounter) -> CacheCounter:
+    """Report the statistics of `counter` under `name`, returning it."""
+    _counters[name] = counter
+    return counter
+
+
+def counted_cache[**P, R](name: str, maxsize: int | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache a single-argument function, reporting its statistics under `name`.
+
+    As ``functools.lru_cache(maxsize)``, unbounded by default. Misses are
+    attributed to the function's argument.
+    """
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        def build(target: Any) -> R:
+            started = time.perf_counter()
+            try:
+                return func(target)  # type: ignore[call-arg]
+            finally:
+                counter.record_miss(target, time.perf_counter() - started)
+
+        cached = update_wrapper(lru_cache(maxsize=maxsize)(build), func)
+        counter = register_cache(
+            name,
+            CacheCounter(entry_count=lambda: cached.cache_info().currsize, hit_count=lambda: cached.cache_info().hits),
+        )
+        return cast(Callable[P, R], cached)
+
+    return decorate
+
+
+# modules owning the caches, imported when statistics are requested, so every cache is listed
+_CACHE_MODULES = (
+    "ab_core.dependency.singleton",
+    "ab_core.dependency.depends",
+    "ab_core.dependency.pydanticize",
+)
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Return the statistics of each cache, by name, since it was created or last reset.
+
+    Caches are ``singletons`` (persisted instances), ``type_adapters``,
+    ``pydanticized_types``, ``default_loaders``, ``trusted_constructors``
+    and ``env_plans``.
+    """
+    from importlib import import_module
+
+    for module in _CACHE_MODULES:
+        import_module(module)
+    return {name: counter.stats() for name, counter in _counters.items()}
+
+
+def reset_cache_stats() -> None:
+    """Reset the counters of every cache, keeping their entries."""
+    for counter in _counters.values():
+        counter.reset()
@@ -0,0 +1,65 @@
+"""Sampled background validation of trusted loads.
+
+Loaders in ``trust`` mode build their result without validating it. To
+catch drift between a trusted source and the type, a sample of trusted
+loads is also validated in full on a background thread, and failures are
+logged.
+"""
+
+import logging
+import os
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    # one worker: validation is CPU-bound, and should not compete with loading
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="ab-dependency-trust")
+
+
+if hasattr(os, "register_at_fork"):  # not on Windows
+    # the worker thread does not survive a fork; children start their own
+    os.register_at_fork(after_in_child=_executor.cache_clear)
+
+
+def should_validate(rate: float) -> bool:
+    """Return whether to validate a trusted load, sampled at `rate` (0 to 1)."""
+    return rate > 0 and (rate >= 1 or random.random() < rate)
+
+
+def _validate(type_adaptor: TypeAdapter, data: Any, type_: Any) -> bool:
+    try:
+        type_adaptor.validate_python(data)
+    except ValidationError as e:
+        # locations and error types only: the input values may be secrets
+        errors = [
+            f"{'.'.join(map(str, error['loc'])) or '<root>'} ({error['type']})"
+            for error in e.errors(include_url=False, include_input=False, include_context=False)
+        ]
+        logger.warning(
+            "Trusted data for `%r` failed validation, the source has drifted from the type: %s",
+            type_,
+            ", ".join(errors),
+        )
+        return False
+    return True
+
+
+def validate_in_background(type_adaptor: TypeAdapter, data: Any, type_: Any) -> Future[bool]:
+    """Validate trusted `data` on a background thread, logging any failure.
+
+    The returned future resolves to whether the data was valid.
+    """
+    return _executor().submit(_validate, type_adaptor, data, type_)
+
+
+def wait_for_validation() -> None:
+    """Block until all background validation submitted so far has finished."""
+    _executor().submit(lambda: None).result()
@@ -3,28 +3,53 @@
 import inspect
 import os
 import re
-from collections.abc import Iterator
-from typing import get_args
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any, get_args
 
+# upper bound on the number of memoised name intersections
+NAME_INTERSECTION_CACHE_SIZE = 1024
 
+
+def _common_substrings(args: tuple[str, ...], shortest: str, length: int) -> set[str]:
+    """Return the substrings of `length` characters shared by all of `args`."""
+    common = {shortest[start : start + length] for start in range(len(shortest) - length + 1)}
+    for other in args:
+        if not common:
+            break
+        common = {candidate for candidate in common if candidate in other}
+    return common
+
+
+@lru_cache(maxsize=NAME_INTERSECTION_CACHE_SIZE)
 def str_intersection(*args: str) -> str:
-    """Return the longest common substring across all provided strings."""
+    """Return the longest common substring across all provided strings.
+
+    Ties are broken by the earliest position in the (first) shortest string.
+    Shared substrings of one length imply shared substrings of every shorter
+    length, so the longest length is found by binary search over a few
+    lengths rather than by trying every length from the longest down.
+    """
     if not args:
         return ""
 
-    # use the shortest string as base for substrings
     shortest = min(args, key=len)
-    max_len = len(shortest)
-
-    for length in range(max_len, 0, -1):  # longest to shortest
-        for start in range(max_len - length + 1):
-            candidate = shortest[start : start + length]
-            if all(candidate in other for other in args):
-                return candidate
-    return ""
+    low, high = 0, len(shortest)
+    found: set[str] = set()
+    while low < high:
+        length = (low + high + 1) // 2
+        common = _common_substrings(args, shortest, length)
+        if common:
+            low, found = length, common
+        else:
+            high = length - 1
+
+    if not found:
+        return ""
+    return min(found, key=shortest.find)
 
 
-def type_name_intersection(types: tuple[type, ...]) -> str:
+def type_name_intersection(types: Iterable[type]) -> str:
     """Return the longest shared substring among type names."""
     return str_intersection(*(t.__name__ for t in types))
 
@@ -99,6 +124,32 @@ def extract_env_tree(env: dict[str, str], prefix: str) -> dict:
     return result
 
 
+def extract_env_items(env: dict[str, str], prefix: str) -> dict[str, str]:
+    """Extract prefixed environment variables into a flat, lower-cased mapping.
+
+    Keys have the prefix removed, e.g. ``APP_CONFIG_DATABASE_HOST`` becomes
+    ``database_host`` for the ``APP_CONFIG`` prefix. A key that is also the
+    parent of another key (e.g. ``APP_CONFIG_HOSTS`` and ``APP_CONFIG_HOSTS_0``)
+    is rejected, matching :func:`extract_env_tree`.
+    """
+    env_prefix = apply_suffix(prefix, "_")
+    prefix_len = len(env_prefix)
+
+    items = {full_key[prefix_len:].lower(): value for full_key, value in env.items() if full_key.startswith(env_prefix)}
+    check_key_collisions(items)
+    return items
+
+
+def check_key_collisions(items: dict[str, Any]) -> None:
+    """Reject flat keys that are also the underscore-joined parent of another key."""
+    for key in items:
+        start = key.find("_")
+        while start != -1:
+            if key[:start] in items:
+                raise ValueError(f"Environment variable collision: key {key[:start]!r} is already defined as a value.")
+            start = key.find("_", start + 1)
+
+
 def walk_types_args(t_base: type):
     """Yield a type and every nested argument type recursively."""
 
@@ -0,0 +1,152 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Load
+from ab_core.dependency import files as files_module
+from ab_core.dependency.files import FILE_CACHE, parse_dotenv
+from ab_core.dependency.loaders.composite import (
+    CompositeLoader,
+    DefaultsSource,
+    DotenvSource,
+    EnvironmentSource,
+    FileSource,
+    merge_trees,
+)
+
+
+class DummyLayeredDatabase(BaseModel):
+    host: str
+    port: int = 5432
+    options: list[str] = []
+
+
+class DummyLayeredConfig(BaseModel):
+    name: str
+    log_level: str
+    database: DummyLayeredDatabase
+
+
+@pytest.fixture(autouse=True)
+def clear_file_cache():
+    FILE_CACHE.invalidate()
+    yield
+    FILE_CACHE.invalidate()
+
+
+def write(path, content):
+    path.write_text(content)
+    # bump the mtime explicitly, so rewrites within one timestamp tick are still observed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    return path
+
+
+@pytest.fixture
+def layers(tmp_path):
+    config = write(
+        tmp_path / "config.json",
+        json.dumps({"name": "from-json", "log_level": "WARNING", "database": {"host": "json-db", "port": 1}}),
+    )
+    dotenv = write(
+        tmp_path / ".env",
+        "DUMMY_LAYERED_CONFIG_DATABASE_PORT=2\nDUMMY_LAYERED_CONFIG_LOG_LEVEL=DEBUG\n",
+    )
+    return config, dotenv
+
+
+def make_loader(config, dotenv):
+    return CompositeLoader[DummyLayeredConfig](
+        sources=[
+            EnvironmentSource(),
+            DotenvSource(path=str(dotenv)),
+            FileSource(path=str(config)),
+            DefaultsSource(values={"log_level": "INFO", "database": {"options": ["a"]}}),
+        ]
+    )
+
+
+def test_sources_are_merged_by_precedence(layers):
+    with patch.dict(os.environ, {"DUMMY_LAYERED_CONFIG_DATABASE_HOST": "env-db"}):
+        config = Load(make_loader(*layers))
+
+    assert config == DummyLayeredConfig(
+        name="from-json",
+        log_level="DEBUG",
+        database=DummyLayeredDatabase(host="env-db", port=2, options=["a"]),
+    )
+
+
+def test_validates_once(layers):
+    loader = make_loader(*layers)
+
+    with patch.object(type(loader.type_adaptor), "validate_python", autospec=True) as validate:
+        loader.load()
+
+    assert validate.call_count == 1
+
+
+def test_missing_optional_dotenv_is_skipped(tmp_path, layers):
+    config, _ = layers
+    loader = make_loader(config, tmp_path / "missing.env")
+
+    assert loader.load().log_level == "WARNING"
+
+
+def test_missing_required_file_is_an_error(tmp_path, layers):
+    _, dotenv = layers
+
+    with pytest.raises(RuntimeError, match="missing.json"):
+        make_loader(tmp_path / "missing.json", dotenv).load()
+
+
+def test_dotenv_is_parsed_again_only_when_changed(layers):
+    loader = make_loader(*layers)
+    loader.load()
+
+    with patch.object(files_module, "read_file_bytes", wraps=files_module.read_file_bytes) as read:
+        loader.load()
+        assert read.call_count == 0
+
+        write(layers[1], "DUMMY_LAYERED_CONFIG_LOG_LEVEL=ERROR\n")
+        assert loader.load().log_level == "ERROR"
+        assert read.call_count == 1
+
+
+def test_explicit_prefix(tmp_path):
+    dotenv = write(tmp_path / ".env", "APP_NAME=svc\nAPP_LOG_LEVEL=INFO\nAPP_DATABASE_HOST=db\n")
+
+    config = CompositeLoader[DummyLayeredConfig](sources=[DotenvSource(path=str(dotenv))], env_prefix="APP").load()
+
+    assert config.database.host == "db"
+
+
+def test_merge_trees_does_not_mutate_inputs():
+    base = {"a": {"b": 1, "c": [1]}, "d": 1}
+    override = {"a": {"c": [2]}, "e": 2}
+
+    assert merge_trees(base, override) == {"a": {"b": 1, "c": [2]}, "d": 1, "e": 2}
+    assert base == {"a": {"b": 1, "c": [1]}, "d": 1}
+
+
+def test_parse_dotenv():
+    content = b"""
+# comment
+export PLAIN=value # trailing comment
+QUOTED="line\\nbreak # kept"
+SINGLE='raw \\n value'
+EMPTY=
+HASH=a#b
+not a variable
+"""
+
+    assert parse_dotenv(content) == {
+        "PLAIN": "value",
+        "QUOTED": "line\nbreak # kept",
+        "SINGLE": "raw \\n value",
+        "EMPTY": "",
+        "HASH": "a#b",
+    }
@@ -3,9 +3,10 @@ from typing import Annotated, Literal
 from unittest.mock import patch
 
 import pytest
-from pydantic import BaseModel, Discriminator
+from pydantic import BaseModel, Discriminator, ValidationError
 
 from ab_core.dependency.loaders.environment_object import ObjectLoaderEnvironment
+from ab_core.dependency.schema import ValidationMode
 
 
 # --- Sample discriminated-subtype models for testing ---
@@ -75,3 +76,58 @@ def test_loader_single_type(env_overrides, expected_values, expected_instance):
     with patch.dict(os.environ, env_overrides, clear=False):
         result = loader.load()
         assert result == expected_instance
+
+
+class DummyStoreC(BaseModel):
+    type: Literal["C", "LEGACY_C"] = "C"
+
+
+WideLoaderUnion = Annotated[DummyStoreA | DummyStoreB | DummyStoreC, Discriminator("type")]
+
+
+def test_discriminator_table_maps_every_tag_to_its_branch():
+    loader = ObjectLoaderEnvironment[WideLoaderUnion]()
+
+    assert loader.discriminator_table == {"A": DummyStoreA, "B": DummyStoreB, "C": DummyStoreC, "LEGACY_C": DummyStoreC}
+    assert loader.discriminator_choices == ["A", "B", "C", "LEGACY_C"]
+
+
+def test_discriminate_type_from_raw_data_read_once():
+    loader = ObjectLoaderEnvironment[LoaderUnion]()
+
+    with patch.dict(os.environ, {"DUMMY_STORE_TYPE": "B", "DUMMY_STORE_B_BAR": "bar"}):
+        raw = loader.load_raw()
+
+    with patch.object(ObjectLoaderEnvironment, "load_raw") as load_raw:
+        assert loader.discriminate_type(raw) is DummyStoreB
+    load_raw.assert_not_called()
+    assert loader.load_from_raw(raw) == DummyStoreB(bar="bar")
+
+
+def test_discriminate_type_reads_raw_data_when_not_given():
+    loader = ObjectLoaderEnvironment[LoaderUnion]()
+
+    with patch.dict(os.environ, {"DUMMY_STORE_TYPE": "A"}):
+        assert loader.discriminate_type() is DummyStoreA
+
+
+def test_unknown_discriminator_lists_choices():
+    loader = ObjectLoaderEnvironment[LoaderUnion]()
+
+    with pytest.raises(ValueError, match=r"expected one of the following: A\|B"):
+        loader.discriminate({"type": "Z"})
+
+
+@pytest.mark.parametrize("mode", list(ValidationMode))
+def test_validation_modes_load_the_same_value(mode):
+    loader = ObjectLoaderEnvironment[LoaderUnion](validation_mode=mode)
+
+    with patch.dict(os.environ, {"DUMMY_STORE_TYPE": "A", "DUMMY_STORE_A_NUM": "42"}):
+        assert loader.load() == DummyStoreA(num=42)
+
+
+def test_json_validation_mode_reports_invalid_values():
+    loader = ObjectLoaderEnvironment[DummyStoreA](validation_mode=ValidationMode.JSON)
+
+    with patch.dict(os.environ, {"DUMMY_STORE_A_NUM": "not-a-number"}), pytest.raises(ValidationError):
+        loader.load()
@@ -0,0 +1,124 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Load
+from ab_core.dependency import files as files_module
+from ab_core.dependency.files import FILE_CACHE, load_document, lookup_key_path
+from ab_core.dependency.loaders.file import LoaderFile
+from ab_core.dependency.schema.file_format import FileFormat
+
+
+class DummyFileDatabase(BaseModel):
+    host: str
+    port: int = 5432
+
+
+class DummyFileSettings(BaseModel):
+    name: str
+    database: DummyFileDatabase
+
+
+@pytest.fixture(autouse=True)
+def clear_file_cache():
+    FILE_CACHE.invalidate()
+    yield
+    FILE_CACHE.invalidate()
+
+
+def write(path, content):
+    path.write_text(content)
+    # bump the mtime explicitly, so rewrites within one timestamp tick are still observed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    return path
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    return write(
+        tmp_path / "settings.json",
+        json.dumps({"name": "svc", "database": {"host": "db", "port": "6543"}}),
+    )
+
+
+def test_loads_json_file(json_file):
+    settings = LoaderFile[DummyFileSettings](path=str(json_file)).load()
+
+    assert settings == DummyFileSettings(name="svc", database=DummyFileDatabase(host="db", port=6543))
+
+
+def test_loads_toml_section(tmp_path):
+    toml_file = write(tmp_path / "settings.toml", '[services.db]\nhost = "db"\nport = 6543\n')
+
+    database = LoaderFile[DummyFileDatabase](path=str(toml_file), key="services.db").load()
+
+    assert database == DummyFileDatabase(host="db", port=6543)
+
+
+def test_explicit_format_overrides_suffix(tmp_path):
+    config = write(tmp_path / "configmap", '{"host": "db"}')
+
+    loaded = LoaderFile[DummyFileDatabase](path=str(config), format=FileFormat.JSON).load()
+
+    assert loaded.host == "db"
+
+
+def test_unknown_suffix_is_rejected(tmp_path):
+    config = write(tmp_path / "settings.yaml", "host: db")
+
+    with pytest.raises(RuntimeError, match="Unable to infer the format"):
+        LoaderFile[DummyFileDatabase](path=str(config)).load()
+
+
+def test_missing_key_falls_back_to_default(json_file):
+    default = DummyFileDatabase(host="fallback")
+
+    loaded = LoaderFile[DummyFileDatabase](path=str(json_file), key="cache", default_value=default).load()
+
+    assert loaded == default
+
+
+def test_models_share_one_parse(json_file):
+    with patch.object(files_module, "parse_json", wraps=files_module.parse_json) as parse:
+        files_module._PARSERS[FileFormat.JSON] = parse
+        try:
+            settings = Load(LoaderFile[DummyFileSettings](path=str(json_file)))
+            database = Load(LoaderFile[DummyFileDatabase](path=str(json_file), key="database"))
+        finally:
+            files_module._PARSERS[FileFormat.JSON] = files_module.parse_json
+
+    assert settings.database == database
+    assert parse.call_count == 1
+
+
+def test_cache_is_reused_until_file_changes(json_file):
+    first = load_document(json_file)
+    assert load_document(json_file) is first
+
+    write(json_file, json.dumps({"name": "changed", "database": {"host": "db"}}))
+
+    assert load_document(json_file)["name"] == "changed"
+
+
+def test_large_files_are_read_whole(tmp_path):
+    big = write(tmp_path / "big.json", json.dumps({"host": "db", "padding": "x" * (2 << 20)}))
+
+    assert LoaderFile[DummyFileDatabase](path=str(big)).load().host == "db"
+
+
+@pytest.mark.parametrize(
+    "key_path, expected",
+    [
+        (None, {"a": {"b": 1}}),
+        ("a", {"b": 1}),
+        ("a.b", 1),
+        ("a.c", None),
+        ("a.b.c", None),
+    ],
+)
+def test_lookup_key_path(key_path, expected):
+    assert lookup_key_path({"a": {"b": 1}}, key_path) == expected
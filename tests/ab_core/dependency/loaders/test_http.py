@@ -0,0 +1,175 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Load, aLoad
+from ab_core.dependency.loaders.http import AsyncLoaderHttp, LoaderHttp
+from ab_core.dependency.remote import REMOTE_CACHE
+
+pytest.importorskip("httpx")
+
+
+class DummyRemoteDatabase(BaseModel):
+    host: str
+    port: int = 5432
+
+
+class DummyRemoteSettings(BaseModel):
+    name: str
+    database: DummyRemoteDatabase
+
+
+class ConfigServer:
+    """Local stand-in for a config endpoint, serving one document with an ETag."""
+
+    def __init__(self):
+        self.document = {"name": "svc", "database": {"host": "db", "port": "6543"}}
+        self.etag: str | None = '"v1"'
+        self.statuses: list[int] = []
+        self.headers: list[dict[str, str]] = []
+        self.client_ports: list[int] = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.headers.append(dict(self.headers))
+                server.client_ports.append(self.client_address[1])
+                if server.etag and self.headers.get("If-None-Match") == server.etag:
+                    server.statuses.append(304)
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps(server.document).encode()
+                server.statuses.append(200)
+                self.send_response(200)
+                if server.etag:
+                    self.send_header("ETag", server.etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/config"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True)
+
+    def publish(self, document, etag):
+        self.document, self.etag = document, etag
+
+
+@pytest.fixture
+def server():
+    server = ConfigServer()
+    server.thread.start()
+    REMOTE_CACHE.invalidate()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+    REMOTE_CACHE.invalidate()
+
+
+def test_loads_remote_document(server):
+    settings = Load(LoaderHttp[DummyRemoteSettings](url=server.url))
+
+    assert settings == DummyRemoteSettings(name="svc", database=DummyRemoteDatabase(host="db", port=6543))
+
+
+def test_loads_remote_section(server):
+    database = Load(LoaderHttp[DummyRemoteDatabase](url=server.url, key="database"))
+
+    assert database == DummyRemoteDatabase(host="db", port=6543)
+
+
+def test_unchanged_document_is_revalidated_without_validating(server):
+    loader = LoaderHttp[DummyRemoteSettings](url=server.url)
+    first = loader.load()
+
+    with patch.object(type(loader), "load_from_raw", wraps=loader.load_from_raw) as load_from_raw:
+        second = loader.load()
+
+    assert second is first
+    assert load_from_raw.call_count == 0
+    assert server.statuses == [200, 304]
+    assert server.headers[-1]["If-None-Match"] == '"v1"'
+
+
+def test_changed_document_is_reloaded(server):
+    loader = LoaderHttp[DummyRemoteSettings](url=server.url)
+    loader.load()
+
+    server.publish({"name": "changed", "database": {"host": "db"}}, '"v2"')
+
+    assert loader.load().name == "changed"
+    assert server.statuses == [200, 200]
+
+
+def test_document_without_etag_is_always_fetched(server):
+    server.etag = None
+    loader = LoaderHttp[DummyRemoteSettings](url=server.url)
+
+    assert loader.load() == loader.load()
+    assert server.statuses == [200, 200]
+    assert "If-None-Match" not in server.headers[-1]
+
+
+def test_connections_are_reused(server):
+    loader = LoaderHttp[DummyRemoteSettings](url=server.url)
+
+    loader.load()
+    loader.load()
+    loader.load()
+
+    assert len(set(server.client_ports)) == 1
+
+
+def test_http_errors_are_wrapped(server):
+    server.httpd.RequestHandlerClass.do_GET = lambda self: self.send_error(404)
+
+    with pytest.raises(RuntimeError, match="404"):
+        Load(LoaderHttp[DummyRemoteSettings](url=server.url))
+
+
+async def test_async_loader_revalidates(server):
+    loader = AsyncLoaderHttp[DummyRemoteSettings](url=server.url, headers={"Authorization": "Bearer t"})
+
+    first = await aLoad(loader)
+    second = await aLoad(loader)
+
+    assert first is second
+    assert first.database.port == 6543
+    assert server.statuses == [200, 304]
+    assert server.headers[-1]["Authorization"] == "Bearer t"
+
+
+async def test_aclose_closes_the_async_client(server):
+    await aLoad(AsyncLoaderHttp[DummyRemoteSettings](url=server.url))
+    client = await REMOTE_CACHE.get_async_client()
+
+    await REMOTE_CACHE.aclose()
+
+    assert client.is_closed
+    assert await REMOTE_CACHE.get_async_client() is not client
+    await REMOTE_CACHE.aclose()
+
+
+def test_async_client_is_closed_when_its_loop_shuts_down(server):
+    async def main():
+        await aLoad(AsyncLoaderHttp[DummyRemoteSettings](url=server.url))
+        return await REMOTE_CACHE.get_async_client()
+
+    client = asyncio.run(main())
+
+    assert client.is_closed
@@ -0,0 +1,144 @@
+import os
+from typing import Annotated, Literal
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, Discriminator
+
+from ab_core.dependency import Load
+from ab_core.dependency import files as files_module
+from ab_core.dependency.files import FILE_CACHE
+from ab_core.dependency.loaders.secrets import ObjectLoaderSecrets
+
+
+class DummySecretDatabase(BaseModel):
+    user: str
+    password: str
+
+
+class DummySecretClient(BaseModel):
+    client_id: str
+    client_secret: str
+    database: DummySecretDatabase | None = None
+
+
+class DummySecretStoreA(BaseModel):
+    type: Literal["A"] = "A"
+    token: str
+
+
+class DummySecretStoreB(BaseModel):
+    type: Literal["B"] = "B"
+    token: str
+
+
+DummySecretStore = Annotated[DummySecretStoreA | DummySecretStoreB, Discriminator("type")]
+
+
+@pytest.fixture(autouse=True)
+def clear_file_cache():
+    FILE_CACHE.invalidate()
+    yield
+    FILE_CACHE.invalidate()
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    # bump the mtime explicitly, so rewrites within one timestamp tick are still observed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def secrets_dir(tmp_path):
+    write(tmp_path / "client_id", "my-client\n")
+    write(tmp_path / "client_secret", "s3cret\n")
+    return tmp_path
+
+
+def test_loads_one_file_per_field(secrets_dir):
+    client = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir)).load()
+
+    assert client == DummySecretClient(client_id="my-client", client_secret="s3cret")
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {"database/user": "admin", "database/password": "pw"},
+        {"database_user": "admin", "database_password": "pw"},
+        {"DATABASE_USER": "admin", "database/password": "pw"},
+    ],
+)
+def test_nested_models_from_subdirectories_or_underscores(secrets_dir, files):
+    for name, content in files.items():
+        write(secrets_dir / name, content)
+
+    client = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir)).load()
+
+    assert client.database == DummySecretDatabase(user="admin", password="pw")
+
+
+def test_prefix_selects_and_strips_files(tmp_path):
+    write(tmp_path / "oauth_client_id", "my-client")
+    write(tmp_path / "oauth_client_secret", "s3cret")
+    write(tmp_path / "other_client_id", "ignored")
+
+    client = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(tmp_path), prefix="OAUTH").load()
+
+    assert client.client_id == "my-client"
+
+
+def test_hidden_entries_are_skipped(secrets_dir):
+    write(secrets_dir / "..data" / "client_id", "stale")
+    write(secrets_dir / ".hidden", "ignored")
+
+    assert ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir)).load().client_id == "my-client"
+
+
+def test_discriminated_union(tmp_path):
+    write(tmp_path / "type", "B")
+    write(tmp_path / "token", "t")
+
+    store = ObjectLoaderSecrets[DummySecretStore](secrets_dir=str(tmp_path)).load()
+
+    assert store == DummySecretStoreB(token="t")
+
+
+def test_missing_directory_falls_back_to_default(tmp_path):
+    default = DummySecretClient(client_id="fallback", client_secret="none")
+    loader = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(tmp_path / "missing"), default_value=default)
+
+    assert loader.load() == default
+
+
+def test_duplicate_files_are_rejected(secrets_dir):
+    write(secrets_dir / "database_user", "a")
+    write(secrets_dir / "database" / "user", "b")
+
+    with pytest.raises(RuntimeError, match="Secret collision"):
+        ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir)).load()
+
+
+def test_unchanged_secrets_are_not_read_again(secrets_dir):
+    loader = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir))
+    Load(loader)
+
+    with patch.object(files_module, "read_file_bytes", wraps=files_module.read_file_bytes) as read:
+        Load(loader)
+        assert read.call_count == 0
+
+        write(secrets_dir / "client_secret", "rotated")
+        assert Load(loader).client_secret == "rotated"
+        assert read.call_count == 1
+
+
+def test_added_secret_is_picked_up(secrets_dir):
+    loader = ObjectLoaderSecrets[DummySecretClient](secrets_dir=str(secrets_dir))
+    assert loader.load().database is None
+
+    write(secrets_dir / "database" / "user", "admin")
+    write(secrets_dir / "database" / "password", "pw")
+
+    assert loader.load().database == DummySecretDatabase(user="admin", password="pw")
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Annotated, Any
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Depends, Load, aLoad, inject
+from ab_core.dependency.loaders.base import AsyncLoaderBase
+from ab_core.dependency.singleton import SingletonRegistryMeta
+
+
+class DummyAsyncSettings(BaseModel):
+    name: str
+    retries: int = 1
+
+
+class DummyAsyncLoader[T](AsyncLoaderBase[T]):
+    payload: Any = None
+    started: asyncio.Event | None = None
+    wait_for: asyncio.Event | None = None
+    calls: list[str] = []
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    async def load_raw(self):
+        self.calls.append("load")
+        if self.started is not None:
+            self.started.set()
+        if self.wait_for is not None:
+            await self.wait_for.wait()
+        await asyncio.sleep(0)
+        return self.payload
+
+
+@pytest.fixture(autouse=True)
+def clear_singleton_registry_between_tests():
+    SingletonRegistryMeta._instances.clear()
+    yield
+    SingletonRegistryMeta._instances.clear()
+
+
+async def test_async_loader_validates_awaited_data():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc", "retries": "3"})
+
+    settings = await loader.load()
+
+    assert settings == DummyAsyncSettings(name="svc", retries=3)
+
+
+async def test_async_loader_falls_back_to_default_value():
+    default = DummyAsyncSettings(name="fallback")
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={}, default_value=default)
+
+    assert await loader() == default
+
+
+async def test_async_loader_errors_are_wrapped():
+    class FailingLoader[T](AsyncLoaderBase[T]):
+        async def load_raw(self):
+            raise OSError("unreachable")
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        await FailingLoader[DummyAsyncSettings]().load()
+
+
+async def test_aload_awaits_async_loader_and_plain_targets():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"})
+
+    async def provide_number() -> int:
+        return 7
+
+    assert await aLoad(loader) == DummyAsyncSettings(name="svc")
+    assert await aLoad(provide_number) == 7
+    assert await aLoad(lambda: "plain") == "plain"
+
+
+async def test_aload_persist_caches_awaited_value():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"}, calls=[])
+
+    first = await aLoad(loader, persist=True)
+    second = await aLoad(loader, persist=True)
+
+    assert first is second
+    assert loader.calls == ["load"]
+
+
+async def test_inject_resolves_async_loaders_concurrently():
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+    # each loader only finishes once the other has started, so sequential loading would deadlock
+    first = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "a"}, started=first_started, wait_for=second_started)
+    second = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "b"}, started=second_started, wait_for=first_started)
+
+    @inject
+    async def handler(
+        a: Annotated[DummyAsyncSettings, Depends(first)],
+        b: Annotated[DummyAsyncSettings, Depends(second)],
+        port: Annotated[int, Depends(lambda: 8080)],
+    ):
+        return a.name, b.name, port
+
+    assert await asyncio.wait_for(handler(), timeout=1) == ("a", "b", 8080)
+
+
+async def test_inject_persisted_async_loader_is_reused():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"}, calls=[])
+
+    @inject
+    async def handler(settings: Annotated[DummyAsyncSettings, Depends(loader, persist=True)]):
+        return settings
+
+    assert await handler() is await handler()
+    assert loader.calls == ["load"]
+
+
+def test_async_loader_rejected_in_sync_context():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"})
+
+    @inject
+    def handler(settings: Annotated[DummyAsyncSettings, Depends(loader)]):
+        return settings
+
+    with pytest.raises(RuntimeError, match="sync context"):
+        handler()
+
+
+def test_load_returns_awaitable_for_async_loader():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"})
+
+    assert asyncio.run(Load(loader)) == DummyAsyncSettings(name="svc")
+
+
+async def test_load_and_aload_share_persisted_async_value():
+    loader = DummyAsyncLoader[DummyAsyncSettings](payload={"name": "svc"}, calls=[])
+
+    first = await Load(loader, persist=True)
+    second = await aLoad(loader, persist=True)
+
+    assert first is second is Load(loader, persist=True)
+    assert loader.calls == ["load"]
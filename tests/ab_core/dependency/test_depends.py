@@ -6,7 +6,7 @@ import attrs
 import pytest
 from pydantic import BaseModel, Discriminator, Field
 
-from ab_core.dependency.depends import Depends, Load
+from ab_core.dependency.depends import Depends, Load, default_loader_for
 from ab_core.dependency.loaders.environment_object import (
     ObjectLoaderEnvironment,
 )
@@ -176,3 +176,9 @@ def test_identity_method(load_target, env_patch):
     result = instance.identity()
     assert isinstance(result, str)
     assert result.startswith(instance.label + ":")
+
+
+def test_raw_type_loader_is_reused():
+    loader = default_loader_for(FooClass)
+    assert loader is default_loader_for(FooClass)
+    assert default_loader_for(object()) is None
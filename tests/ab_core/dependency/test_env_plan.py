@@ -0,0 +1,136 @@
+from typing import Annotated, Literal, Optional
+
+import pytest
+from pydantic import BaseModel, Discriminator
+
+from ab_core.dependency.pydanticize import cached_env_plan
+
+
+class A(BaseModel):
+    letter: Literal["A"]
+    extra: str
+
+
+class B(BaseModel):
+    letter: Literal["B"]
+    extra: str
+
+
+AB = Annotated[A | B, Discriminator("letter")]
+
+
+class MultiValue1(BaseModel):
+    type: Literal["MULTI_VALUE1"]
+    extra: str
+
+
+class MultiValue2(BaseModel):
+    type: Literal["MULTI_VALUE2"]
+    extra: str
+
+
+MultiValue = Annotated[MultiValue1 | MultiValue2, Discriminator("type")]
+
+
+class WithUnderscore(BaseModel):
+    some_field: str
+    another_value: int
+
+
+class Database(BaseModel):
+    host: str
+    port: int
+
+
+class AppConfig(BaseModel):
+    database: Database
+    hosts: list[str] = []
+    chars: list[AB] = []
+
+
+class Hierarchy(BaseModel):
+    char: AB
+    child: Optional["Hierarchy"] = None
+    extra: str
+
+
+@pytest.mark.parametrize(
+    "target,before,after",
+    [
+        # underscore field names
+        (
+            WithUnderscore,
+            {"some_field": "hello", "another_value": "42"},
+            {"some_field": "hello", "another_value": "42"},
+        ),
+        # nested models
+        (
+            AppConfig,
+            {"database_host": "localhost", "database_port": "5432"},
+            {"database": {"host": "localhost", "port": "5432"}},
+        ),
+        # json and indexed lists
+        (
+            AppConfig,
+            {"hosts": '["a", "b"]', "chars_0_letter": "A", "chars_0_a_extra": "x", "chars_1_letter": "B"},
+            {"hosts": ["a", "b"], "chars": [{"letter": "A", "extra": "x"}, {"letter": "B"}]},
+        ),
+        # discriminator choice containing the key delimiter
+        (
+            MultiValue,
+            {"type": "MULTI_VALUE1", "multi_value1_extra": "blah"},
+            {"type": "MULTI_VALUE1", "extra": "blah"},
+        ),
+        # branch values take precedence over direct values
+        (
+            AB,
+            {"letter": "A", "extra": "direct", "a_extra": "branch"},
+            {"letter": "A", "extra": "branch"},
+        ),
+        # unknown fields are kept as a nested tree
+        (
+            Database,
+            {"host": "localhost", "some_other_key": "x"},
+            {"host": "localhost", "some": {"other": {"key": "x"}}},
+        ),
+        # leaf fields alongside nested and unknown keys
+        (
+            AppConfig,
+            {"hosts": '["a"]', "database_host": "localhost", "other": "x"},
+            {"hosts": ["a"], "database": {"host": "localhost"}, "other": "x"},
+        ),
+        # recursive definitions
+        (
+            Hierarchy,
+            {
+                "char_letter": "A",
+                "char_a_extra": "x",
+                "extra": "root",
+                "child_char_letter": "B",
+                "child_char_b_extra": "y",
+                "child_extra": "child",
+            },
+            {
+                "char": {"letter": "A", "extra": "x"},
+                "extra": "root",
+                "child": {"char": {"letter": "B", "extra": "y"}, "extra": "child"},
+            },
+        ),
+    ],
+)
+def test_env_plan_build(target, before, after):
+    assert cached_env_plan(target).build(before) == after
+
+
+def test_env_plan_is_cached_per_type():
+    assert cached_env_plan(AppConfig) is cached_env_plan(AppConfig)
+
+
+def test_env_plan_sparse_indexed_list_raises():
+    with pytest.raises(ValueError, match="Sparse list indexes"):
+        cached_env_plan(AppConfig).build({"hosts_0": "a", "hosts_2": "c"})
+
+
+def test_env_plan_leaf_defined_as_object_raises():
+    with pytest.raises(ValueError, match="collision"):
+        cached_env_plan(Database).build({"host": "localhost", "host_name": "db"})
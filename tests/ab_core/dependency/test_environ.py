@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from ab_core.dependency.environ import EnvironIndex, environ_version
+
+
+@pytest.fixture
+def index():
+    index = EnvironIndex()
+    index.refresh()
+    return index
+
+
+def test_with_prefix_only_returns_matching_keys(index, monkeypatch):
+    monkeypatch.setenv("DUMMY_INDEX_A", "1")
+    monkeypatch.setenv("DUMMY_INDEX_B", "2")
+    monkeypatch.setenv("DUMMY_INDEXED", "3")
+
+    assert index.with_prefix("DUMMY_INDEX_") == {"DUMMY_INDEX_A": "1", "DUMMY_INDEX_B": "2"}
+
+
+def test_snapshot_is_reused_until_environment_changes(index, monkeypatch):
+    first = index.snapshot()
+    assert index.snapshot() is first
+
+    version = environ_version()
+    monkeypatch.setenv("DUMMY_INDEX_A", "1")
+
+    assert environ_version() != version
+    assert index.snapshot() is not first
+    assert index.get("DUMMY_INDEX_A") == "1"
+
+
+def test_deleting_a_variable_is_observed(index, monkeypatch):
+    monkeypatch.setenv("DUMMY_INDEX_A", "1")
+    assert index.with_prefix("DUMMY_INDEX_") == {"DUMMY_INDEX_A": "1"}
+
+    monkeypatch.delenv("DUMMY_INDEX_A")
+    assert index.with_prefix("DUMMY_INDEX_") == {}
+
+
+def test_putenv_bumps_version(index):
+    version = environ_version()
+    os.putenv("DUMMY_INDEX_PUTENV", "1")
+    try:
+        assert environ_version() != version
+    finally:
+        os.unsetenv("DUMMY_INDEX_PUTENV")
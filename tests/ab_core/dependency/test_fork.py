@@ -0,0 +1,70 @@
+import gc
+import os
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Depends, Load, warm_up
+from ab_core.dependency.loaders import LoaderEnvironment
+from ab_core.dependency.schema import ForkPolicy
+from ab_core.dependency.singleton import SingletonRegistryMeta
+
+
+class DummyForkConfig(BaseModel):
+    name: str = "config"
+
+
+class DummyForkClient(BaseModel):
+    name: str = "client"
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    SingletonRegistryMeta._instances.clear()
+    SingletonRegistryMeta._fork_policies.clear()
+    yield
+    SingletonRegistryMeta._instances.clear()
+    SingletonRegistryMeta._fork_policies.clear()
+
+
+def in_child(check) -> bool:
+    """Run `check` in a forked child, returning its result."""
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            os.write(write, b"1" if check() else b"0")
+        finally:
+            os._exit(0)
+    os.close(write)
+    try:
+        return os.read(read, 1) == b"1"
+    finally:
+        os.close(read)
+        os.waitpid(pid, 0)
+
+
+def test_warm_up_persists_targets_in_order():
+    config, port = warm_up(DummyForkConfig, Depends(LoaderEnvironment[int](key="DUMMY_FORK_PORT", default_value=80)))
+
+    assert config is Load(DummyForkConfig, persist=True)
+    assert port == 80
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_share_or_recreate_instances():
+    (config,) = warm_up(DummyForkConfig)
+    (client,) = warm_up(DummyForkClient, fork_policy=ForkPolicy.RECREATE)
+
+    assert in_child(lambda: Load(DummyForkConfig, persist=True) is config)
+    assert in_child(lambda: Load(DummyForkClient, persist=True) is not client)
+    # the parent keeps its instance
+    assert Load(DummyForkClient, persist=True) is client
+
+
+def test_freeze_moves_objects_to_permanent_generation():
+    try:
+        warm_up(DummyForkConfig, freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,160 @@
+import json
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from ab_core.dependency import Depends, inject, sentinel
+from ab_core.dependency.graph import dependency_graph
+from ab_core.dependency.loaders import LoaderEnvironment, ObjectLoaderEnvironment
+from ab_core.dependency.schema import DependencyKind
+
+
+class DummyGraphConfig(BaseModel):
+    issuer: str = "https://issuer"
+
+
+class DummyGraphDatabase(BaseModel):
+    host: str = "db"
+
+
+port_loader = LoaderEnvironment[int](key="DUMMY_GRAPH_PORT")
+
+
+def provide_session(
+    database: Annotated[DummyGraphDatabase, Depends(ObjectLoaderEnvironment[DummyGraphDatabase](), persist=True)],
+):
+    yield database
+
+
+def provide_user_repository(
+    session: Annotated[object, Depends(provide_session)],
+    config: Annotated[DummyGraphConfig, Depends(DummyGraphConfig, persist=True)],
+):
+    return (session, config)
+
+
+@inject
+def login(
+    users: Annotated[object, Depends(provide_user_repository)] = sentinel(),
+    session: Annotated[object, Depends(provide_session)] = sentinel(),
+    port: Annotated[int, Depends(port_loader)] = sentinel(),
+    username: str = "",
+):
+    return users, session, port
+
+
+def test_graph_follows_nested_providers():
+    graph = dependency_graph(login)
+
+    assert graph.roots == ["login"]
+    assert {node.id: node.kind for node in graph.nodes.values()} == {
+        "login": DependencyKind.FUNCTION,
+        "provide_user_repository": DependencyKind.FUNCTION,
+        "provide_session": DependencyKind.FUNCTION,
+        "LoaderEnvironment[int]": DependencyKind.LOADER,
+        "DummyGraphConfig": DependencyKind.LOADER,
+        "ObjectLoaderEnvironment[DummyGraphDatabase]": DependencyKind.LOADER,
+    }
+    assert {(edge.dependent, edge.dependency, edge.parameter, edge.persist) for edge in graph.edges} == {
+        ("login", "provide_user_repository", "users", False),
+        ("login", "provide_session", "session", False),
+        ("login", "LoaderEnvironment[int]", "port", False),
+        ("provide_user_repository", "provide_session", "session", False),
+        ("provide_user_repository", "DummyGraphConfig", "config", True),
+        ("provide_session", "ObjectLoaderEnvironment[DummyGraphDatabase]", "database", True),
+    }
+    assert graph.cycles == []
+
+
+def test_graph_records_loader_sources():
+    graph = dependency_graph(login)
+
+    port = graph.nodes["LoaderEnvironment[int]"]
+    assert (port.source, port.key, port.env_prefix) == ("ENVIRONMENT", "DUMMY_GRAPH_PORT", None)
+    config = graph.nodes["DummyGraphConfig"]
+    assert (config.source, config.env_prefix) == ("ENVIRONMENT_OBJECT", "DUMMY_GRAPH_CONFIG")
+
+
+def test_shared_unpersisted_provider_has_several_dependents():
+    graph = dependency_graph(login)
+
+    assert sorted(edge.dependent for edge in graph.dependents("provide_session")) == [
+        "login",
+        "provide_user_repository",
+    ]
+    assert len(graph.dependencies("login")) == 3
+
+
+def test_injected_class_fields_are_walked():
+    @inject
+    class Handler:
+        users: Annotated[object, Depends(provide_user_repository)]
+        name: str = "handler"
+
+    graph = dependency_graph(Handler)
+
+    assert graph.nodes["test_injected_class_fields_are_walked.<locals>.Handler"].kind is DependencyKind.CLASS
+    assert "provide_session" in graph.nodes
+
+
+def test_cycles_are_detected():
+    def provide_a(b: Annotated[object, Depends(lambda: None)]): ...
+
+    def provide_b(a: Annotated[object, Depends(provide_a)]): ...
+
+    def provide_self(me: Annotated[object, Depends(lambda: None)]): ...
+
+    provide_a.__annotations__["b"] = Annotated[object, Depends(provide_b)]
+    provide_self.__annotations__["me"] = Annotated[object, Depends(provide_self)]
+
+    graph = dependency_graph(provide_a, provide_self)
+
+    a, b, me = provide_a.__qualname__, provide_b.__qualname__, provide_self.__qualname__
+    assert sorted(graph.cycles) == sorted([[a, b, a], [me, me]])
+    assert "color=red" in graph.to_dot()
+
+
+def test_same_named_targets_get_distinct_ids():
+    first = LoaderEnvironment[int](key="DUMMY_GRAPH_FIRST")
+    second = LoaderEnvironment[int](key="DUMMY_GRAPH_SECOND")
+
+    def handler(
+        a: Annotated[int, Depends(first)],
+        b: Annotated[int, Depends(second)],
+        c: Annotated[int, Depends(first)],
+    ): ...
+
+    graph = dependency_graph(handler)
+
+    assert [edge.dependency for edge in graph.edges] == [
+        "LoaderEnvironment[int]",
+        "LoaderEnvironment[int]#2",
+        "LoaderEnvironment[int]",
+    ]
+
+
+def test_exports_dot_and_json():
+    graph = dependency_graph(login)
+
+    dot = graph.to_dot()
+    assert dot.startswith("digraph dependencies {")
+    assert '"provide_user_repository" -> "DummyGraphConfig" [label="config", style=dashed];' in dot
+    assert (
+        '"LoaderEnvironment[int]" [label="LoaderEnvironment[int]\\nENVIRONMENT\\nDUMMY_GRAPH_PORT", shape=box];' in dot
+    )
+
+    document = json.loads(graph.to_json())
+    assert document["roots"] == ["login"]
+    assert {
+        "id": "DummyGraphConfig",
+        "kind": "LOADER",
+        "source": "ENVIRONMENT_OBJECT",
+        "env_prefix": "DUMMY_GRAPH_CONFIG",
+        "key": None,
+    } in document["nodes"]
+    assert {
+        "dependent": "login",
+        "dependency": "provide_session",
+        "parameter": "session",
+        "persist": False,
+    } in document["edges"]
@@ -0,0 +1,276 @@
+import os
+from typing import Annotated
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Depends, Load, aLoad, inject, sentinel
+from ab_core.dependency import hooks as hooks_module
+from ab_core.dependency.hooks import ResolveEvent, ResolveHook, add_hook, registered_hooks, remove_hook
+from ab_core.dependency.loaders.base import AsyncLoaderBase
+from ab_core.dependency.schema import ResolveOutcome, ResolveStage
+from ab_core.dependency.singleton import SingletonRegistryMeta
+
+
+class DummyHookDatabase(BaseModel):
+    host: str
+    port: int = 5432
+
+
+class Recorder(ResolveHook):
+    def __init__(self):
+        self.calls: list[tuple[str, ResolveEvent]] = []
+        self.outcomes: list[ResolveOutcome | None] = []  # the event is completed in place when it ends
+
+    def record(self, call, event):
+        self.calls.append((call, event))
+        self.outcomes.append(event.outcome)
+
+    def on_resolve_start(self, event):
+        self.record("start", event)
+
+    def on_resolve_end(self, event):
+        self.record("end", event)
+
+    def on_cache_hit(self, event):
+        self.record("cache_hit", event)
+
+    def on_teardown(self, event):
+        self.record("teardown", event)
+
+    def summary(self):
+        return [
+            (call, event.stage, event.name, outcome)
+            for (call, event), outcome in zip(self.calls, self.outcomes, strict=True)
+        ]
+
+
+@pytest.fixture(autouse=True)
+def env():
+    SingletonRegistryMeta._instances.clear()
+    with patch.dict(os.environ, {"DUMMY_HOOK_DATABASE_HOST": "db"}):
+        yield
+    SingletonRegistryMeta._instances.clear()
+
+
+@pytest.fixture
+def recorder():
+    hook = add_hook(Recorder())
+    yield hook
+    remove_hook(hook)
+    assert registered_hooks() == ()
+
+
+def test_no_hooks_skips_tracing():
+    with patch.object(hooks_module, "trace", side_effect=AssertionError("traced")):
+        assert Load(DummyHookDatabase) == DummyHookDatabase(host="db")
+
+
+def test_load_reports_resolve_and_nested_load(recorder):
+    Load(DummyHookDatabase)
+
+    assert recorder.summary() == [
+        ("start", ResolveStage.RESOLVE, "DummyHookDatabase", None),
+        ("start", ResolveStage.LOAD, "ObjectLoaderEnvironment[DummyHookDatabase]", None),
+        ("end", ResolveStage.LOAD, "ObjectLoaderEnvironment[DummyHookDatabase]", ResolveOutcome.SUCCESS),
+        ("end", ResolveStage.RESOLVE, "DummyHookDatabase", ResolveOutcome.SUCCESS),
+    ]
+    (_, resolve), (_, load), *_ = recorder.calls
+    assert load.parent is resolve and resolve.parent is None
+    assert resolve.duration >= load.duration > 0
+    assert resolve.persist is False
+
+
+def test_persisted_load_reports_cache_hit(recorder):
+    Load(DummyHookDatabase, persist=True)
+    recorder.calls.clear()
+    recorder.outcomes.clear()
+
+    Load(DummyHookDatabase, persist=True)
+
+    assert recorder.summary() == [
+        ("start", ResolveStage.RESOLVE, "DummyHookDatabase", None),
+        ("cache_hit", ResolveStage.RESOLVE, "DummyHookDatabase", None),
+        ("end", ResolveStage.RESOLVE, "DummyHookDatabase", ResolveOutcome.CACHED),
+    ]
+    assert recorder.calls[0][1].persist is True
+
+
+def test_failed_load_reports_error(recorder):
+    def provide_database():
+        raise ValueError("unreachable")
+
+    with pytest.raises(ValueError):
+        Load(provide_database)
+
+    [_, (_, event)] = recorder.calls
+    assert event.outcome is ResolveOutcome.ERROR
+    assert isinstance(event.error, ValueError)
+
+
+def test_failing_hook_is_logged_not_raised(recorder, caplog):
+    class Broken(ResolveHook):
+        def on_resolve_start(self, event):
+            raise RuntimeError("broken hook")
+
+    broken = add_hook(Broken())
+    try:
+        assert Load(DummyHookDatabase) == DummyHookDatabase(host="db")
+    finally:
+        remove_hook(broken)
+
+    assert "broken hook" in caplog.text
+    assert recorder.calls[-1][1].outcome is ResolveOutcome.SUCCESS
+
+
+def test_generator_dependency_reports_setup_and_teardown(recorder):
+    def provide_session():
+        yield "session"
+
+    @inject
+    def handler(session: Annotated[str, Depends(provide_session)] = sentinel()):
+        return session
+
+    assert handler() == "session"
+
+    name = provide_session.__qualname__
+    assert recorder.summary() == [
+        ("start", ResolveStage.RESOLVE, name, None),
+        ("end", ResolveStage.RESOLVE, name, ResolveOutcome.SUCCESS),
+        ("start", ResolveStage.SETUP, name, None),
+        ("end", ResolveStage.SETUP, name, ResolveOutcome.SUCCESS),
+        ("teardown", ResolveStage.TEARDOWN, name, ResolveOutcome.SUCCESS),
+    ]
+
+
+def test_teardown_reraising_handler_error_succeeds(recorder):
+    def provide_session():
+        try:
+            yield "session"
+        finally:
+            pass
+
+    @inject
+    def handler(session: Annotated[str, Depends(provide_session)] = sentinel()):
+        raise KeyError(session)
+
+    with pytest.raises(KeyError):
+        handler()
+
+    [(_, teardown)] = [call for call in recorder.calls if call[0] == "teardown"]
+    assert teardown.outcome is ResolveOutcome.SUCCESS
+    assert teardown.error is None
+
+
+def test_failing_teardown_reports_error(recorder):
+    def provide_session():
+        yield "session"
+        raise OSError("connection lost")
+
+    @inject
+    def handler(session: Annotated[str, Depends(provide_session)] = sentinel()):
+        return session
+
+    with pytest.raises(OSError):
+        handler()
+
+    [(_, teardown)] = [call for call in recorder.calls if call[0] == "teardown"]
+    assert teardown.outcome is ResolveOutcome.ERROR
+    assert isinstance(teardown.error, OSError)
+
+
+async def test_async_resolve_ends_once_awaited(recorder):
+    async def provide_port():
+        return 8080
+
+    assert await aLoad(provide_port) == 8080
+
+    assert [call for call, _ in recorder.calls] == ["start", "end"]
+    assert recorder.calls[-1][1].outcome is ResolveOutcome.SUCCESS
+
+
+async def test_async_loader_reports_load(recorder):
+    class DummyAsyncHookLoader[T](AsyncLoaderBase[T]):
+        async def load_raw(self):
+            return {"host": "remote"}
+
+    loader = DummyAsyncHookLoader[DummyHookDatabase]()
+
+    assert await aLoad(loader) == DummyHookDatabase(host="remote")
+
+    name = "DummyAsyncHookLoader[DummyHookDatabase]"
+    assert recorder.summary() == [
+        ("start", ResolveStage.RESOLVE, name, None),
+        ("start", ResolveStage.LOAD, name, None),
+        ("end", ResolveStage.LOAD, name, ResolveOutcome.SUCCESS),
+        ("end", ResolveStage.RESOLVE, name, ResolveOutcome.SUCCESS),
+    ]
+    (_, resolve), (_, load), *_ = recorder.calls
+    assert load.parent is resolve
+
+
+async def test_async_generator_dependency_reports_teardown(recorder):
+    closed = []
+
+    async def provide_session():
+        yield "session"
+        closed.append(True)
+
+    @inject
+    async def handler(session: Annotated[str, Depends(provide_session)] = sentinel()):
+        return session
+
+    assert await handler() == "session"
+
+    assert closed == [True]
+    assert [(call, event.stage) for call, event in recorder.calls][-3:] == [
+        ("start", ResolveStage.SETUP),
+        ("end", ResolveStage.SETUP),
+        ("teardown", ResolveStage.TEARDOWN),
+    ]
+
+
+def test_span_emitter_exports_nested_spans():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import StatusCode
+
+    from ab_core.dependency.hooks import SpanEmitter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    def provide_database():
+        raise ValueError("unreachable")
+
+    emitter = add_hook(SpanEmitter(provider.get_tracer("test")))
+    try:
+        Load(DummyHookDatabase)
+        Load(DummyHookDatabase, persist=True)
+        Load(DummyHookDatabase, persist=True)
+        with pytest.raises(ValueError):
+            Load(provide_database)
+    finally:
+        remove_hook(emitter)
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == [
+        "LOAD ObjectLoaderEnvironment[DummyHookDatabase]",
+        "RESOLVE DummyHookDatabase",
+        "RESOLVE DummyHookDatabase",
+        "RESOLVE DummyHookDatabase",
+        f"RESOLVE {provide_database.__qualname__}",
+    ]
+    load, resolve, persisted, cached, failed = spans
+    assert load.parent.span_id == resolve.context.span_id
+    assert resolve.parent is None
+    assert persisted.attributes["dependency.persist"] is True
+    assert persisted.attributes["dependency.outcome"] == "SUCCESS"
+    assert cached.attributes["dependency.outcome"] == "CACHED"
+    assert [event.name for event in cached.events] == ["dependency.cache_hit"]
+    assert failed.status.status_code is StatusCode.ERROR
+    assert [event.name for event in failed.events] == ["exception"]
+    assert emitter._spans == {}
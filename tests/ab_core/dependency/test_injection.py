@@ -9,6 +9,7 @@ New in this revision
 
 import asyncio
 import inspect
+from functools import partial
 from typing import Annotated, Any
 
 import pytest
@@ -478,3 +479,205 @@ def test_sync_gen_loader_with_dep_exception():
         fn()
 
     assert tracker["closed"] == 1 and isinstance(tracker["caught"], ValueError)
+
+
+# ------------------------------------------------------------------ #
+# 13) Resolution plan built at decoration time                       #
+# ------------------------------------------------------------------ #
+
+
+def test_inject_parses_signature_once(monkeypatch):
+    @inject
+    def fn(foo: Annotated[Foo, Depends(Foo)], bar: Annotated[Bar, Depends(Bar)]):
+        return foo.value + bar.value
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature parsed per call")
+
+    monkeypatch.setattr(inspect, "signature", fail)
+    assert fn() == "foobar"
+    assert fn(bar=Bar(value="baz")) == "foobaz"
+
+
+def test_inject_plan_records_dependency_kinds():
+    from ab_core.dependency.injection import injection_plan
+    from ab_core.dependency.loaders import ObjectLoaderEnvironment
+    from ab_core.dependency.schema import DependencyKind
+
+    def provide_name():
+        return "name"
+
+    @inject
+    def fn(
+        name: Annotated[str, Depends(provide_name)],
+        foo: Annotated[Foo, Depends(Foo)],
+        bar: Annotated[Bar, Depends(ObjectLoaderEnvironment[Bar](env_prefix="BAR"))],
+        plain: int = 0,
+    ):
+        return name
+
+    plan = injection_plan(fn)
+    assert [(param.name, param.kind) for param in plan.parameters] == [
+        ("name", DependencyKind.FUNCTION),
+        ("foo", DependencyKind.TYPE),
+        ("bar", DependencyKind.LOADER),
+    ]
+    assert plan.names == {"name", "foo", "bar"}
+
+
+def test_inject_skips_resolution_when_every_dependency_given(monkeypatch):
+    def fail():
+        raise AssertionError("dependency resolved")
+
+    @inject
+    def fn(foo: Annotated[Foo, Depends(fail)], count: int = 1):
+        return foo.value * count
+
+    @inject
+    def gen(foo: Annotated[Foo, Depends(fail)]):
+        yield foo.value
+
+    @inject
+    async def coro(foo: Annotated[Foo, Depends(fail)]):
+        return foo.value
+
+    monkeypatch.setattr(inspect.Signature, "bind_partial", fail)
+    assert fn(foo=Foo(), count=2) == "foofoo"
+    assert list(gen(foo=Foo())) == ["foo"]
+    assert asyncio.run(coro(foo=Foo())) == "foo"
+
+
+def test_depends_resolves_raw_type_loader_once(monkeypatch):
+    from ab_core.dependency import depends as depends_module
+
+    calls = []
+    resolve_target = depends_module._resolve_target
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return resolve_target(*args, **kwargs)
+
+    monkeypatch.setattr(depends_module, "_resolve_target", counting)
+
+    @inject
+    def fn(foo: Annotated[Foo, Depends(Foo)]):
+        return foo
+
+    assert calls == []  # nothing is built when decorating
+    assert fn() == fn() == Foo()
+    assert calls == [Foo]
+
+
+# ------------------------------------------------------------------ #
+# 14) Wrappers generated for the exact signature                     #
+# ------------------------------------------------------------------ #
+
+
+def provide_one():
+    return 1
+
+
+def test_generated_wrapper_maps_every_parameter_kind():
+    @inject
+    def fn(
+        a,
+        /,
+        b,
+        one: Annotated[int, Depends(provide_one)] = sentinel(),
+        *args,
+        c,
+        foo: Annotated[Foo, Depends(Foo)] = sentinel(),
+        d=4,
+        **kw,
+    ):
+        return a, b, one, args, c, foo.value, d, kw
+
+    assert fn.__code__.co_filename == f"<inject {fn.__qualname__}>"
+    assert fn(1, 2, c=3) == (1, 2, 1, (), 3, "foo", 4, {})
+    assert fn(1, 2, 5, 6, c=3, foo=Foo(value="x"), e=7) == (1, 2, 5, (6,), 3, "x", 4, {"e": 7})
+    with pytest.raises(TypeError):
+        fn(1, c=3)
+
+
+async def test_generated_coroutine_wrapper_resolves_missing_dependencies():
+    closed = []
+
+    def provide_session():
+        yield "session"
+        closed.append(True)
+
+    @inject
+    async def fn(one: Annotated[int, Depends(provide_one)], session: Annotated[str, Depends(provide_session)]):
+        assert not closed
+        return one, session
+
+    assert fn.__code__.co_filename == f"<inject {fn.__qualname__}>"
+    assert await fn(one=2) == (2, "session")
+    assert closed == [True]
+
+
+def test_generated_wrapper_tears_down_when_a_later_dependency_fails():
+    closed = []
+
+    def provide_session():
+        try:
+            yield "session"
+        finally:
+            closed.append(True)
+
+    def fail():
+        raise ValueError("unavailable")
+
+    @inject
+    def fn(session: Annotated[str, Depends(provide_session)], broken: Annotated[str, Depends(fail)]):
+        return session
+
+    with pytest.raises(ValueError):
+        fn()
+    assert closed == [True]
+
+
+def test_signature_the_wrapper_cannot_mirror_falls_back():
+    @inject
+    def fn(one: Annotated[int, Depends(provide_one)], required):
+        return one, required
+
+    assert fn.__code__.co_filename != f"<inject {fn.__qualname__}>"
+    assert fn(required=2) == (1, 2)
+
+
+def test_partials_and_callable_instances_use_the_generic_wrapper():
+    def fn(a, one: Annotated[int, Depends(provide_one)] = sentinel()):
+        return a, one
+
+    class Handler:
+        def __call__(self, one: Annotated[int, Depends(provide_one)] = sentinel()):
+            return one
+
+    assert inject(partial(fn, 1))() == (1, 1)
+    assert inject()(Handler())() == 1
+
+
+async def test_async_generator_skips_resolution_when_every_dependency_given(monkeypatch):
+    def fail():
+        raise AssertionError("dependency resolved")
+
+    @inject
+    async def agen(foo: Annotated[Foo, Depends(fail)]):
+        yield foo.value
+
+    monkeypatch.setattr(inspect.Signature, "bind_partial", fail)
+    assert [item async for item in agen(foo=Foo())] == ["foo"]
+
+
+async def test_generated_wrapper_parameters_may_shadow_builtins():
+    @inject
+    async def handler(next: str, iter: str, one: Annotated[int, Depends(provide_one)] = sentinel()):  # noqa: A002
+        return next, iter, one
+
+    @inject
+    def sync_handler(next: str, one: Annotated[int, Depends(provide_one)] = sentinel()):  # noqa: A002
+        return next, one
+
+    assert await handler("n", "i") == ("n", "i", 1)
+    assert sync_handler("n") == ("n", 1)
@@ -152,3 +152,21 @@ def test_fastapi_async_context_dependency_error(client_and_trackers):
     with pytest.raises(RuntimeError):
         client.post("/items/context/async/error", json={"name": "TestName"})
     assert async_t["closed"] == 1 and isinstance(async_t["caught"], RuntimeError)
+
+
+def test_fastapi_awaits_async_loader_dependency():
+    from ab_core.dependency.loaders.base import AsyncLoaderBase
+
+    class StaticAsyncLoader[T](AsyncLoaderBase[T]):
+        async def load_raw(self):
+            return {"value": "loaded"}
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(dependency: Annotated[SomeDependency, Depends(StaticAsyncLoader[SomeDependency]())]):
+        return {"dependency_value": dependency.value}
+
+    resp = TestClient(app).get("/")
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"dependency_value": "loaded"}
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import ab_core.dependency",
+        "from ab_core.dependency import Load",
+    ],
+)
+def test_import_defers_fastapi_attrs_and_default_loader(statement):
+    modules = _imported_modules(statement)
+
+    assert "fastapi" not in modules
+    assert "attrs" not in modules
+    assert "opentelemetry" not in modules
+    assert "ab_core.dependency.default" not in modules
+
+
+def test_depends_is_created_on_first_access():
+    from ab_core.dependency import depends
+
+    assert depends.Depends is depends.Depends
+    assert issubclass(depends.Depends, depends.DependsBase)
@@ -0,0 +1,74 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Depends, Load, LoadMany
+from ab_core.dependency.loaders import LoaderEnvironment, ObjectLoaderEnvironment
+from ab_core.dependency.singleton import SingletonRegistryMeta
+
+
+class DummyManyDatabase(BaseModel):
+    host: str
+    port: int = 5432
+
+
+class DummyManyCache(BaseModel):
+    url: str
+
+
+@pytest.fixture(autouse=True)
+def clear_singleton_registry_between_tests():
+    SingletonRegistryMeta._instances.clear()
+    yield
+    SingletonRegistryMeta._instances.clear()
+
+
+@pytest.fixture
+def env_patch():
+    with patch.dict(
+        os.environ,
+        {
+            "DUMMY_MANY_DATABASE_HOST": "db",
+            "DUMMY_MANY_CACHE_URL": "redis://cache",
+            "DUMMY_MANY_PORT": "8080",
+        },
+        clear=False,
+    ):
+        yield
+
+
+def test_load_many_returns_results_in_target_order(env_patch):
+    database, cache, port = LoadMany(
+        DummyManyDatabase,
+        ObjectLoaderEnvironment[DummyManyCache](),
+        LoaderEnvironment[int](key="DUMMY_MANY_PORT"),
+    )
+
+    assert database == DummyManyDatabase(host="db")
+    assert cache == DummyManyCache(url="redis://cache")
+    assert port == 8080
+
+
+def test_load_many_persist_per_target(env_patch):
+    persisted, transient = LoadMany(
+        Depends(DummyManyDatabase, persist=True),
+        DummyManyCache,
+    )
+
+    assert persisted is Load(DummyManyDatabase, persist=True)
+    assert transient is not Load(DummyManyCache, persist=True)
+
+
+def test_load_many_default_persist(env_patch):
+    first = LoadMany(DummyManyDatabase, DummyManyCache, persist=True)
+    second = LoadMany(DummyManyDatabase, DummyManyCache, persist=True)
+
+    assert all(one is two for one, two in zip(first, second, strict=True))
+
+
+def test_load_many_supports_callables():
+    (value,) = LoadMany(lambda: "value")
+
+    assert value == "value"
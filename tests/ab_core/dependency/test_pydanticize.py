@@ -1,10 +1,11 @@
+from copy import deepcopy
 from typing import Annotated, Literal, Optional
 
 import pytest
 from deepdiff import DeepDiff
 from pydantic import BaseModel, Discriminator, TypeAdapter
 
-from ab_core.dependency.pydanticize import pydanticize_data
+from ab_core.dependency.pydanticize import cached_reshaper, compile_reshaper, pydanticize_data
 
 
 # 1) define our union types
@@ -211,3 +212,65 @@ def test_flatten_discriminator_all_cases(before, core_schema, after):
     got = pydanticize_data(before, core_schema)
     diff = DeepDiff(got, after, ignore_order=True)
     assert diff == {}
+
+
+def test_pydanticize_data_not_inplace_leaves_input_untouched():
+    before = {
+        "group": {
+            "char": {"letter": "A", "a": {"extra": "blah"}},
+            "digit": {"number": "1", "1": {"extra": "blah"}},
+            "extra": "blah",
+        },
+        "extra": "blah",
+    }
+    original = deepcopy(before)
+
+    got = pydanticize_data(before, TypeAdapter(GroupHierarchy).core_schema, inplace=False)
+
+    assert before == original
+    assert got == {
+        "group": {
+            "char": {"letter": "A", "extra": "blah"},
+            "digit": {"number": "1", "extra": "blah"},
+            "extra": "blah",
+        },
+        "extra": "blah",
+    }
+
+
+def test_pydanticize_data_not_inplace_copies_nested_fields_on_write():
+    before = {"some": {"field": "hello", "other": "kept"}, "another": {"value": 42}}
+    original = deepcopy(before)
+
+    got = pydanticize_data(before, TypeAdapter(WithUnderscore).core_schema, inplace=False)
+
+    assert before == original
+    assert got == {"some": {"other": "kept"}, "some_field": "hello", "another_value": 42}
+
+
+def test_reshaper_is_compiled_once_per_schema():
+    core_schema = TypeAdapter(GroupHierarchy).core_schema
+
+    assert cached_reshaper(core_schema) is cached_reshaper(core_schema)
+    assert cached_reshaper(core_schema) is not cached_reshaper(core_schema, inplace=False)
+
+
+def test_reshaper_resolves_external_definitions():
+    core_schema = TypeAdapter(ABCHierarchy).core_schema
+    definitions = {definition["ref"]: definition for definition in core_schema["definitions"]}
+    child_schema = core_schema["schema"]
+
+    reshape = compile_reshaper(child_schema, definitions=definitions)
+
+    assert reshape({"char": {"letter": "A", "a": {"extra": "blah"}}, "extra": "blah"}) == {
+        "char": {"letter": "A", "extra": "blah"},
+        "extra": "blah",
+    }
+
+
+def test_unresolved_definition_fails_only_when_reached():
+    reshape = compile_reshaper({"type": "list", "items_schema": {"type": "definition-ref", "schema_ref": "Missing"}})
+
+    assert reshape([]) == []
+    with pytest.raises(KeyError, match="Missing"):
+        reshape([{}])
@@ -0,0 +1,151 @@
+import os
+import signal
+import threading
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ab_core.dependency import Load, reload
+from ab_core.dependency.files import FILE_CACHE
+from ab_core.dependency.loaders import LoaderEnvironment, ObjectLoaderSecrets
+from ab_core.dependency.reload import Reloader
+from ab_core.dependency.singleton import SingletonRegistryMeta
+
+
+class DummyReloadClient(BaseModel):
+    client_id: str
+    client_secret: str
+
+
+class DummyReloadDatabase(BaseModel):
+    host: str
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    SingletonRegistryMeta._instances.clear()
+    SingletonRegistryMeta._reload_sources.clear()
+    FILE_CACHE.invalidate()
+    yield
+    SingletonRegistryMeta._instances.clear()
+    SingletonRegistryMeta._reload_sources.clear()
+    FILE_CACHE.invalidate()
+
+
+@pytest.fixture
+def env():
+    with patch.dict(
+        os.environ,
+        {
+            "DUMMY_RELOAD_CLIENT_CLIENT_ID": "id",
+            "DUMMY_RELOAD_CLIENT_CLIENT_SECRET": "old",
+            "DUMMY_RELOAD_DATABASE_HOST": "db",
+        },
+    ):
+        yield
+
+
+def test_reload_rebuilds_only_changed_dependencies(env):
+    client = Load(DummyReloadClient, persist=True)
+    database = Load(DummyReloadDatabase, persist=True)
+
+    os.environ["DUMMY_RELOAD_CLIENT_CLIENT_SECRET"] = "rotated"
+    changed = reload()
+
+    assert changed == {DummyReloadClient: {"root['client_secret']"}}
+    assert Load(DummyReloadClient, persist=True).client_secret == "rotated"
+    assert Load(DummyReloadClient, persist=True) is not client
+    assert Load(DummyReloadDatabase, persist=True) is database
+    # instances already handed out are untouched
+    assert client.client_secret == "old"
+
+
+def test_reload_without_changes_keeps_instances(env):
+    client = Load(DummyReloadClient, persist=True)
+
+    assert reload() == {}
+    assert Load(DummyReloadClient, persist=True) is client
+
+
+def test_invalid_reload_keeps_current_instance(env):
+    port = Load(LoaderEnvironment[int](key="DUMMY_RELOAD_PORT", default_value=80), persist=True)
+
+    os.environ["DUMMY_RELOAD_PORT"] = "not-a-number"
+    assert reload() == {}
+
+    assert Load(LoaderEnvironment[int](key="DUMMY_RELOAD_PORT"), persist=True) == port
+
+
+def test_function_dependencies_are_not_reloaded():
+    calls = []
+
+    def provide():
+        calls.append(1)
+        return object()
+
+    Load(provide, persist=True)
+    reload()
+
+    assert calls == [1]
+
+
+def test_cleared_registry_is_not_repopulated(env):
+    Load(DummyReloadClient, persist=True)
+    SingletonRegistryMeta._instances.clear()
+
+    os.environ["DUMMY_RELOAD_CLIENT_CLIENT_SECRET"] = "rotated"
+
+    assert reload() == {}
+    assert SingletonRegistryMeta._instances == {}
+
+
+def test_signal_triggers_reload():
+    reloaded = threading.Event()
+    reloader = Reloader(reload=reloaded.set).on_signal(signal.SIGUSR1)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert reloaded.wait(timeout=5)
+    finally:
+        reloader.stop()
+
+    assert signal.getsignal(signal.SIGUSR1) is signal.SIG_DFL
+
+
+def test_signal_defaults_to_sighup():
+    reloader = Reloader(reload=lambda: None)
+    with patch.object(signal, "signal") as set_handler:
+        reloader.on_signal()
+
+    assert set_handler.call_args.args[0] == signal.SIGHUP
+
+
+def test_signal_without_sighup_needs_one_passed():
+    with patch.object(signal, "SIGHUP", create=True), patch.object(signal, "signal") as set_handler:
+        del signal.SIGHUP
+        with pytest.raises(ValueError, match="SIGHUP is not available"):
+            Reloader(reload=lambda: None).on_signal()
+
+    set_handler.assert_not_called()
+
+
+def test_watched_secret_change_reloads(tmp_path):
+    (tmp_path / "client_id").write_text("id")
+    (tmp_path / "client_secret").write_text("old")
+    loader = ObjectLoaderSecrets[DummyReloadClient](secrets_dir=str(tmp_path))
+    Load(loader, persist=True)
+
+    reloaded = threading.Event()
+    reloader = Reloader(reload=lambda: reloaded.set() if reload() else None).watch(tmp_path, interval=0.01)
+    try:
+        # replace the file, as secret mounts do, so the directory changes too
+        (tmp_path / "client_secret.new").write_text("rotated")
+        os.replace(tmp_path / "client_secret.new", tmp_path / "client_secret")
+        # bump the mtime explicitly, so changes within one timestamp tick are still observed
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert reloaded.wait(timeout=5)
+    finally:
+        reloader.stop()
+
+    assert Load(loader, persist=True).client_secret == "rotated"
@@ -0,0 +1,169 @@
+import json
+import os
+import stat
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, SecretStr
+
+from ab_core.dependency import Load
+from ab_core.dependency.loaders import LoaderEnvironment, ObjectLoaderEnvironment
+from ab_core.dependency.singleton import SingletonRegistryMeta
+from ab_core.dependency.snapshot import Snapshot, active_snapshot
+from ab_core.dependency.stats import cache_stats, reset_cache_stats
+
+
+class DummySnapshotDatabase(BaseModel):
+    host: str
+    port: int = 5432
+    created: datetime | None = None
+
+
+@pytest.fixture(autouse=True)
+def env():
+    SingletonRegistryMeta._instances.clear()
+    with patch.dict(os.environ, {"DUMMY_SNAPSHOT_DATABASE_HOST": "db", "DUMMY_SNAPSHOT_DATABASE_PORT": "6543"}):
+        yield
+    SingletonRegistryMeta._instances.clear()
+
+
+def start(path, target=DummySnapshotDatabase):
+    with Snapshot(path) as snapshot:
+        value = Load(target)
+    return snapshot, value
+
+
+def test_snapshot_is_written_after_successful_start(tmp_path):
+    path = tmp_path / "snapshot.json"
+
+    snapshot, database = start(path)
+
+    assert (snapshot.hits, snapshot.misses) == (0, 1)
+    assert database == DummySnapshotDatabase(host="db", port=6543)
+    [entry] = json.loads(path.read_text())["entries"].values()
+    assert json.loads(entry["json"]) == {"host": "db", "port": 6543, "created": None}
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert active_snapshot() is None
+
+
+def test_unchanged_environment_loads_from_snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+    start(path)
+
+    with patch.object(ObjectLoaderEnvironment, "restructure") as restructure:
+        snapshot, database = start(path)
+
+    restructure.assert_not_called()
+    assert (snapshot.hits, snapshot.misses) == (1, 0)
+    assert database == DummySnapshotDatabase(host="db", port=6543)
+
+
+def test_snapshot_hit_validates_stored_json_with_cached_validator(tmp_path):
+    path = tmp_path / "snapshot.json"
+    loader = ObjectLoaderEnvironment[DummySnapshotDatabase]()
+    start(path, loader)
+    reset_cache_stats()
+
+    adapter = type(loader.type_adaptor)
+    with (
+        patch.object(adapter, "__init__", side_effect=AssertionError("TypeAdapter built")),
+        patch.object(adapter, "validate_python", side_effect=AssertionError("validated in Python")),
+        patch.object(adapter, "validate_json", wraps=loader.type_adaptor.validate_json) as validate_json,
+    ):
+        snapshot, database = start(path, loader)
+
+    assert snapshot.hits == 1
+    assert database == DummySnapshotDatabase(host="db", port=6543)
+    validate_json.assert_called_once()
+    assert cache_stats()["type_adapters"].misses == 0
+
+
+class DummySnapshotCredentials(BaseModel):
+    client_id: str
+    client_secret: SecretStr
+    previous_secrets: list[SecretStr] = []
+
+
+def test_snapshot_hit_keeps_secret_values(tmp_path):
+    path = tmp_path / "snapshot.json"
+    variables = {
+        "DUMMY_SNAPSHOT_CREDENTIALS_CLIENT_ID": "app",
+        "DUMMY_SNAPSHOT_CREDENTIALS_CLIENT_SECRET": "hunter2",
+        "DUMMY_SNAPSHOT_CREDENTIALS_PREVIOUS_SECRETS": '["hunter1"]',
+    }
+
+    with patch.dict(os.environ, variables):
+        _, first = start(path, DummySnapshotCredentials)
+        snapshot, second = start(path, DummySnapshotCredentials)
+
+    assert snapshot.hits == 1
+    assert second.client_secret.get_secret_value() == first.client_secret.get_secret_value() == "hunter2"
+    assert [secret.get_secret_value() for secret in second.previous_secrets] == ["hunter1"]
+
+
+def test_trusted_loader_skips_validation_of_snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+    del os.environ["DUMMY_SNAPSHOT_DATABASE_PORT"]  # trusted data is not coerced
+    loader = ObjectLoaderEnvironment[DummySnapshotDatabase](trust=True, trust_validation_rate=0)
+    start(path, loader)
+
+    with patch.object(type(loader.type_adaptor), "validate_python") as validate:
+        snapshot, database = start(path, loader)
+
+    validate.assert_not_called()
+    assert snapshot.hits == 1
+    assert database.host == "db"
+
+
+def test_changed_environment_is_rebuilt(tmp_path):
+    path = tmp_path / "snapshot.json"
+    start(path)
+
+    os.environ["DUMMY_SNAPSHOT_DATABASE_PORT"] = "7000"
+    snapshot, database = start(path)
+
+    assert (snapshot.hits, snapshot.misses) == (0, 1)
+    assert database.port == 7000
+
+
+def test_loaders_of_one_type_are_kept_apart(tmp_path):
+    path = tmp_path / "snapshot.json"
+
+    with patch.dict(os.environ, {"DUMMY_SNAPSHOT_PORT": "1", "DUMMY_SNAPSHOT_OTHER_PORT": "1"}):
+        with Snapshot(path):
+            Load(LoaderEnvironment[int](key="DUMMY_SNAPSHOT_PORT"))
+            Load(LoaderEnvironment[int](key="DUMMY_SNAPSHOT_OTHER_PORT"))
+
+    assert len(json.loads(path.read_text())["entries"]) == 2
+
+
+def test_snapshot_key_leaves_out_request_headers():
+    from ab_core.dependency.loaders.http import LoaderHttp
+
+    loader = LoaderHttp[DummySnapshotDatabase](url="https://config/db", headers={"Authorization": "Bearer s3cret"})
+    other = LoaderHttp[DummySnapshotDatabase](url="https://config/replica", headers={"Authorization": "Bearer s3cret"})
+
+    assert "s3cret" not in loader.snapshot_key
+    assert "https://config/db" in loader.snapshot_key
+    assert loader.snapshot_key != other.snapshot_key
+
+
+def test_failed_start_does_not_write_snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+
+    with pytest.raises(RuntimeError), Snapshot(path):
+        Load(DummySnapshotDatabase)
+        raise RuntimeError("start failed")
+
+    assert not path.exists()
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text("not json")
+
+    snapshot, database = start(path)
+
+    assert snapshot.misses == 1
+    assert database.host == "db"
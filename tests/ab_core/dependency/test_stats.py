@@ -0,0 +1,83 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from ab_core.dependency import Load, aLoad
+from ab_core.dependency.pydanticize import cached_type_adapter
+from ab_core.dependency.singleton import SingletonRegistryMeta
+from ab_core.dependency.stats import cache_stats, reset_cache_stats
+
+
+class DummyStatsConfig(BaseModel):
+    host: str
+
+
+@pytest.fixture(autouse=True)
+def env():
+    SingletonRegistryMeta._instances.clear()
+    reset_cache_stats()
+    with patch.dict(os.environ, {"DUMMY_STATS_CONFIG_HOST": "db"}):
+        yield
+    SingletonRegistryMeta._instances.clear()
+
+
+def test_every_cache_is_listed():
+    assert set(cache_stats()) == {
+        "singletons",
+        "type_adapters",
+        "pydanticized_types",
+        "default_loaders",
+        "trusted_constructors",
+        "env_plans",
+    }
+
+
+def test_persisted_instances_count_hits_and_misses():
+    Load(DummyStatsConfig, persist=True)
+    Load(DummyStatsConfig, persist=True)
+    Load(DummyStatsConfig, persist=True)
+
+    stats = cache_stats()["singletons"]
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+    assert stats.misses_by_target == {"DummyStatsConfig": 1}
+    assert stats.build_time > 0
+
+
+async def test_awaited_persisted_instances_are_counted():
+    async def provide_port():
+        return 8080
+
+    await aLoad(provide_port, persist=True)
+    await aLoad(provide_port, persist=True)
+
+    stats = cache_stats()["singletons"]
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.misses_by_target == {provide_port.__qualname__: 1}
+
+
+def test_recreated_types_show_repeated_misses():
+    for _ in range(3):
+        cached_type_adapter(create_model("DummyStatsGenerated", host=(str, ...)))
+    cached_type_adapter(DummyStatsConfig)
+    cached_type_adapter(DummyStatsConfig)
+
+    stats = cache_stats()["type_adapters"]
+    assert stats.misses_by_target["DummyStatsGenerated"] == 3
+    assert stats.misses_by_target["DummyStatsConfig"] <= 1  # may be cached by an earlier test
+    assert stats.hits >= 1
+
+
+def test_reset_keeps_entries():
+    Load(DummyStatsConfig, persist=True)
+    Load(DummyStatsConfig, persist=True)
+    before = cache_stats()
+
+    reset_cache_stats()
+
+    after = cache_stats()
+    for name, stats in after.items():
+        assert (stats.hits, stats.misses, stats.build_time) == (0, 0, 0.0), name
+        assert stats.misses_by_target == {}
+        assert stats.entries == before[name].entries
@@ -0,0 +1,166 @@
+import logging
+from typing import Annotated, Any, Literal
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, Discriminator, PrivateAttr, RootModel, field_validator
+
+from ab_core.dependency.loaders.base import LoaderBase
+from ab_core.dependency.pydanticize import compile_trusted_constructor
+from ab_core.dependency.pydanticize.cast.helpers import cached_type_adapter
+from ab_core.dependency.trust import wait_for_validation
+
+
+class DummyTrustStoreA(BaseModel):
+    type: Literal["A"] = "A"
+    path: str
+
+
+class DummyTrustStoreB(BaseModel):
+    type: Literal["B"] = "B"
+    url: str
+
+
+DummyTrustStore = Annotated[DummyTrustStoreA | DummyTrustStoreB, Discriminator("type")]
+
+
+class DummyTrustNode(BaseModel):
+    name: str
+    children: list["DummyTrustNode"] = []
+
+
+class DummyTrustTenant(BaseModel):
+    name: str
+    port: int = 80
+    store: DummyTrustStore
+    fallback: DummyTrustStoreA | None = None
+    nodes: dict[str, DummyTrustNode] = {}
+
+    @field_validator("name")
+    @classmethod
+    def name_is_lower(cls, value: str) -> str:
+        return value.lower()
+
+
+class DummyTrustLoader[T](LoaderBase[T]):
+    data: Any = None
+
+    def load_raw(self):
+        return self.data
+
+
+TENANT = {
+    "name": "Tenant",
+    "store": {"type": "B", "url": "https://store"},
+    "fallback": {"path": "/tmp"},
+    "nodes": {"root": {"name": "root", "children": [{"name": "leaf"}]}},
+}
+
+
+def test_trusted_load_builds_nested_models_without_validation():
+    tenant = DummyTrustLoader[DummyTrustTenant](data=TENANT, trust=True, trust_validation_rate=0).load()
+
+    assert isinstance(tenant, DummyTrustTenant)
+    assert tenant.name == "Tenant"  # validators are skipped
+    assert tenant.port == 80  # defaults are applied
+    assert tenant.store == DummyTrustStoreB(url="https://store")
+    assert tenant.fallback == DummyTrustStoreA(path="/tmp")
+    assert tenant.nodes["root"].children[0] == DummyTrustNode(name="leaf")
+
+
+def test_trusted_load_matches_validated_load_for_valid_data():
+    trusted = DummyTrustLoader[DummyTrustTenant](data=TENANT, trust=True, trust_validation_rate=0).load()
+    validated = DummyTrustLoader[DummyTrustTenant](data=TENANT).load()
+
+    assert trusted.model_dump() == validated.model_dump() | {"name": "Tenant"}
+
+
+def test_trusted_load_skips_type_adaptor():
+    loader = DummyTrustLoader[DummyTrustTenant](data=TENANT, trust=True, trust_validation_rate=0)
+
+    with patch.object(type(loader.type_adaptor), "validate_python") as validate:
+        loader.load()
+
+    validate.assert_not_called()
+
+
+def test_sampled_validation_logs_drift(caplog):
+    drifted = TENANT | {"port": "not-a-port"}
+    loader = DummyTrustLoader[DummyTrustTenant](data=drifted, trust=True, trust_validation_rate=1)
+
+    with caplog.at_level(logging.WARNING, logger="ab_core.dependency.trust"):
+        tenant = loader.load()
+        wait_for_validation()
+
+    assert tenant.port == "not-a-port"
+    assert "failed validation" in caplog.text
+    assert "port (int_parsing)" in caplog.text
+
+
+def test_drift_warning_leaves_out_input_values(caplog):
+    drifted = TENANT | {"port": "s3cret-token"}
+    loader = DummyTrustLoader[DummyTrustTenant](data=drifted, trust=True, trust_validation_rate=1)
+
+    with caplog.at_level(logging.WARNING, logger="ab_core.dependency.trust"):
+        loader.load()
+        wait_for_validation()
+
+    assert "failed validation" in caplog.text
+    assert "s3cret-token" not in caplog.text
+
+
+def test_valid_trusted_data_is_not_reported(caplog):
+    loader = DummyTrustLoader[DummyTrustTenant](data=TENANT, trust=True, trust_validation_rate=1)
+
+    with caplog.at_level(logging.WARNING, logger="ab_core.dependency.trust"):
+        loader.load()
+        wait_for_validation()
+
+    assert caplog.text == ""
+
+
+def test_trusted_defaults_are_not_shared():
+    construct = compile_trusted_constructor(cached_type_adapter(DummyTrustNode).core_schema)
+
+    first, second = construct({"name": "a"}), construct({"name": "b"})
+    first.children.append(second)
+
+    assert second.children == []
+    assert first.model_fields_set == {"name"}
+
+
+class DummyTrustPrivate(BaseModel):
+    name: str
+    _token: str = PrivateAttr(default="secret")
+
+
+def test_trusted_model_with_private_attributes():
+    construct = compile_trusted_constructor(cached_type_adapter(DummyTrustPrivate).core_schema)
+
+    assert construct({"name": "a"})._token == "secret"
+
+
+@pytest.mark.parametrize(
+    "type_, data, expected",
+    [
+        (list[DummyTrustStoreA], [{"path": "a"}], [DummyTrustStoreA(path="a")]),
+        (RootModel[list[int]], [1, 2], RootModel[list[int]]([1, 2])),
+        (DummyTrustStore, {"type": "A", "path": "a"}, DummyTrustStoreA(path="a")),
+        (DummyTrustStore, {"type": "C"}, {"type": "C"}),
+        (int, 1, 1),
+    ],
+)
+def test_compile_trusted_constructor(type_, data, expected):
+    construct = compile_trusted_constructor(cached_type_adapter(type_).core_schema)
+
+    assert construct(data) == expected
+
+
+def test_trusted_model_missing_required_field_matches_model_construct():
+    construct = compile_trusted_constructor(cached_type_adapter(DummyTrustTenant).core_schema)
+
+    tenant = construct({"store": {"type": "A", "path": "/tmp"}})
+
+    expected = DummyTrustTenant.model_construct(store=DummyTrustStoreA(path="/tmp"))
+    assert tenant.__dict__ == expected.__dict__
+    assert "name" not in tenant.__dict__
@@ -1,7 +1,9 @@
+import random
+
 import pytest
 from pydantic import BaseModel
 
-from ab_core.dependency.utils import to_env_prefix, type_name_intersection
+from ab_core.dependency.utils import extract_env_items, str_intersection, to_env_prefix, type_name_intersection
 
 
 class DummyStoreA(BaseModel): ...
@@ -71,3 +73,34 @@ def test_type_name_intersection(types, expected_prefix):
 )
 def test_to_env_prefix(input_name, expected):
     assert to_env_prefix(input_name) == expected
+
+
+def test_extract_env_items():
+    env = {"APP_CONFIG_DATABASE_HOST": "localhost", "APP_CONFIG_PORT": "8080", "OTHER_PORT": "1"}
+    assert extract_env_items(env, "APP_CONFIG") == {"database_host": "localhost", "port": "8080"}
+
+
+def test_extract_env_items_rejects_value_and_object_collision():
+    env = {"APP_CONFIG_HOSTS": "[]", "APP_CONFIG_HOSTS_0": "a"}
+    with pytest.raises(ValueError, match="Environment variable collision"):
+        extract_env_items(env, "APP_CONFIG")
+
+
+def naive_str_intersection(*args: str) -> str:
+    if not args:
+        return ""
+    shortest = min(args, key=len)
+    for length in range(len(shortest), 0, -1):
+        for start in range(len(shortest) - length + 1):
+            candidate = shortest[start : start + length]
+            if all(candidate in other for other in args):
+                return candidate
+    return ""
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_str_intersection_matches_naive_search(seed):
+    rng = random.Random(seed)
+    names = tuple("".join(rng.choice("ab") for _ in range(rng.randint(0, 12))) for _ in range(rng.randint(1, 4)))
+
+    assert str_intersection(*names) == naive_str_intersection(*names)